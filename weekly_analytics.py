@@ -0,0 +1,255 @@
+# weekly_analytics.py
+# Python 3.10+
+# Optional: numpy (ohne numpy wird in reinem Python aggregiert)
+#
+# Kohorten-Auswertungen fuer den Weeklies-Manager; die Auswertung selbst laeuft ohne Qt.
+# Aufruf: python weekly_analytics.py weeklies.json (auch .json.gz/.json.xz und Altformate)
+
+import argparse
+import json
+import sys
+from collections import Counter
+from datetime import date
+
+# numpy wird erst bei der ersten Auswertung importiert, damit das Laden des
+# Moduls (z. B. beim Start der Oberflaeche) nichts kostet.
+_numpy = False
+
+
+def numpy_backend():
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+# Ein Projekt gilt als im Verzug, wenn die TODO-Quote so viele Prozentpunkte
+# hinter dem zeitlichen Fortschritt liegt.
+BEHIND_MARGIN = 20
+
+
+def iso_ordinal(value) -> int:
+    try:
+        return date.fromisoformat(str(value)).toordinal()
+    except ValueError:
+        return 0
+
+
+def project_time_progress(start: int, end: int, today: int) -> int | None:
+    # Gleiche Rechnung wie der Fortschrittsbalken im Projekteditor; beliebige
+    # Tageszaehlung (Ordinal, Julianischer Tag), 0 = ungueltig.
+    if not start or not end or end < start:
+        return None
+    if today <= start:
+        return 0
+    if today >= end:
+        return 100
+    return max(0, min(100, int((today - start) / max(1, end - start) * 100)))
+
+
+def _monday(ordinal: int) -> int:
+    # date.fromordinal(1) ist ein Montag.
+    return ordinal - (ordinal - 1) % 7
+
+
+class DatasetColumns:
+    # Spaltenweise Sicht auf die Daten: je Weekly bzw. Projekt ein Eintrag pro Spalte.
+    def __init__(self, data: dict):
+        np = self.np = numpy_backend()
+        self.students = list(data.get("students", {}).keys())
+        self.project_names = []
+        w_student, w_day, w_done, w_planned = [], [], [], []
+        p_student, p_start, p_end, p_todos, p_checked = [], [], [], [], []
+
+        for code, name in enumerate(self.students):
+            for project in data["students"][name].get("projects", []):
+                self.project_names.append(str(project.get("name", "")))
+                todos = project.get("project_todos", [])
+                p_student.append(code)
+                p_start.append(iso_ordinal(project.get("start_date", "")))
+                p_end.append(iso_ordinal(project.get("end_date", "")))
+                p_todos.append(len(todos))
+                p_checked.append(sum(1 for todo in todos if todo.get("checked")))
+                for weekly in project.get("weeklies", []):
+                    day = iso_ordinal(weekly.get("date", ""))
+                    if not day:
+                        continue
+                    w_student.append(code)
+                    w_day.append(day)
+                    w_done.append(len(str(weekly.get("done", ""))))
+                    w_planned.append(len(str(weekly.get("planned", ""))))
+
+        columns = {
+            "w_student": w_student,
+            "w_day": w_day,
+            "w_done": w_done,
+            "w_planned": w_planned,
+            "p_student": p_student,
+            "p_start": p_start,
+            "p_end": p_end,
+            "p_todos": p_todos,
+            "p_checked": p_checked,
+        }
+        for key, values in columns.items():
+            setattr(self, key, np.asarray(values, dtype=np.int64) if np is not None else values)
+
+    @property
+    def weekly_count(self) -> int:
+        return len(self.w_day)
+
+
+def _week_trend(columns: DatasetColumns) -> list[dict]:
+    if not columns.weekly_count:
+        return []
+    np = columns.np
+    n_students = max(1, len(columns.students))
+    if np is not None:
+        weeks, week_idx = np.unique(columns.w_day - (columns.w_day - 1) % 7, return_inverse=True)
+        weeklies = np.bincount(week_idx)
+        pairs = np.unique(week_idx * n_students + columns.w_student)
+        active = np.bincount(pairs // n_students, minlength=len(weeks))
+        done_sum = np.bincount(week_idx, weights=columns.w_done)
+        planned_sum = np.bincount(week_idx, weights=columns.w_planned)
+        rows = zip(weeks.tolist(), weeklies.tolist(), active.tolist(), done_sum.tolist(), planned_sum.tolist())
+    else:
+        mondays = [_monday(day) for day in columns.w_day]
+        weeklies = Counter(mondays)
+        active = Counter(monday for monday, _ in set(zip(mondays, columns.w_student)))
+        done_sum, planned_sum = Counter(), Counter()
+        for monday, done, planned in zip(mondays, columns.w_done, columns.w_planned):
+            done_sum[monday] += done
+            planned_sum[monday] += planned
+        rows = ((week, weeklies[week], active[week], done_sum[week], planned_sum[week]) for week in sorted(weeklies))
+
+    return [
+        {
+            "week": date.fromordinal(int(week)).isoformat(),
+            "weeklies": int(count),
+            "students": int(students),
+            "weeklies_per_student": round(count / max(1, students), 2),
+            "avg_done_chars": round(done / count, 1),
+            "avg_planned_chars": round(planned / count, 1),
+        }
+        for week, count, students, done, planned in rows
+    ]
+
+
+def _per_student(columns: DatasetColumns) -> dict[str, dict]:
+    size = len(columns.students)
+    np = columns.np
+    if np is not None:
+        weeklies = np.bincount(columns.w_student, minlength=size).tolist()
+        done = np.bincount(columns.w_student, weights=columns.w_done, minlength=size).tolist()
+        planned = np.bincount(columns.w_student, weights=columns.w_planned, minlength=size).tolist()
+        todos = np.bincount(columns.p_student, weights=columns.p_todos, minlength=size).tolist()
+        checked = np.bincount(columns.p_student, weights=columns.p_checked, minlength=size).tolist()
+    else:
+        weeklies, done, planned, todos, checked = ([0] * size for _ in range(5))
+        for code, done_len, planned_len in zip(columns.w_student, columns.w_done, columns.w_planned):
+            weeklies[code] += 1
+            done[code] += done_len
+            planned[code] += planned_len
+        for code, total, ticked in zip(columns.p_student, columns.p_todos, columns.p_checked):
+            todos[code] += total
+            checked[code] += ticked
+
+    return {
+        name: {
+            "weeklies": int(weeklies[code]),
+            "avg_done_chars": round(done[code] / weeklies[code], 1) if weeklies[code] else 0.0,
+            "avg_planned_chars": round(planned[code] / weeklies[code], 1) if weeklies[code] else 0.0,
+            "todo_completion": round(checked[code] / todos[code], 3) if todos[code] else None,
+        }
+        for code, name in enumerate(columns.students)
+    }
+
+
+def _behind_schedule(columns: DatasetColumns, today: int) -> list[dict]:
+    np = columns.np
+    if np is not None:
+        valid = (columns.p_start > 0) & (columns.p_end >= columns.p_start) & (columns.p_todos > 0)
+        span = np.maximum(1, columns.p_end - columns.p_start)
+        time_pct = np.clip(((today - columns.p_start) / span * 100).astype(np.int64), 0, 100)
+        time_pct = np.where(today <= columns.p_start, 0, np.where(today >= columns.p_end, 100, time_pct))
+        done_pct = np.where(valid, columns.p_checked * 100 / np.maximum(1, columns.p_todos), 0)
+        behind = np.flatnonzero(valid & (time_pct - done_pct > BEHIND_MARGIN))
+        rows = ((int(i), int(time_pct[i]), float(done_pct[i])) for i in behind)
+    else:
+        rows = []
+        for i, (start, end, total, ticked) in enumerate(
+            zip(columns.p_start, columns.p_end, columns.p_todos, columns.p_checked)
+        ):
+            pct = project_time_progress(start, end, today)
+            if pct is None or not total:
+                continue
+            done_pct = ticked * 100 / total
+            if pct - done_pct > BEHIND_MARGIN:
+                rows.append((i, pct, done_pct))
+
+    return [
+        {
+            "student": columns.students[int(columns.p_student[i])],
+            "project": columns.project_names[i],
+            "time_progress": pct,
+            "todo_completion": round(done_pct / 100, 3),
+        }
+        for i, pct, done_pct in rows
+    ]
+
+
+def build_report(data: dict, today: date | None = None) -> dict:
+    today = today or date.today()
+    columns = DatasetColumns(data)
+    total_todos = int(sum(columns.p_todos))
+    total_checked = int(sum(columns.p_checked))
+    return {
+        "backend": "numpy" if columns.np is not None else "python",
+        "students": len(columns.students),
+        "weeklies": columns.weekly_count,
+        "avg_done_chars": round(sum(columns.w_done) / max(1, columns.weekly_count), 1),
+        "avg_planned_chars": round(sum(columns.w_planned) / max(1, columns.weekly_count), 1),
+        "todo_completion": round(total_checked / total_todos, 3) if total_todos else None,
+        "weeks": _week_trend(columns),
+        "per_student": _per_student(columns),
+        "behind_schedule": _behind_schedule(columns, today.toordinal()),
+    }
+
+
+class AnalyticsEngine:
+    # Ergebnis je Datenstand: gleiche Version (und gleicher Tag) liefert den Cache.
+    def __init__(self):
+        self._key = None
+        self._report = None
+        self.computations = 0
+
+    def report(self, data: dict, version: int, today: date | None = None) -> dict:
+        today = today or date.today()
+        key = (version, today.toordinal())
+        if self._key != key:
+            self._report = build_report(data, today)
+            self._key = key
+            self.computations += 1
+        return self._report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kohorten-Auswertung einer Weeklies-Datei")
+    parser.add_argument("file", help="weeklies.json")
+    parser.add_argument("--today", help="Stichtag (YYYY-MM-DD), Standard: heute")
+    args = parser.parse_args()
+
+    # Lesen wie die Oberflaeche: Format nach Signatur, Altformate ueber validate_data.
+    from weekly_manager_pyqt import read_storage, validate_data
+
+    data = validate_data(json.loads(read_storage(args.file)))
+    today = date.fromisoformat(args.today) if args.today else None
+    json.dump(build_report(data, today), sys.stdout, ensure_ascii=False, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
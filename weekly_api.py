@@ -0,0 +1,362 @@
+# weekly_api.py
+# Python 3.10+
+#
+# Nur-Lese-HTTP/JSON-Schnittstelle auf die Weeklies-Daten; Server und Cache ohne Qt.
+# Eingebettet in der Oberflaeche (Schalter "API") oder eigenstaendig:
+#   python weekly_api.py weeklies.json [--port 8765]
+# Eigenstaendig wird die Datei wie beim Laden in der Oberflaeche gelesen (auch
+# .json.gz/.json.xz) und geprueft (validate_data), damit Altdateien dieselben ids bekommen.
+#
+# Routen (nur GET):
+#   /api/version
+#   /api/students
+#   /api/students/<id>
+#   /api/projects/<id>
+#   /api/weeklies/<id>
+#   /api/todos/open[?student=<id>]
+#   /api/search?q=<text>[&limit=50]
+#
+# Antworten kommen aus einem Cache je Route und Datenstand und tragen ein ETag;
+# mit If-None-Match antwortet der Server 304 ohne Inhalt.
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+API_DEFAULT_PORT = 8765
+API_CACHE_ENTRIES = 256
+API_SEARCH_LIMIT = 50
+API_SEARCH_FIELDS = ("title", "planned", "done", "next_planned")
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _open_todos(project: dict) -> list[dict]:
+    return [todo for todo in project.get("project_todos", []) if not todo.get("checked")]
+
+
+def _excerpt(text: str, start: int, width: int = 80) -> str:
+    left = max(0, start - 20)
+    return ("..." if left else "") + text[left : left + width].replace("\n", " | ")
+
+
+class DatasetQueries:
+    # Antworten fuer genau einen Datenstand. Die id-Zuordnung entsteht beim
+    # ersten Zugriff per id und gilt bis zum naechsten Datenstand.
+    def __init__(self, data: dict):
+        self.students = data.get("students", {})
+        self._by_id = None
+
+    def _lookup(self, kind: str, record_id: str) -> tuple:
+        if self._by_id is None:
+            by_id = {}
+            for name, entry in self.students.items():
+                by_id[entry.get("id")] = ("student", name, entry, None)
+                for project in entry.get("projects", []):
+                    by_id[project.get("id")] = ("project", name, project, None)
+                    for weekly in project.get("weeklies", []):
+                        by_id[weekly.get("id")] = ("weekly", name, weekly, project)
+            by_id.pop(None, None)
+            self._by_id = by_id
+        found = self._by_id.get(record_id)
+        if found is None or found[0] != kind:
+            raise ApiError(404, f"{kind} {record_id} nicht gefunden")
+        return found[1:]
+
+    def students_list(self) -> list[dict]:
+        return [
+            {
+                "id": entry.get("id"),
+                "name": name,
+                "projects": len(entry.get("projects", [])),
+                "weeklies": sum(len(project.get("weeklies", [])) for project in entry.get("projects", [])),
+                "open_todos": sum(len(_open_todos(project)) for project in entry.get("projects", [])),
+            }
+            for name, entry in self.students.items()
+        ]
+
+    def student(self, student_id: str) -> dict:
+        name, entry, _ = self._lookup("student", student_id)
+        return {
+            "id": student_id,
+            "name": name,
+            "projects": [
+                {
+                    "id": project.get("id"),
+                    "name": project.get("name", ""),
+                    "start_date": project.get("start_date", ""),
+                    "end_date": project.get("end_date", ""),
+                    "weeklies": len(project.get("weeklies", [])),
+                    "open_todos": len(_open_todos(project)),
+                }
+                for project in entry.get("projects", [])
+            ],
+        }
+
+    def project(self, project_id: str) -> dict:
+        name, project, _ = self._lookup("project", project_id)
+        return {
+            "id": project_id,
+            "student": name,
+            "name": project.get("name", ""),
+            "start_date": project.get("start_date", ""),
+            "end_date": project.get("end_date", ""),
+            "todos": list(project.get("project_todos", [])),
+            "weeklies": [
+                {"id": weekly.get("id"), "date": weekly.get("date", ""), "title": weekly.get("title", "")}
+                for weekly in project.get("weeklies", [])
+            ],
+        }
+
+    def weekly(self, weekly_id: str) -> dict:
+        name, weekly, project = self._lookup("weekly", weekly_id)
+        return {
+            "id": weekly_id,
+            "student": name,
+            "project_id": project.get("id"),
+            **{key: weekly.get(key, "") for key in ("date",) + API_SEARCH_FIELDS},
+            "attachments": list(weekly.get("attachments") or []),
+        }
+
+    def open_todos(self, student_id: str | None = None) -> list[dict]:
+        if student_id is not None:
+            name, entry, _ = self._lookup("student", student_id)
+            students = [(name, entry)]
+        else:
+            students = self.students.items()
+        return [
+            {
+                "student": name,
+                "project_id": project.get("id"),
+                "project": project.get("name", ""),
+                **todo,
+            }
+            for name, entry in students
+            for project in entry.get("projects", [])
+            for todo in _open_todos(project)
+        ]
+
+    def search(self, text: str, limit: int = API_SEARCH_LIMIT) -> dict:
+        needle = text.strip().lower()
+        if not needle:
+            raise ApiError(400, "Parameter q fehlt")
+        results = []
+        for name, entry in self.students.items():
+            for project in entry.get("projects", []):
+                candidates = [
+                    ("weekly", weekly.get("id"), field, str(weekly.get(field, "")))
+                    for weekly in project.get("weeklies", [])
+                    for field in API_SEARCH_FIELDS
+                ]
+                candidates += [
+                    ("todo", todo.get("id"), "text", str(todo.get("text", "")))
+                    for todo in project.get("project_todos", [])
+                ]
+                for kind, record_id, field, value in candidates:
+                    position = value.lower().find(needle)
+                    if position < 0:
+                        continue
+                    results.append(
+                        {
+                            "kind": kind,
+                            "id": record_id,
+                            "student": name,
+                            "project_id": project.get("id"),
+                            "field": field,
+                            "excerpt": _excerpt(value, position),
+                        }
+                    )
+                    if len(results) >= limit:
+                        return {"query": text, "results": results, "truncated": True}
+        return {"query": text, "results": results, "truncated": False}
+
+
+class ApiService:
+    # Antwort-Cache je (Route, Parameter) und Datenstand. version() wird pro Anfrage
+    # gelesen und muss billig sein. load() und das Erzeugen einer Antwort laufen
+    # ueber run(job): eigenstaendig direkt, in der Oberflaeche auf dem Qt-Hauptthread,
+    # weil nur dort die Daten geaendert werden. Treffer und 304 brauchen kein run().
+    def __init__(self, version, load, run=None):
+        self.version = version
+        self.load = load
+        self.run = run or (lambda job: job())
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._queries = (None, None)
+        self.hits = 0
+        self.misses = 0
+
+    def respond(self, target: str, if_none_match: str | None = None) -> tuple[int, str | None, bytes]:
+        parts = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        key = (parts.path.rstrip("/"), tuple(sorted(query.items())))
+        version = self.version()
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == version:
+                self._cache.move_to_end(key)
+                self.hits += 1
+        if cached is None or cached[0] != version:
+            status, body = self.run(lambda: self._render(version, key[0], query))
+            etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+            cached = (version, status, etag, body)
+            with self._lock:
+                self.misses += 1
+                self._cache[key] = cached
+                self._cache.move_to_end(key)
+                while len(self._cache) > API_CACHE_ENTRIES:
+                    self._cache.popitem(last=False)
+
+        _, status, etag, body = cached
+        if status == 200 and if_none_match and self._etag_matches(if_none_match, etag):
+            return 304, etag, b""
+        return status, etag, body
+
+    @staticmethod
+    def _etag_matches(header: str, etag: str) -> bool:
+        tags = [tag.strip() for tag in header.split(",")]
+        return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+    def _render(self, version, path: str, query: dict) -> tuple[int, bytes]:
+        if self._queries[0] != version:
+            self._queries = (version, DatasetQueries(self.load()))
+        queries = self._queries[1]
+        try:
+            payload = self._route(queries, version, path, query)
+            status = 200
+        except ApiError as exc:
+            payload, status = {"error": str(exc)}, exc.status
+        return status, json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def _route(queries: DatasetQueries, version, path: str, query: dict):
+        segments = [segment for segment in path.split("/") if segment]
+        if segments[:1] != ["api"]:
+            raise ApiError(404, "Unbekannte Route")
+        route = segments[1:]
+        if route == ["version"]:
+            return {"version": version if isinstance(version, int) else list(version)}
+        if route == ["students"]:
+            return queries.students_list()
+        if len(route) == 2 and route[0] == "students":
+            return queries.student(route[1])
+        if len(route) == 2 and route[0] == "projects":
+            return queries.project(route[1])
+        if len(route) == 2 and route[0] == "weeklies":
+            return queries.weekly(route[1])
+        if route == ["todos", "open"]:
+            return queries.open_todos(query.get("student"))
+        if route == ["search"]:
+            try:
+                limit = max(1, min(500, int(query.get("limit", API_SEARCH_LIMIT))))
+            except ValueError:
+                raise ApiError(400, "limit muss eine Zahl sein") from None
+            return queries.search(query.get("q", ""), limit)
+        raise ApiError(404, "Unbekannte Route")
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    server_version = "WeeklyAPI/1"
+
+    def do_GET(self):
+        try:
+            status, etag, body = self.server.service.respond(self.path, self.headers.get("If-None-Match"))
+        except ApiError as exc:
+            status, etag, body = exc.status, None, json.dumps({"error": str(exc)}).encode("utf-8")
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ApiServer:
+    # ThreadingHTTPServer in einem Daemon-Thread; jede Anfrage bekommt einen eigenen Thread.
+    def __init__(self, service: ApiService, host: str = "127.0.0.1", port: int = API_DEFAULT_PORT):
+        self.httpd = ThreadingHTTPServer((host, port), _ApiHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.service = service
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="weekly-api", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self._thread = None
+
+
+class FileSource:
+    # Eigenstaendiger Betrieb: Datenstand = (mtime, Groesse) der Datei; neu gelesen,
+    # sobald sich einer der Werte aendert.
+    def __init__(self, path: str, read=None):
+        self.path = path
+        self.read = read or self._read_json
+        self._lock = threading.Lock()
+        self._loaded = (None, None)
+
+    def version(self) -> tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self) -> dict:
+        with self._lock:
+            version = self.version()
+            if self._loaded[0] != version:
+                self._loaded = (version, self.read(self.path))
+            return self._loaded[1]
+
+    @staticmethod
+    def _read_json(path: str) -> dict:
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nur-Lese-HTTP-Schnittstelle auf eine Weeklies-Datei")
+    parser.add_argument("file", help="weeklies.json")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=API_DEFAULT_PORT)
+    args = parser.parse_args()
+
+    from weekly_manager_pyqt import read_storage, validate_data
+
+    source = FileSource(os.path.abspath(args.file), lambda path: validate_data(json.loads(read_storage(path))))
+    server = ApiServer(ApiService(source.version, source.load), args.host, args.port)
+    print(f"Weekly-API unter {server.url}", file=sys.stderr)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
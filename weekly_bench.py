@@ -0,0 +1,795 @@
+# weekly_bench.py
+# Python 3.10+
+# Benoetigt: PyQt6
+#
+# Mess-Skripte fuer den Weeklies-Manager.
+# Aufruf: python weekly_bench.py memory --students 2000
+
+import argparse
+import gc
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from concurrent.futures import ThreadPoolExecutor
+
+from weekly_manager_pyqt import (
+    ATTACHMENT_THUMB_WORKERS,
+    BULK_WEEKLY_FIELDS,
+    DATA_VERSION,
+    AttachmentStore,
+    BackupStore,
+    CompactDataset,
+    MARKDOWN_FIELDS,
+    FragmentSerializer,
+    MarkdownCache,
+    MappedArchive,
+    MappedStudents,
+    STORAGE_CODECS,
+    STORAGE_GZIP_LEVEL,
+    STORAGE_LZMA_PRESET,
+    PredicateIndex,
+    TextIndex,
+    build_mapped_archive,
+    find_replacements,
+    load_validated_file,
+    read_snapshot,
+    render_markdown,
+    render_thumbnail,
+    snapshot_path_for,
+    storage_path_for,
+    validate_data,
+    write_json_chunks,
+    write_snapshot,
+    write_storage_chunks,
+)
+
+
+PHRASES = [
+    "Literaturrecherche fortgesetzt",
+    "Kapitel 2 ueberarbeitet",
+    "Messungen ausgewertet",
+    "Code aufgeraeumt",
+    "Betreuer-Feedback eingearbeitet",
+    "Experimente wiederholt",
+    "Plots erstellt",
+    "Related Work gelesen",
+]
+
+
+def make_synthetic_data(students: int, projects: int = 2, weeklies: int = 20, todos: int = 8, seed: int = 1) -> dict:
+    rnd = random.Random(seed)
+    data = {"version": DATA_VERSION, "students": {}}
+    for student_idx in range(students):
+        project_list = []
+        for project_idx in range(projects):
+            weekly_list = []
+            planned = rnd.choice(PHRASES)
+            for weekly_idx in range(weeklies):
+                next_planned = rnd.choice(PHRASES)
+                weekly_list.append(
+                    {
+                        "id": f"w{student_idx:05d}{project_idx}{weekly_idx:03d}",
+                        "date": f"2026-{1 + weekly_idx // 4:02d}-{1 + (weekly_idx % 4) * 7:02d}",
+                        "title": "",
+                        "planned": planned,
+                        "done": rnd.choice(PHRASES),
+                        "next_planned": next_planned,
+                    }
+                )
+                planned = next_planned
+            project_list.append(
+                {
+                    "id": f"p{student_idx:05d}{project_idx}",
+                    "name": f"Projekt {project_idx + 1}",
+                    "start_date": "2026-01-01",
+                    "end_date": "2026-06-30",
+                    "project_todos": [
+                        {
+                            "id": f"t{student_idx:05d}{project_idx}{todo_idx:03d}",
+                            "text": rnd.choice(PHRASES),
+                            "checked": rnd.random() < 0.5,
+                        }
+                        for todo_idx in range(todos)
+                    ],
+                    "weeklies": weekly_list,
+                }
+            )
+        data["students"][f"Student {student_idx:05d}"] = {"id": f"s{student_idx:05d}", "projects": project_list}
+    return data
+
+
+def _measure(build):
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current, peak
+
+
+def bench_memory(students: int) -> dict:
+    # Beide Varianten werden aus demselben JSON-Text aufgebaut,
+    # damit der Vergleich den realen Ladepfad abbildet.
+    text = json.dumps(make_synthetic_data(students), ensure_ascii=False, indent=2)
+
+    dict_data, dict_current, dict_peak = _measure(lambda: validate_data(json.loads(text)))
+    compact_data, compact_current, compact_peak = _measure(lambda: CompactDataset.loads(text))
+
+    assert compact_data.to_data() == dict_data
+    return {
+        "students": students,
+        "weeklies": compact_data.weekly_count(),
+        "dict_bytes": dict_current,
+        "dict_peak_bytes": dict_peak,
+        "compact_bytes": compact_current,
+        "compact_peak_bytes": compact_peak,
+        "ratio": round(compact_current / max(1, dict_current), 3),
+    }
+
+
+def bench_snapshot(students: int) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "weeklies.json")
+        with open(json_path, "w", encoding="utf-8") as handle:
+            json.dump(make_synthetic_data(students), handle, ensure_ascii=False, indent=2)
+
+        start = time.perf_counter()
+        with open(json_path, "r", encoding="utf-8") as handle:
+            data = validate_data(json.load(handle))
+        json_seconds = time.perf_counter() - start
+
+        write_snapshot(json_path, data)
+        start = time.perf_counter()
+        cached = read_snapshot(json_path)
+        snapshot_seconds = time.perf_counter() - start
+
+        assert cached == data
+        return {
+            "students": students,
+            "json_bytes": os.path.getsize(json_path),
+            "json_load_ms": round(json_seconds * 1000, 2),
+            "snapshot_load_ms": round(snapshot_seconds * 1000, 2),
+        }
+
+
+def bench_archive(students: int) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        archive_path = os.path.join(directory, "weeklies.wkarc")
+        build_mapped_archive(make_synthetic_data(students), archive_path)
+
+        gc.collect()
+        tracemalloc.start()
+        archive = MappedArchive(archive_path)
+        opened, _ = tracemalloc.get_traced_memory()
+
+        # Alle Studierenden durchblaettern und jedes Weekly anzeigen.
+        for entry in MappedStudents(archive).values():
+            for project in entry["projects"]:
+                for weekly in project["weeklies"]:
+                    weekly.get("done")
+        browsed, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        archive.close()
+
+        return {
+            "students": students,
+            "archive_bytes": os.path.getsize(archive_path),
+            "open_bytes": opened,
+            "after_browse_bytes": browsed,
+            "peak_bytes": peak,
+        }
+
+
+def bench_refresh(students: int, switches: int) -> dict:
+    # Prueft, dass ein Wechsel der Auswahl jede Ansicht hoechstens einmal neu aufbaut.
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+
+    from weekly_manager_pyqt import WeeklyManagerWindow
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "weeklies.json")
+        with open(json_path, "w", encoding="utf-8") as handle:
+            json.dump(make_synthetic_data(students), handle, ensure_ascii=False, indent=2)
+
+        window = WeeklyManagerWindow()
+        window.load_json(json_path)
+        window.show()
+        app.processEvents()
+        window.refresh_stats(reset=True)
+
+        worst = {}
+        timings = []
+        for step in range(switches):
+            for widget, row in (
+                (window.student_list, step % window.student_list.count()),
+                (window.project_list, 0),
+                (window.weekly_list, 0),
+            ):
+                start = time.perf_counter()
+                widget.setCurrentRow(row)
+                app.processEvents()
+                timings.append(time.perf_counter() - start)
+                for view, count in window.refresh_stats(reset=True).items():
+                    worst[view] = max(worst.get(view, 0), count)
+
+        window.close()
+        assert all(count <= 1 for count in worst.values()), worst
+        return {
+            "students": students,
+            "switches": switches * 3,
+            "max_rebuilds_per_switch": worst,
+            "avg_switch_ms": round(sum(timings) / len(timings) * 1000, 3),
+        }
+
+
+def bench_theme(students: int, switches: int) -> dict:
+    # Vergleicht den bisherigen Themewechsel (Style, Schrift, Stylesheet neu formatieren) mit den vorbereiteten Themes.
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtGui import QFont
+    from PyQt6.QtWidgets import QApplication, QStyleFactory
+
+    from weekly_manager_pyqt import BUILTIN_THEMES, THEME_STYLESHEET, ThemeRegistry, WeeklyManagerWindow
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "weeklies.json")
+        with open(json_path, "w", encoding="utf-8") as handle:
+            json.dump(make_synthetic_data(students), handle, ensure_ascii=False, indent=2)
+
+        start = time.perf_counter()
+        registry = ThemeRegistry()
+        for name in registry.names():
+            registry.get(name)
+        compile_seconds = time.perf_counter() - start
+
+        window = WeeklyManagerWindow()
+        window.load_json(json_path)
+        window.show()
+        window.act_toggle_todo_area.setChecked(True)
+        app.processEvents()
+
+        def legacy_switch(mode):
+            QApplication.setStyle(QStyleFactory.create("Fusion"))
+            font = QFont()
+            font.setPointSize(10)
+            window.setFont(font)
+            window.setStyleSheet(THEME_STYLESHEET.format_map(BUILTIN_THEMES[mode]["colors"]))
+
+        timings = {"legacy": [], "compiled": []}
+        for variant, switch in (("legacy", legacy_switch), ("compiled", window._set_theme)):
+            for step in range(switches):
+                start = time.perf_counter()
+                switch("dark" if step % 2 == 0 else "light")
+                app.processEvents()
+                timings[variant].append(time.perf_counter() - start)
+
+        window.close()
+        return {
+            "students": students,
+            "switches": switches,
+            "compile_all_ms": round(compile_seconds * 1000, 3),
+            "legacy_switch_ms": round(sum(timings["legacy"]) / switches * 1000, 1),
+            "compiled_switch_ms": round(sum(timings["compiled"]) / switches * 1000, 1),
+        }
+
+
+def bench_filter(students: int, rounds: int) -> dict:
+    # Kombinierte Filter: vorberechnete Mengen gegen einen Durchlauf ueber alle Projekte.
+    from weekly_analytics import iso_ordinal, project_time_progress
+
+    data = validate_data(make_synthetic_data(students))
+    today = iso_ordinal("2026-06-20")
+    names = list(data["students"])
+
+    def walk():
+        # Kein Weekly seit 14 Tagen und mindestens ein Projekt zu ueber 80% um.
+        hits = set()
+        for name, entry in data["students"].items():
+            dates = [weekly["date"] for project in entry["projects"] for weekly in project["weeklies"]]
+            latest = max(dates, default="")
+            if latest and today - iso_ordinal(latest) <= 14:
+                continue
+            for project in entry["projects"]:
+                start, end = iso_ordinal(project["start_date"]), iso_ordinal(project["end_date"])
+                progress = project_time_progress(start, end, today)
+                if progress is not None and progress > 80:
+                    hits.add(name)
+                    break
+        return hits
+
+    start = time.perf_counter()
+    index = PredicateIndex(data["students"])
+    index.matching_students({"stale"}, today)
+    build_seconds = time.perf_counter() - start
+
+    walk_seconds = index_seconds = update_seconds = 0.0
+    for step in range(rounds):
+        # Eine Aenderung je Runde, danach beide Abfragen.
+        name = names[step * 7 % len(names)]
+        data["students"][name]["projects"][0]["weeklies"][-1]["date"] = "2026-06-19" if step % 2 == 0 else "2026-05-01"
+        start = time.perf_counter()
+        index.mark_dirty(name)
+        index.matching_students({"stale"}, today)
+        update_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = walk()
+        walk_seconds += time.perf_counter() - start
+        start = time.perf_counter()
+        found = index.matching_students({"stale", "late_phase"}, today)
+        index_seconds += time.perf_counter() - start
+        assert found == expected, (len(found), len(expected))
+
+    return {
+        "students": students,
+        "rounds": rounds,
+        "index_build_ms": round(build_seconds * 1000, 1),
+        "update_ms": round(update_seconds / rounds * 1000, 3),
+        "walk_ms": round(walk_seconds / rounds * 1000, 3),
+        "indexed_ms": round(index_seconds / rounds * 1000, 3),
+        "matching_students": len(found),
+    }
+
+
+def bench_api(students: int, requests: int) -> dict:
+    # Latenz ueber HTTP: neu berechnet (Datenstand geaendert), aus dem Cache, 304 per ETag.
+    from urllib.request import Request, urlopen
+
+    from weekly_api import ApiServer, ApiService
+
+    data = validate_data(make_synthetic_data(students))
+    version = [0]
+    service = ApiService(lambda: version[0], lambda: data)
+    server = ApiServer(service, port=0)
+    server.start()
+    routes = ["/students", f"/students/{next(iter(data['students'].values()))['id']}", "/todos/open"]
+
+    def fetch(route, etag=None):
+        request = Request(server.url + route, headers={"If-None-Match": etag} if etag else {})
+        start = time.perf_counter()
+        try:
+            with urlopen(request) as response:
+                response.read()
+                result = response.status, response.headers["ETag"]
+        except OSError as exc:
+            result = getattr(exc, "code", None), None
+        return time.perf_counter() - start, result
+
+    timings = {"miss": 0.0, "hit": 0.0, "not_modified": 0.0}
+    try:
+        for step in range(requests):
+            route = routes[step % len(routes)]
+            version[0] += 1
+            seconds, (status, etag) = fetch(route)
+            timings["miss"] += seconds
+            assert status == 200, status
+            seconds, (status, _) = fetch(route)
+            timings["hit"] += seconds
+            assert status == 200, status
+            seconds, (status, _) = fetch(route, etag)
+            timings["not_modified"] += seconds
+            assert status == 304, status
+    finally:
+        server.stop()
+
+    return {
+        "students": students,
+        "requests": requests,
+        **{f"{key}_ms": round(seconds / requests * 1000, 3) for key, seconds in timings.items()},
+        "cache_hits": service.hits,
+        "cache_misses": service.misses,
+    }
+
+
+def bench_markdown(students: int, flips: int) -> dict:
+    # Blaettern in der Vorschau: jedes Mal rendern gegen Cache (Hash des Inhalts + Nachschlagen).
+    data = validate_data(make_synthetic_data(students))
+    weeklies = [
+        weekly
+        for entry in data["students"].values()
+        for project in entry["projects"]
+        for weekly in project["weeklies"]
+    ][:flips]
+    for step, weekly in enumerate(weeklies):
+        weekly["done"] = f"- **{weekly['done']}**\n- siehe [Notizen](https://example.org/{step})\n\n`make test`"
+
+    cache = MarkdownCache(max_entries=len(weeklies) * len(MARKDOWN_FIELDS))
+    start = time.perf_counter()
+    for weekly in weeklies:
+        for field in MARKDOWN_FIELDS:
+            text = weekly[field]
+            cache.put(weekly["id"], field, MarkdownCache.digest(text), render_markdown(text))
+    render_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for weekly in weeklies:
+        for field in MARKDOWN_FIELDS:
+            assert cache.get(weekly["id"], field, MarkdownCache.digest(weekly[field])) is not None
+    cached_seconds = time.perf_counter() - start
+
+    return {
+        "weeklies": len(weeklies),
+        "render_ms_per_weekly": round(render_seconds / len(weeklies) * 1000, 3),
+        "cached_ms_per_weekly": round(cached_seconds / len(weeklies) * 1000, 4),
+        "cache_hits": cache.hits,
+        "cache_misses": cache.misses,
+    }
+
+
+def bench_attachments(students: int, images: int) -> dict:
+    # Anhaenge: Ablegen mit Deduplizierung, Vorschaubilder im Pool, Groesse der JSON-Datei mit Verweisen.
+    from PyQt6.QtGui import QColor, QImage
+
+    data = validate_data(make_synthetic_data(students))
+    weeklies = [
+        weekly
+        for entry in data["students"].values()
+        for project in entry["projects"]
+        for weekly in project["weeklies"]
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        sources = []
+        for number in range(images):
+            image = QImage(1600, 1200, QImage.Format.Format_RGB32)
+            image.fill(QColor.fromHsv(number * 37 % 360, 200, 200))
+            sources.append(os.path.join(directory, f"screenshot-{number}.png"))
+            image.save(sources[-1])
+        json_path = os.path.join(directory, "weeklies.json")
+        store = AttachmentStore(os.path.join(directory, "weeklies.attachments"))
+
+        # Jede Datei zweimal ablegen: die zweite Kopie darf keinen neuen Blob erzeugen.
+        start = time.perf_counter()
+        references = [store.add(path) for path in sources + sources]
+        add_seconds = time.perf_counter() - start
+        blobs = sorted({reference["blob"] for reference in references})
+        blob_bytes = sum(os.path.getsize(store.blob_path(blob)) for blob in blobs)
+
+        def save_seconds() -> tuple[float, int]:
+            start = time.perf_counter()
+            with open(json_path, "w", encoding="utf-8") as handle:
+                json.dump(data, handle, ensure_ascii=False, indent=2)
+            return time.perf_counter() - start, os.path.getsize(json_path)
+
+        plain_seconds, plain_bytes = save_seconds()
+        for weekly, reference in zip(weeklies, references):
+            weekly["attachments"] = [reference]
+        linked_seconds, linked_bytes = save_seconds()
+
+        start = time.perf_counter()
+        for blob in blobs:
+            render_thumbnail(store.blob_path(blob), store.thumbnail_path(blob) + ".seq.png")
+        serial_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=ATTACHMENT_THUMB_WORKERS) as pool:
+            list(pool.map(lambda blob: render_thumbnail(store.blob_path(blob), store.thumbnail_path(blob)), blobs))
+        pool_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cached = sum(os.path.exists(store.thumbnail_path(blob)) for blob in blobs)
+        cached_seconds = time.perf_counter() - start
+
+    return {
+        "attachments": len(references),
+        "blobs": len(blobs),
+        "blob_bytes": blob_bytes,
+        "add_ms_per_file": round(add_seconds / len(references) * 1000, 3),
+        "json_bytes_without": plain_bytes,
+        "json_bytes_with_refs": linked_bytes,
+        "save_ms_without": round(plain_seconds * 1000, 1),
+        "save_ms_with_refs": round(linked_seconds * 1000, 1),
+        "thumbs_serial_ms": round(serial_seconds * 1000, 1),
+        "thumbs_pool_ms": round(pool_seconds * 1000, 1),
+        "thumbs_cached": cached,
+        "thumbs_cached_ms": round(cached_seconds * 1000, 3),
+    }
+
+
+def bench_replace(students: int, queries: int) -> dict:
+    # Seltene Begriffe (Tippfehler) finden: Trigramm-Index gegen Durchlauf ueber alle Felder.
+    data = validate_data(make_synthetic_data(students))
+    names = list(data["students"])
+    typos = []
+    for step in range(queries):
+        weekly = data["students"][names[step * 13 % len(names)]]["projects"][0]["weeklies"][step % 20]
+        typo = f"Kaptel {step}x"
+        weekly["done"] += f" ({typo})"
+        typos.append(typo)
+
+    start = time.perf_counter()
+    index = TextIndex(data["students"])
+    index.candidates([])
+    build_seconds = time.perf_counter() - start
+
+    def scan(pattern):
+        compiled = re.compile(re.escape(pattern), re.IGNORECASE)
+        hits = 0
+        for entry in data["students"].values():
+            for project in entry["projects"]:
+                texts = [weekly[key] for weekly in project["weeklies"] for key in BULK_WEEKLY_FIELDS]
+                texts += [todo["text"] for todo in project["project_todos"]]
+                hits += sum(1 for text in texts if compiled.search(text))
+        return hits
+
+    scan_seconds = index_seconds = 0.0
+    for typo in typos:
+        start = time.perf_counter()
+        expected = scan(typo)
+        scan_seconds += time.perf_counter() - start
+        start = time.perf_counter()
+        found = find_replacements(index, typo, "Kapitel")
+        index_seconds += time.perf_counter() - start
+        assert len(found) == expected, (typo, len(found), expected)
+
+    return {
+        "students": students,
+        "queries": queries,
+        "index_entries": len(index.entries),
+        "index_build_ms": round(build_seconds * 1000, 1),
+        "scan_ms": round(scan_seconds / queries * 1000, 3),
+        "indexed_ms": round(index_seconds / queries * 1000, 3),
+    }
+
+
+def bench_storage(students: int, runs: int) -> dict:
+    # Je Format: Groesse, Rate, Schreib- und Lesezeit (ohne Snapshot) und Spitzenspeicher beim
+    # Schreiben, verglichen mit "ganzen Text zusammenfuegen, dann komprimieren".
+    import gzip
+    import lzma
+
+    data = validate_data(make_synthetic_data(students))
+    chunks, _ = FragmentSerializer().encode(data)
+    one_shot = {
+        "gzip": lambda content: gzip.compress(content, compresslevel=STORAGE_GZIP_LEVEL),
+        "lzma": lambda content: lzma.compress(content, preset=STORAGE_LZMA_PRESET),
+    }
+    result = {"students": students, "runs": runs, "json_bytes": sum(map(len, chunks))}
+
+    with tempfile.TemporaryDirectory() as directory:
+        for codec in STORAGE_CODECS:
+            path = storage_path_for(os.path.join(directory, "weeklies.json"), codec)
+            encode_ms = decode_ms = 0.0
+            for _ in range(runs):
+                encode_ms += write_storage_chunks(path, chunks)["encode_ms"]
+                if os.path.exists(snapshot_path_for(path)):
+                    os.remove(snapshot_path_for(path))
+                report = {}
+                load_validated_file(path, report=report)
+                decode_ms += report["decode_ms"]
+
+            tracemalloc.start()
+            write_storage_chunks(path, chunks)
+            streaming_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            entry = {
+                "stored_bytes": report["stored_bytes"],
+                "ratio": report["ratio"],
+                "encode_ms": round(encode_ms / runs, 1),
+                "decode_ms": round(decode_ms / runs, 1),
+                "encode_peak_mb": round(streaming_peak / 1e6, 2),
+            }
+            if codec in one_shot:
+                tracemalloc.start()
+                one_shot[codec](b"".join(chunks))
+                entry["one_shot_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 2)
+                tracemalloc.stop()
+            result[codec] = entry
+    return result
+
+
+def bench_save(students: int, edits: int) -> dict:
+    # Vergleicht den bisherigen json.dump mit dem Fragment-Cache nach Einzel-Edits.
+    data = make_synthetic_data(students)
+    with tempfile.TemporaryDirectory() as directory:
+        reference_path = os.path.join(directory, "reference.json")
+        fragment_path = os.path.join(directory, "fragments.json")
+        serializer = FragmentSerializer()
+        serializer.encode(data)
+        names = list(data["students"])
+
+        dump_seconds = fragment_seconds = 0.0
+        encoded = 0
+        for step in range(edits):
+            student = data["students"][names[step * 7 % len(names)]]
+            project = student["projects"][0]
+            weekly = project["weeklies"][step % len(project["weeklies"])]
+            weekly["done"] += " ok"
+
+            start = time.perf_counter()
+            with open(reference_path, "w", encoding="utf-8") as handle:
+                json.dump(data, handle, ensure_ascii=False, indent=2)
+            dump_seconds += time.perf_counter() - start
+
+            start = time.perf_counter()
+            serializer.invalidate(student, project, weekly)
+            chunks, _ = serializer.encode(data)
+            write_json_chunks(fragment_path, chunks)
+            fragment_seconds += time.perf_counter() - start
+            encoded += serializer.encoded
+
+        with open(reference_path, "rb") as reference, open(fragment_path, "rb") as fragments:
+            assert reference.read() == fragments.read()
+        return {
+            "students": students,
+            "file_bytes": os.path.getsize(fragment_path),
+            "json_dump_ms": round(dump_seconds / edits * 1000, 2),
+            "fragment_write_ms": round(fragment_seconds / edits * 1000, 2),
+            "records_encoded_per_save": round(encoded / edits, 1),
+        }
+
+
+def bench_backup(students: int, minutes: int) -> dict:
+    # Eine Sicherung pro Minute mit je einem Edit bei wechselnden Studierenden.
+    data = make_synthetic_data(students)
+    serializer = FragmentSerializer()
+    names = list(data["students"])
+    with tempfile.TemporaryDirectory() as directory:
+        store = BackupStore(os.path.join(directory, "backups"))
+        start_ts = time.time() - minutes * 60
+        start = time.perf_counter()
+        store.snapshot(serializer.dumps(data), now=start_ts)
+        base_seconds = time.perf_counter() - start
+
+        delta_seconds = 0.0
+        for minute in range(1, minutes + 1):
+            student = data["students"][names[minute * 13 % len(names)]]
+            project = student["projects"][0]
+            weekly = project["weeklies"][minute % len(project["weeklies"])]
+            weekly["done"] += " ok"
+            serializer.invalidate(student, project, weekly)
+            content = serializer.dumps(data)
+            start = time.perf_counter()
+            store.snapshot(content, now=start_ts + minute * 60)
+            delta_seconds += time.perf_counter() - start
+
+        reopened = BackupStore(store.directory)
+        start = time.perf_counter()
+        assert reopened.restore(reopened.versions[-1]["seq"]) == content
+        restore_seconds = time.perf_counter() - start
+        return {
+            "students": students,
+            "file_bytes": len(content),
+            "versions_kept": len(store.versions),
+            "bases": sum(1 for version in store.versions if version["kind"] == "base"),
+            "stored_bytes": sum(version["stored"] for version in store.versions),
+            "base_ms": round(base_seconds * 1000, 2),
+            "delta_ms": round(delta_seconds / minutes * 1000, 2),
+            "restore_ms": round(restore_seconds * 1000, 2),
+        }
+
+
+def bench_startup(students: int, runs: int, budget_ms: float | None) -> dict:
+    # Startet die Oberflaeche in einem frischen Prozess, damit auch der Import mitzaehlt.
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "weekly_manager_pyqt.py")
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    reports = []
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "weeklies.json")
+        with open(json_path, "w", encoding="utf-8") as handle:
+            json.dump(make_synthetic_data(students), handle, ensure_ascii=False, indent=2)
+        for _ in range(runs):
+            output = subprocess.run(
+                [sys.executable, script, "--startup-report", json_path],
+                check=True,
+                capture_output=True,
+                text=True,
+                env=env,
+            ).stdout
+            reports.append(json.loads(output[output.index("{") :]))
+
+    # Median je Phase; der erste Lauf enthaelt u. a. das Anlegen des Snapshots.
+    result = {"students": students, "runs": runs}
+    for key in reports[0]:
+        if key.endswith("_ms") and key != "budget_ms":
+            values = sorted(report[key] for report in reports)
+            result[key] = values[len(values) // 2]
+    result["budget_ms"] = budget_ms if budget_ms is not None else reports[0]["budget_ms"]
+    result["within_budget"] = result["total_ms"] <= result["budget_ms"]
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks fuer den Weeklies-Manager")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    memory = sub.add_parser("memory", help="Speicherbedarf dict-Layout vs. kompakte Records")
+    memory.add_argument("--students", type=int, default=1000)
+
+    snapshot = sub.add_parser("snapshot", help="Kaltstart JSON+Validierung vs. Binaer-Snapshot")
+    snapshot.add_argument("--students", type=int, default=1000)
+
+    archive = sub.add_parser("archive", help="Speicherbedarf beim Blaettern im gemappten Archiv")
+    archive.add_argument("--students", type=int, default=1000)
+
+    refresh = sub.add_parser("refresh", help="UI-Neuaufbauten pro Auswahlwechsel zaehlen")
+    refresh.add_argument("--students", type=int, default=200)
+    refresh.add_argument("--switches", type=int, default=50)
+
+    save = sub.add_parser("save", help="Speichern: json.dump vs. Fragment-Cache (byte-identisch)")
+    save.add_argument("--students", type=int, default=1000)
+    save.add_argument("--edits", type=int, default=20)
+
+    storage = sub.add_parser("storage", help="Speicherformate: Rate, Schreib-/Lesezeit, Spitzenspeicher")
+    storage.add_argument("--students", type=int, default=1000)
+    storage.add_argument("--runs", type=int, default=3)
+
+    backup = sub.add_parser("backup", help="Sicherungen pro Minute: Zeit und Speicherbedarf")
+    backup.add_argument("--students", type=int, default=1000)
+    backup.add_argument("--minutes", type=int, default=120)
+
+    filters = sub.add_parser("filter", help="Risiko-Filter: vorberechnete Mengen gegen Durchlauf")
+    filters.add_argument("--students", type=int, default=1000)
+    filters.add_argument("--rounds", type=int, default=50)
+
+    markdown = sub.add_parser("markdown", help="Markdown-Vorschau: Rendern gegen Cache beim Blaettern")
+    markdown.add_argument("--students", type=int, default=100)
+    markdown.add_argument("--flips", type=int, default=500)
+
+    attachments = sub.add_parser("attachments", help="Anhaenge: Deduplizierung, Vorschaubilder, JSON-Groesse")
+    attachments.add_argument("--students", type=int, default=1000)
+    attachments.add_argument("--images", type=int, default=40)
+
+    replace = sub.add_parser("replace", help="Suchen & Ersetzen: Textindex gegen vollen Durchlauf")
+    replace.add_argument("--students", type=int, default=1000)
+    replace.add_argument("--queries", type=int, default=50)
+
+    api = sub.add_parser("api", help="HTTP-Schnittstelle: neu berechnet, Cache-Treffer, 304")
+    api.add_argument("--students", type=int, default=1000)
+    api.add_argument("--requests", type=int, default=30)
+
+    theme = sub.add_parser("theme", help="Dauer eines Themewechsels bei voller Oberflaeche")
+    theme.add_argument("--students", type=int, default=200)
+    theme.add_argument("--switches", type=int, default=10)
+
+    startup = sub.add_parser("startup", help="Startzeit je Phase (Import, Aufbau, erstes Zeichnen, Laden)")
+    startup.add_argument("--students", type=int, default=200)
+    startup.add_argument("--runs", type=int, default=5)
+    startup.add_argument("--budget-ms", type=float, default=None)
+
+    args = parser.parse_args()
+    if args.command == "memory":
+        result = bench_memory(args.students)
+    elif args.command == "snapshot":
+        result = bench_snapshot(args.students)
+    elif args.command == "archive":
+        result = bench_archive(args.students)
+    elif args.command == "refresh":
+        result = bench_refresh(args.students, args.switches)
+    elif args.command == "save":
+        result = bench_save(args.students, args.edits)
+    elif args.command == "storage":
+        result = bench_storage(args.students, args.runs)
+    elif args.command == "backup":
+        result = bench_backup(args.students, args.minutes)
+    elif args.command == "filter":
+        result = bench_filter(args.students, args.rounds)
+    elif args.command == "markdown":
+        result = bench_markdown(args.students, args.flips)
+    elif args.command == "attachments":
+        result = bench_attachments(args.students, args.images)
+    elif args.command == "replace":
+        result = bench_replace(args.students, args.queries)
+    elif args.command == "api":
+        result = bench_api(args.students, args.requests)
+    elif args.command == "theme":
+        result = bench_theme(args.students, args.switches)
+    elif args.command == "startup":
+        result = bench_startup(args.students, args.runs, args.budget_ms)
+
+    print(json.dumps(result, indent=2))
+    if result.get("within_budget") is False:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+# weekly_fsck.py
+# Python 3.10+
+# Benoetigt: PyQt6 (nur fuer die gemeinsamen Lade-/Speicherfunktionen, ohne Fenster)
+#
+# Integritaetspruefung fuer Weeklies-Dateien. Meldet, was validate_data beim Laden
+# stillschweigend verwirft oder ersetzt, dazu doppelte Weeklies, Daten ausserhalb
+# der Projektlaufzeit und alte TODO-Listen. Optional wird eine reparierte Kopie
+# geschrieben (<name>.repaired.json[.gz|.xz]); die Eingabe bleibt unveraendert.
+# Aufruf: python weekly_fsck.py weeklies.json [--repair]
+#         python weekly_fsck.py semester-ordner/ [--jobs 8]
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from PyQt6.QtCore import QDate, Qt
+
+from weekly_manager_pyqt import (
+    FragmentSerializer,
+    is_storage_file,
+    normalize_attachments,
+    normalize_due_date,
+    read_storage,
+    sidecar_base_for,
+    storage_codec_for,
+    storage_path_for,
+    validate_data,
+    write_storage_chunks,
+)
+
+# Grosse Einzeldateien werden in Bloecken zu so vielen Studierenden parallel geprueft.
+FSCK_CHUNK_STUDENTS = 250
+FSCK_WEEKLY_FIELDS = ("title", "planned", "done", "next_planned")
+FSCK_LEGACY_BUCKETS = ("project_todos_active", "project_todos_later")
+
+ISSUE_KINDS = {
+    "dropped_student_data": "Eintrag der Studierenden unlesbar, Projekte verworfen",
+    "dropped_project": "Projekt ist kein Objekt und wird verworfen",
+    "dropped_weekly": "Weekly ist kein Objekt und wird verworfen",
+    "dropped_todo": "TODO leer oder unlesbar und wird verworfen",
+    "dropped_attachment": "Anhang-Referenz ungueltig (z. B. alter Blob-Pfad) und wird verworfen",
+    "merged_todo": "TODO doppelt (gleicher Text) und wird zusammengefuehrt",
+    "invalid_date": "Datum ungueltig oder fehlt, wird durch heute ersetzt (Faelligkeit: entfernt)",
+    "coerced_field": "Feld ist kein Text und wird umgewandelt",
+    "renamed_project": "Projektname fehlt, Ersatzname wird vergeben",
+    "duplicate_id": "id mehrfach vergeben, Kopie bekommt eine neue",
+    "duplicate_weekly": "Weekly doppelt (gleiches Datum und gleicher Inhalt)",
+    "out_of_range": "Weekly-Datum ausserhalb der Projektlaufzeit",
+    "inverted_range": "Projektende liegt vor dem Start",
+    "legacy_format": "Altformat der Studierenden (ohne Projektliste)",
+    "legacy_todo_bucket": "alte TODO-Liste, wird in project_todos zusammengefuehrt",
+    "missing_id": "id fehlt und wird neu vergeben (Dateien vor Version 5)",
+}
+# Einzelmeldungen in dieser Reihenfolge: Verworfenes zuerst, fehlende ids zuletzt.
+ISSUE_ORDER = {kind: order for order, kind in enumerate(ISSUE_KINDS)}
+
+
+def _issue(kind: str, location: str, detail: str = "") -> dict:
+    return {"kind": kind, "location": location, "detail": detail}
+
+
+def _check_date(value, location: str, key: str, issues: list) -> int:
+    # Dieselbe Pruefung wie normalize_iso_date (QDate, ISODate): date.fromisoformat liest
+    # auch "20240105" oder "2024-W02-1", die der Loader durch heute ersetzt.
+    qd = QDate.fromString(str(value), Qt.DateFormat.ISODate)
+    if not qd.isValid():
+        issues.append(_issue("invalid_date", location, f"{key}={value!r}"))
+        return 0
+    if qd.toString(Qt.DateFormat.ISODate) != value:
+        issues.append(_issue("coerced_field", location, f"{key}={value!r}"))
+    return qd.toJulianDay()
+
+
+def _attachment_blobs(attachments: list) -> tuple:
+    return tuple(attachment["blob"] for attachment in attachments)
+
+
+def _check_todos(project: dict, location: str, issues: list):
+    seen = set()
+    for key in ("project_todos",) + FSCK_LEGACY_BUCKETS:
+        raw_todos = project.get(key, [])
+        if key in FSCK_LEGACY_BUCKETS and raw_todos:
+            issues.append(_issue("legacy_todo_bucket", location, key))
+        if not isinstance(raw_todos, list):
+            issues.append(_issue("dropped_todo", location, f"{key} ist keine Liste"))
+            continue
+        for idx, raw in enumerate(raw_todos):
+            # Wie normalize_todos: der Text eines Objekts wird mit str() gelesen, nur leere
+            # Texte und Eintraege, die weder Objekt noch Text sind, gehen verloren.
+            todo_location = f"{location} > {key}[{idx}]"
+            if isinstance(raw, dict):
+                text = str(raw.get("text", "")).strip()
+                if text and not isinstance(raw["text"], str):
+                    issues.append(_issue("coerced_field", todo_location, f"text={raw['text']!r}"))
+            else:
+                text = raw.strip() if isinstance(raw, str) else ""
+            if not text:
+                issues.append(_issue("dropped_todo", todo_location, repr(raw)[:60]))
+                continue
+            if text.lower() in seen:
+                issues.append(_issue("merged_todo", todo_location, text[:60]))
+            seen.add(text.lower())
+            due = raw.get("due", "") if isinstance(raw, dict) else ""
+            if due and not normalize_due_date(due):
+                issues.append(_issue("invalid_date", todo_location, f"due={due!r}"))
+
+
+def _check_project(project: dict, location: str, issues: list, ids: list):
+    if not str(project.get("name", "")).strip():
+        issues.append(_issue("renamed_project", location))
+    start = _check_date(project.get("start_date"), location, "start_date", issues)
+    end = _check_date(project.get("end_date"), location, "end_date", issues)
+    if start and end and end < start:
+        issues.append(_issue("inverted_range", location, f"{project['start_date']} > {project['end_date']}"))
+    ids.append((project.get("id"), location))
+    _check_todos(project, location, issues)
+
+    weeklies = project.get("weeklies", [])
+    if not isinstance(weeklies, list):
+        issues.append(_issue("dropped_weekly", location, "weeklies ist keine Liste"))
+        return
+    contents = set()
+    position = 0
+    for idx, weekly in enumerate(weeklies):
+        if not isinstance(weekly, dict):
+            issues.append(_issue("dropped_weekly", f"{location} > #{idx}", repr(weekly)[:60]))
+            continue
+        date_value = weekly.get("date")
+        weekly_location = f"{location} > #{position} {date_value}"
+        position += 1
+        ids.append((weekly.get("id"), weekly_location))
+        day = _check_date(date_value, weekly_location, "date", issues)
+        if day and start and end and start <= end and not start <= day <= end:
+            issues.append(_issue("out_of_range", weekly_location, f"{project['start_date']} .. {project['end_date']}"))
+        for key in FSCK_WEEKLY_FIELDS:
+            if key in weekly and not isinstance(weekly[key], str):
+                issues.append(_issue("coerced_field", weekly_location, key))
+        attachments = weekly.get("attachments")
+        if attachments is not None and not isinstance(attachments, list):
+            issues.append(_issue("dropped_attachment", weekly_location, "attachments ist keine Liste"))
+        for idx, attachment in enumerate(attachments if isinstance(attachments, list) else []):
+            if not normalize_attachments([attachment]):
+                attachment_location = f"{weekly_location} > attachments[{idx}]"
+                issues.append(_issue("dropped_attachment", attachment_location, repr(attachment)[:60]))
+        # Gleicher Text mit anderen Anhaengen ist kein Duplikat, sonst gingen bei --repair Anhaenge verloren.
+        content = (
+            (date_value,)
+            + tuple(str(weekly.get(key, "")) for key in FSCK_WEEKLY_FIELDS)
+            + (_attachment_blobs(normalize_attachments(attachments)),)
+        )
+        if content in contents:
+            issues.append(_issue("duplicate_weekly", weekly_location, str(weekly.get("title", ""))[:60]))
+        contents.add(content)
+
+
+def check_students(items: list) -> tuple[list[dict], list[tuple], dict]:
+    # Laeuft im Worker-Prozess. items: [(Name, Rohwert)]; ids werden erst im
+    # Hauptprozess ueber alle Bloecke hinweg verglichen.
+    issues, ids = [], []
+    counts = Counter()
+    for name, value in items:
+        counts["students"] += 1
+        # validate_data vergibt jeder Person eine id, auch in den Altformaten.
+        ids.append((value.get("id") if isinstance(value, dict) else None, name))
+        if isinstance(value, list):
+            issues.append(_issue("legacy_format", name, "Liste von Weeklies"))
+            projects = [{"name": "Standardprojekt", "weeklies": value}]
+        elif isinstance(value, dict) and isinstance(value.get("projects"), list):
+            projects = value["projects"]
+        elif isinstance(value, dict) and isinstance(value.get("weeklies"), list):
+            issues.append(_issue("legacy_format", name, "Weeklies direkt am Eintrag"))
+            # Wie in validate_data ein neues Projekt ohne id; die id am Eintrag gehoert der Person.
+            projects = [{"name": "Standardprojekt", **{key: item for key, item in value.items() if key != "id"}}]
+        else:
+            issues.append(_issue("dropped_student_data", name, repr(value)[:60]))
+            projects = []
+        for idx, project in enumerate(projects):
+            if not isinstance(project, dict):
+                issues.append(_issue("dropped_project", f"{name} > Projekt {idx + 1}", repr(project)[:60]))
+                continue
+            counts["projects"] += 1
+            counts["weeklies"] += len(project.get("weeklies", [])) if isinstance(project.get("weeklies"), list) else 0
+            _check_project(project, f"{name} > {project.get('name', f'Projekt {idx + 1}')}", issues, ids)
+    return issues, ids, dict(counts)
+
+
+def _check_ids(ids: list) -> list[dict]:
+    issues = []
+    seen = {}
+    for record_id, location in ids:
+        if not isinstance(record_id, str) or not record_id:
+            issues.append(_issue("missing_id", location))
+        elif record_id in seen:
+            issues.append(_issue("duplicate_id", location, f"{record_id} (zuerst: {seen[record_id]})"))
+        else:
+            seen[record_id] = location
+    return issues
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def check_data(raw, pool: ProcessPoolExecutor | None = None) -> tuple[list[dict], dict]:
+    if not isinstance(raw, dict):
+        return [_issue("dropped_student_data", "/", "JSON-Wurzel ist kein Objekt")], {}
+    students = raw.get("students", {})
+    if not isinstance(students, dict):
+        return [_issue("dropped_student_data", "students", "ist kein Objekt")], {}
+
+    items = list(students.items())
+    if pool is not None and len(items) > FSCK_CHUNK_STUDENTS:
+        results = list(pool.map(check_students, _chunks(items, FSCK_CHUNK_STUDENTS)))
+    else:
+        results = [check_students(items)]
+    issues, ids, counts = [], [], Counter()
+    for chunk_issues, chunk_ids, chunk_counts in results:
+        issues.extend(chunk_issues)
+        ids.extend(chunk_ids)
+        counts.update(chunk_counts)
+    issues.extend(_check_ids(ids))
+    return issues, dict(counts)
+
+
+def repair_data(raw: dict) -> tuple[dict, int]:
+    # validate_data (Daten, ids, TODO-Listen) und zusaetzlich doppelte Weeklies entfernen.
+    data = validate_data(raw)
+    removed = 0
+    for entry in data["students"].values():
+        for project in entry["projects"]:
+            contents = set()
+            kept = []
+            for weekly in project["weeklies"]:
+                content = tuple(weekly[key] for key in ("date",) + FSCK_WEEKLY_FIELDS)
+                content += (_attachment_blobs(weekly.get("attachments", [])),)
+                if content in contents:
+                    removed += 1
+                    continue
+                contents.add(content)
+                kept.append(weekly)
+            project["weeklies"] = kept
+    return data, removed
+
+
+def repaired_path_for(file_path: str) -> str:
+    return storage_path_for(sidecar_base_for(file_path) + ".repaired.json", storage_codec_for(file_path))
+
+
+def check_file(file_path: str, repair: bool = False, limit: int = 50, pool: ProcessPoolExecutor | None = None) -> dict:
+    started = time.perf_counter()
+    report = {"file": file_path}
+    try:
+        raw = json.loads(read_storage(file_path).decode("utf-8"))
+    except (OSError, ValueError, EOFError) as exc:
+        report["error"] = str(exc)
+        return report
+
+    issues, counts = check_data(raw, pool)
+    report.update(counts)
+    report["issues"] = len(issues)
+    report["by_kind"] = dict(Counter(issue["kind"] for issue in issues).most_common())
+    report["details"] = sorted(issues, key=lambda issue: ISSUE_ORDER[issue["kind"]])[:limit]
+    if repair and isinstance(raw, dict):
+        data, removed = repair_data(raw)
+        target = repaired_path_for(file_path)
+        chunks, _ = FragmentSerializer().encode(data)
+        write_storage_chunks(target, chunks)
+        report["repaired"] = {"file": target, "removed_duplicate_weeklies": removed}
+    report["seconds"] = round(time.perf_counter() - started, 3)
+    return report
+
+
+def _check_file_job(args: tuple) -> dict:
+    return check_file(*args)
+
+
+def check_paths(paths: list[str], repair: bool = False, jobs: int | None = None, limit: int = 50) -> list[dict]:
+    # Ordner: eine Datei je Worker. Einzelne Datei: Bloecke von Studierenden je Worker.
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if is_storage_file(name)
+                and ".repaired." not in name
+                and os.path.isfile(os.path.join(path, name))
+            )
+        else:
+            files.append(path)
+    workers = max(1, jobs or os.cpu_count() or 1)
+    if workers == 1:
+        return [check_file(path, repair, limit) for path in files]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        if len(files) == 1:
+            return [check_file(files[0], repair, limit, pool)]
+        return list(pool.map(_check_file_job, [(path, repair, limit) for path in files]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Integritaetspruefung fuer Weeklies-Dateien")
+    parser.add_argument("paths", nargs="+", help="Dateien (.json, .json.gz, .json.xz) oder Ordner")
+    parser.add_argument("--repair", action="store_true", help="reparierte Kopie neben die Datei schreiben")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker-Prozesse, Standard: CPU-Kerne")
+    parser.add_argument("--limit", type=int, default=50, help="hoechstens so viele Einzelmeldungen je Datei")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    reports = check_paths(args.paths, args.repair, args.jobs, args.limit)
+    summary = {
+        "files": reports,
+        "issues": sum(report.get("issues", 0) for report in reports),
+        "errors": sum(1 for report in reports if "error" in report),
+        "kinds": {kind: ISSUE_KINDS[kind] for report in reports for kind in report.get("by_kind", {})},
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    json.dump(summary, sys.stdout, ensure_ascii=False, indent=2)
+    print()
+    # Exit-Code wie fsck: 0 sauber, 1 Befunde, 2 nicht lesbare Dateien.
+    sys.exit(2 if summary["errors"] else 1 if summary["issues"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,56 @@
 # Python 3.10+
 # Benoetigt: PyQt6
 
+import gzip
+import hashlib
+import heapq
+import html
 import json
+import lzma
+import marshal
+import mmap
 import os
+import re
+import shutil
+import struct
 import sys
-
-from PyQt6.QtCore import QDate, Qt, pyqtSignal
-from PyQt6.QtGui import QAction, QFont, QPalette
+import threading
+import time
+import uuid
+import zlib
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import date
+
+# Startmessung: ab hier zaehlt der Import von Qt und den Hilfsmodulen.
+STARTUP_T0 = time.perf_counter()
+
+from PyQt6.QtCore import (
+    QDate,
+    QDateTime,
+    QEvent,
+    QObject,
+    QSize,
+    QStringListModel,
+    Qt,
+    QThread,
+    QTimer,
+    QUrl,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QAction, QActionGroup, QColor, QDesktopServices, QFont, QIcon, QImage, QPalette
 from PyQt6.QtWidgets import (
     QApplication,
+    QCheckBox,
+    QComboBox,
+    QCompleter,
     QDateEdit,
+    QDialog,
+    QDialogButtonBox,
     QFileDialog,
+    QFormLayout,
     QFrame,
     QGroupBox,
     QHBoxLayout,
@@ -21,18 +61,49 @@ from PyQt6.QtWidgets import (
     QListWidget,
     QListWidgetItem,
     QMainWindow,
+    QMenu,
     QMessageBox,
     QProgressBar,
     QPushButton,
     QSplitter,
     QStatusBar,
+    QStyle,
     QStyleFactory,
+    QTextBrowser,
     QTextEdit,
     QToolBar,
+    QTreeWidget,
+    QTreeWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 
+from weekly_analytics import AnalyticsEngine, iso_ordinal, project_time_progress
+from weekly_api import API_DEFAULT_PORT, ApiError, ApiServer, ApiService
+
+
+class StartupProfile:
+    # Zeitmarken der Startphasen: import, construct, first_paint, load.
+    BUDGET_MS = 1500
+
+    def __init__(self, started: float):
+        self.marks = [("start", started)]
+
+    def mark(self, phase: str):
+        self.marks.append((phase, time.perf_counter()))
+
+    def report(self) -> dict:
+        phases = {
+            f"{phase}_ms": round((stamp - previous) * 1000, 1)
+            for (_, previous), (phase, stamp) in zip(self.marks, self.marks[1:])
+        }
+        total = round((self.marks[-1][1] - self.marks[0][1]) * 1000, 1)
+        return {**phases, "total_ms": total, "budget_ms": self.BUDGET_MS, "within_budget": total <= self.BUDGET_MS}
+
+
+STARTUP_PROFILE = StartupProfile(STARTUP_T0)
+STARTUP_PROFILE.mark("import")
+
 
 WEEKDAY_SHORT_DE = {
     1: "Mo",
@@ -53,6 +124,38 @@ def normalize_iso_date(value: str, fallback: QDate | None = None) -> str:
     return qd.toString(Qt.DateFormat.ISODate)
 
 
+def normalize_due_date(value) -> str:
+    # Anders als normalize_iso_date kein Rueckfall auf heute: eine unlesbare
+    # Faelligkeit wird entfernt statt zu einer erfundenen Frist.
+    qd = QDate.fromString(str(value or ""), Qt.DateFormat.ISODate)
+    return qd.toString(Qt.DateFormat.ISODate) if qd.isValid() else ""
+
+
+TODO_PRIORITY_LABELS = {1: "hoch", 0: "normal", -1: "niedrig"}
+
+
+# Version 5: Studierende, Projekte und Weeklies tragen eine stabile "id" (wie TODOs).
+DATA_VERSION = 5
+
+
+def new_record_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def make_student_entry() -> dict:
+    return {"id": new_record_id(), "projects": []}
+
+
+def make_todo(text: str, checked: bool = False, priority: int = 0, due: str = "", todo_id: str | None = None) -> dict:
+    return {
+        "id": todo_id or new_record_id(),
+        "text": text,
+        "checked": checked,
+        "priority": priority if priority in TODO_PRIORITY_LABELS else 0,
+        "due": due,
+    }
+
+
 def normalize_todos(raw_todos) -> list[dict]:
     todos = []
     if not isinstance(raw_todos, list):
@@ -62,16 +165,305 @@ def normalize_todos(raw_todos) -> list[dict]:
         if isinstance(raw, dict):
             text = str(raw.get("text", "")).strip()
             if text:
-                todos.append({"text": text, "checked": bool(raw.get("checked", False))})
+                priority = raw.get("priority", 0)
+                todos.append(
+                    make_todo(
+                        text,
+                        bool(raw.get("checked", False)),
+                        priority if isinstance(priority, int) else 0,
+                        normalize_due_date(raw.get("due", "")),
+                        str(raw.get("id", "") or "") or None,
+                    )
+                )
         elif isinstance(raw, str):
             text = raw.strip()
             if text:
-                todos.append({"text": text, "checked": False})
+                todos.append(make_todo(text))
     return todos
 
 
+class TodoModel:
+    # Arbeitet direkt auf project["project_todos"]. Alle Aenderungen laufen ueber
+    # transaction(); on_change wird pro aeusserer Transaktion genau einmal gerufen.
+    def __init__(self, todos: list[dict], on_change=None, archive_sink=None):
+        self.todos = todos
+        self.archive_sink = archive_sink
+        for todo in todos:
+            if not todo.get("id"):
+                todo["id"] = new_record_id()
+        self._by_id = {todo["id"]: todo for todo in todos}
+        self.on_change = on_change
+        self._depth = 0
+        self._changed = False
+
+    @contextmanager
+    def transaction(self):
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0 and self._changed:
+                self._changed = False
+                if self.on_change is not None:
+                    self.on_change()
+
+    def get(self, todo_id: str) -> dict | None:
+        return self._by_id.get(todo_id)
+
+    def add(self, text: str, priority: int = 0, due: str = "") -> dict:
+        todo = make_todo(text, priority=priority, due=due)
+        with self.transaction():
+            self.todos.append(todo)
+            self._by_id[todo["id"]] = todo
+            self._changed = True
+        return todo
+
+    def update(self, todo_id: str, **fields) -> bool:
+        todo = self._by_id.get(todo_id)
+        if todo is None:
+            return False
+        changed = {key: value for key, value in fields.items() if todo.get(key) != value}
+        if changed:
+            with self.transaction():
+                todo.update(changed)
+                self._changed = True
+        return bool(changed)
+
+    def reorder(self, todo_ids: list[str]):
+        ordered = [self._by_id[todo_id] for todo_id in todo_ids if todo_id in self._by_id]
+        if len(ordered) != len(self.todos) or all(a is b for a, b in zip(ordered, self.todos)):
+            return
+        with self.transaction():
+            self.todos[:] = ordered
+            self._changed = True
+
+    def set_all_checked(self, checked: bool = True) -> int:
+        count = 0
+        with self.transaction():
+            for todo in self.todos:
+                if todo["checked"] != checked:
+                    todo["checked"] = checked
+                    count += 1
+            self._changed = self._changed or count > 0
+        return count
+
+    def take(self, todo_ids) -> list[dict]:
+        wanted = set(todo_ids)
+        taken = [todo for todo in self.todos if todo["id"] in wanted]
+        if taken:
+            with self.transaction():
+                self.todos[:] = [todo for todo in self.todos if todo["id"] not in wanted]
+                for todo in taken:
+                    del self._by_id[todo["id"]]
+                self._changed = True
+        return taken
+
+    def extend(self, todos: list[dict]):
+        if not todos:
+            return
+        with self.transaction():
+            for todo in todos:
+                if todo["id"] in self._by_id:
+                    todo["id"] = new_record_id()
+                self.todos.append(todo)
+                self._by_id[todo["id"]] = todo
+            self._changed = True
+
+    def take_completed(self) -> list[dict]:
+        return self.take([todo["id"] for todo in self.todos if todo["checked"]])
+
+    def archive_completed(self) -> int:
+        if self.archive_sink is None:
+            return 0
+        with self.transaction():
+            completed = self.take_completed()
+            if completed:
+                self.archive_sink(completed)
+        return len(completed)
+
+
+def todo_archive_path_for(json_path: str) -> str:
+    return sidecar_base_for(json_path) + ".todo-archive.ndjson.gz"
+
+
+class TodoColdStore:
+    # Archivierte TODOs liegen getrennt von der Hauptdatei als NDJSON in
+    # angehaengten gzip-Members. Schreiben haengt nur an; gelesen wird erst,
+    # wenn jemand das Archiv abfragt.
+    def __init__(self, path: str):
+        self.path = path
+
+    def append(self, records: list[dict]):
+        if not records:
+            return
+        payload = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with open(self.path, "ab") as handle:
+            handle.write(gzip.compress(payload.encode("utf-8")))
+
+    def iter_records(self):
+        if not os.path.exists(self.path):
+            return
+        with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    @staticmethod
+    def _matches_student(record: dict, student: str | None, student_id: str | None) -> bool:
+        # Ueber die id, damit Umbenennen nichts verliert; Eintraege ohne id ueber den Namen.
+        if student_id is not None and record.get("student_id"):
+            return record["student_id"] == student_id
+        return student is None or record.get("student") == student
+
+    def query(
+        self,
+        student: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        text: str = "",
+        student_id: str | None = None,
+    ) -> list[dict]:
+        needle = text.strip().lower()
+        return [
+            record
+            for record in self.iter_records()
+            if self._matches_student(record, student, student_id)
+            and (since is None or record.get("archived_at", "") >= since)
+            and (until is None or record.get("archived_at", "") <= until)
+            and (not needle or needle in record.get("text", "").lower())
+        ]
+
+
+def change_feed_path_for(json_path: str) -> str:
+    return sidecar_base_for(json_path) + ".changes.ndjson"
+
+
+# Aenderungen werden je Datensatz gesammelt und erst geschrieben, wenn so lange
+# nichts mehr geaendert wurde (oder bei Auswahlwechsel, Dateiwechsel, Schliessen).
+CHANGE_FEED_DEBOUNCE_MS = 2000
+CHANGE_FEED_TAIL_BLOCK = 65536
+
+
+class ChangeFeed:
+    # Append-only NDJSON mit fortlaufender seq. Verbraucher merken sich die
+    # letzte gelesene seq und lesen danach nur noch neue Zeilen.
+    def __init__(self, path: str):
+        self.path = path
+        self.last_seq = self._read_last_seq()
+
+    def _read_last_seq(self) -> int:
+        # Blockweise von hinten lesen, bis eine vollstaendige Zeile eine seq liefert;
+        # eine einzelne Zeile darf laenger als ein Block sein.
+        try:
+            handle = open(self.path, "rb")
+        except OSError:
+            return 0
+        with handle:
+            position = handle.seek(0, os.SEEK_END)
+            head = b""
+            while position > 0:
+                step = min(CHANGE_FEED_TAIL_BLOCK, position)
+                position -= step
+                handle.seek(position)
+                lines = (handle.read(step) + head).split(b"\n")
+                head = lines.pop(0) if position > 0 else b""
+                for line in reversed(lines):
+                    try:
+                        return int(json.loads(line)["seq"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        return 0
+
+    def append(self, events: list[dict]) -> int:
+        if not events:
+            return self.last_seq
+        timestamp = QDateTime.currentDateTimeUtc().toString(Qt.DateFormat.ISODateWithMs)
+        lines = []
+        for event in events:
+            self.last_seq += 1
+            lines.append(json.dumps({"seq": self.last_seq, "ts": timestamp, **event}, ensure_ascii=False) + "\n")
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write("".join(lines))
+        return self.last_seq
+
+
+TODO_FEED_FIELDS = ("text", "checked", "priority", "due")
+
+
+def todo_feed_state(todos: list[dict]) -> dict:
+    # Stand der TODOs eines Projekts, wie er zuletzt ins Protokoll ging (Reihenfolge = Schluessel).
+    return {todo["id"]: tuple(todo.get(key) for key in TODO_FEED_FIELDS) for todo in todos}
+
+
+def diff_todos(before: dict, todos: list[dict]) -> dict:
+    # Nur Neues, Entferntes, geaenderte Felder und ggf. die neue Reihenfolge.
+    after = {todo["id"]: todo for todo in todos}
+    diff = {}
+    added = [dict(todo) for todo_id, todo in after.items() if todo_id not in before]
+    removed = [todo_id for todo_id in before if todo_id not in after]
+    updated = {}
+    for todo_id, values in before.items():
+        todo = after.get(todo_id)
+        if todo is not None:
+            changed = {key: todo.get(key) for key, old in zip(TODO_FEED_FIELDS, values) if todo.get(key) != old}
+            if changed:
+                updated[todo_id] = changed
+    if added:
+        diff["added"] = added
+    if removed:
+        diff["removed"] = removed
+    if updated:
+        diff["updated"] = updated
+    # Reihenfolge nur, wenn sie nicht "Bisherige, dann Neue am Ende" ist.
+    if list(after) != [todo_id for todo_id in before if todo_id in after] + [todo["id"] for todo in added]:
+        diff["order"] = list(after)
+    return diff
+
+
+def read_change_feed(path: str, cursor: int = 0):
+    try:
+        handle = open(path, "r", encoding="utf-8")
+    except OSError:
+        return
+    with handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            event = json.loads(line)
+            if event.get("seq", 0) > cursor:
+                yield event
+
+
+def make_archive_records(
+    todos: list[dict],
+    student_name: str,
+    project_name: str,
+    archived_at: str,
+    project_id: str | None = None,
+    student_id: str | None = None,
+) -> list[dict]:
+    return [
+        {
+            "archived_at": archived_at,
+            "student": student_name,
+            "student_id": student_id,
+            "project": project_name,
+            "project_id": project_id,
+            "id": todo["id"],
+            "text": todo["text"],
+            "priority": todo.get("priority", 0),
+            "due": todo.get("due", ""),
+        }
+        for todo in todos
+    ]
+
+
 def make_empty_weekly(date_str: str, planned: str = "") -> dict:
     return {
+        "id": new_record_id(),
         "date": normalize_iso_date(date_str),
         "title": "",
         "planned": planned,
@@ -80,8 +472,522 @@ def make_empty_weekly(date_str: str, planned: str = "") -> dict:
     }
 
 
+WEEKLY_TEMPLATE_FIELDS = ("title", "planned", "done", "next_planned")
+
+
+def load_weekly_templates(file_path: str) -> list[dict]:
+    try:
+        with open(file_path, "r", encoding="utf-8") as handle:
+            raw = json.load(handle)
+    except (OSError, ValueError):
+        return []
+
+    templates = []
+    for entry in raw.get("templates", []) if isinstance(raw, dict) else []:
+        if isinstance(entry, dict) and str(entry.get("name", "")).strip():
+            template = {"name": str(entry["name"]).strip()}
+            template.update({key: str(entry.get(key, "")) for key in WEEKLY_TEMPLATE_FIELDS})
+            templates.append(template)
+    return templates
+
+
+def save_weekly_templates(file_path: str, templates: list[dict]):
+    with open(file_path, "w", encoding="utf-8") as handle:
+        json.dump({"version": 1, "templates": templates}, handle, ensure_ascii=False, indent=2)
+
+
+_PHRASE_BULLET_RE = re.compile(r"^\s*(?:[-*\u2022]|\d+[.)])\s*")
+
+
+def extract_phrases(text: str):
+    for line in text.splitlines():
+        phrase = _PHRASE_BULLET_RE.sub("", line).strip()
+        if PhraseCache.PREFIX_LEN <= len(phrase) <= 160:
+            yield phrase
+
+
+class PhraseCache:
+    # Haeufigkeitsgewichtete Satzbausteine fuer die Autovervollstaendigung.
+    # Begrenzt auf max_entries (LRU-Verdraengung). Lookups gehen ueber einen
+    # Index der ersten PREFIX_LEN Zeichen und sehen nie den ganzen Cache an;
+    # beim Weitertippen wird nur das vorige Ergebnis weiter gefiltert.
+    PREFIX_LEN = 3
+
+    def __init__(self, max_entries: int = 4000, loader=None):
+        self.max_entries = max_entries
+        self._loader = loader
+        self._counts = OrderedDict()
+        self._by_prefix = {}
+        self._last_lookup = None
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loader is None
+
+    def reset(self, loader=None):
+        self._loader = loader
+        self._counts.clear()
+        self._by_prefix.clear()
+        self._last_lookup = None
+
+    def _ensure_loaded(self):
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            for text in loader():
+                self.add_text(text)
+
+    def add(self, phrase: str, weight: int = 1):
+        if phrase in self._counts:
+            self._counts[phrase] += weight
+            self._counts.move_to_end(phrase)
+            return
+
+        self._last_lookup = None
+        lowered = phrase.lower()
+        self._counts[phrase] = weight
+        self._by_prefix.setdefault(lowered[: self.PREFIX_LEN], {})[phrase] = lowered
+        if len(self._counts) > self.max_entries:
+            evicted, _ = self._counts.popitem(last=False)
+            # Gleicher Schluessel wie beim Einfuegen: erst lower(), dann kuerzen
+            # ("İ".lower() ist zwei Zeichen lang).
+            bucket_key = evicted.lower()[: self.PREFIX_LEN]
+            bucket = self._by_prefix[bucket_key]
+            del bucket[evicted]
+            if not bucket:
+                del self._by_prefix[bucket_key]
+
+    def add_text(self, text: str):
+        for phrase in extract_phrases(text):
+            self.add(phrase)
+
+    def lookup(self, prefix: str, limit: int = 8) -> list[str]:
+        needle = prefix.strip().lower()
+        if len(needle) < self.PREFIX_LEN:
+            return []
+        self._ensure_loaded()
+
+        if self._last_lookup is not None and needle.startswith(self._last_lookup[0]):
+            candidates = self._last_lookup[1]
+        else:
+            candidates = self._by_prefix.get(needle[: self.PREFIX_LEN], {}).items()
+        matches = [(phrase, lowered) for phrase, lowered in candidates if lowered.startswith(needle)]
+        self._last_lookup = (needle, matches)
+        return heapq.nlargest(
+            limit, (phrase for phrase, lowered in matches if len(lowered) > len(needle)), key=self._counts.__getitem__
+        )
+
+
+class SwitcherIndex:
+    # Trigramm- und Wortpraefix-Index fuer den Schnellwechsler (Ctrl+K), getrennt
+    # nach Ebene: (student,), (student, projekt), (student, projekt, weekly).
+    # Wird je Studierende aktualisiert, nie komplett neu aufgebaut.
+    # Rangfolge: exakte Treffer vor unscharfen, hoehere Ebene vor tieferer. Deshalb
+    # werden Ebenen der Reihe nach bewertet, bis genug Treffer da sind; breite
+    # Anfragen wie "st" sehen so nur die Studierenden an.
+    LEVELS = 3
+    COMMON_TRIGRAM_SHARE = 4
+
+    def __init__(self):
+        self.entries: dict[tuple, tuple[str, str]] = {}
+        self._trigrams: list[dict[str, set]] = [{} for _ in range(self.LEVELS)]
+        self._prefixes: list[dict[str, set]] = [{} for _ in range(self.LEVELS)]
+        self._by_student: dict[str, list[tuple]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def _keys(search: str):
+        grams = {search[i : i + 3] for i in range(len(search) - 2)}
+        prefixes = set()
+        for word in search.split():
+            prefixes.add(word[:1])
+            prefixes.add(word[:2])
+        return grams, prefixes
+
+    def _add(self, path: tuple, label: str, search: str):
+        search = search.lower()
+        self.entries[path] = (label, search)
+        grams, prefixes = self._keys(search)
+        level = len(path) - 1
+        for gram in grams:
+            self._trigrams[level].setdefault(gram, set()).add(path)
+        for prefix in prefixes:
+            self._prefixes[level].setdefault(prefix, set()).add(path)
+
+    def _remove(self, path: tuple):
+        _, search = self.entries.pop(path)
+        grams, prefixes = self._keys(search)
+        level = len(path) - 1
+        for index, keys in ((self._trigrams[level], grams), (self._prefixes[level], prefixes)):
+            for key in keys:
+                bucket = index[key]
+                bucket.discard(path)
+                if not bucket:
+                    del index[key]
+
+    def rebuild(self, students: Mapping):
+        self.entries.clear()
+        for index in (*self._trigrams, *self._prefixes):
+            index.clear()
+        self._by_student.clear()
+        for name, entry in students.items():
+            self.update_student(name, entry)
+
+    def update_student(self, name: str, entry: dict | None):
+        for path in self._by_student.pop(name, []):
+            self._remove(path)
+        if entry is None:
+            return
+
+        paths = [(name,)]
+        self._add((name,), name, name)
+        for project_idx, project in enumerate(entry.get("projects", [])):
+            project_name = str(project.get("name", "")).strip() or f"Projekt {project_idx + 1}"
+            path = (name, project_idx)
+            self._add(path, f"{name} / {project_name}", f"{name} {project_name}")
+            paths.append(path)
+            for weekly_idx, weekly in enumerate(project.get("weeklies", [])):
+                iso_date = str(weekly.get("date", ""))
+                de_date = ".".join(reversed(iso_date.split("-")))
+                title = str(weekly.get("title", "")).strip() or "Ohne Titel"
+                path = (name, project_idx, weekly_idx)
+                self._add(
+                    path,
+                    f"{name} / {project_name} / {de_date} {title}",
+                    f"{name} {project_name} {iso_date} {de_date} {title}",
+                )
+                paths.append(path)
+        self._by_student[name] = paths
+
+    def _strict(self, level: int, needle: str, grams: set) -> set:
+        if len(needle) < 3:
+            return self._prefixes[level].get(needle, set())
+        buckets = sorted((self._trigrams[level].get(gram, set()) for gram in grams), key=len)
+        return set(buckets[0]).intersection(*buckets[1:]) if buckets[0] else set()
+
+    def query(self, text: str, limit: int = 20) -> list[tuple[tuple, str]]:
+        needle = " ".join(text.lower().split())
+        if not needle:
+            return []
+        grams, _ = self._keys(needle)
+        entries = self.entries
+
+        def quality(path):
+            search = entries[path][1]
+            if search.startswith(needle):
+                return 3
+            if f" {needle}" in search:
+                return 2
+            return 1 if needle in search else 0
+
+        def rank(candidates, key, room):
+            return [(path, entries[path][0]) for path in heapq.nlargest(room, candidates, key=key)]
+
+        results = []
+        seen = set()
+        for level in range(self.LEVELS):
+            candidates = self._strict(level, needle, grams)
+            if candidates:
+                results.extend(rank(candidates, lambda p: (quality(p), -len(entries[p][1])), limit - len(results)))
+                seen |= candidates
+            if len(results) >= limit:
+                return results
+
+        if len(needle) < 3:
+            return results
+        # Tippfehler: Eintraege, die mindestens die Haelfte der Trigramme teilen.
+        common = max(limit, len(entries) // self.COMMON_TRIGRAM_SHARE)
+        hits = Counter()
+        for level in range(self.LEVELS):
+            for gram in grams:
+                bucket = self._trigrams[level].get(gram)
+                if bucket and len(bucket) <= common:
+                    hits.update(bucket)
+        needed = max(1, len(grams) // 2)
+        fuzzy = [path for path, count in hits.items() if count >= needed and path not in seen]
+        results.extend(rank(fuzzy, lambda p: (hits[p], -len(p), -len(entries[p][1])), limit - len(results)))
+        return results
+
+
+BULK_FIELD_LABELS = {
+    "title": "Titel",
+    "planned": "Was war geplant?",
+    "done": "Was wurde gemacht?",
+    "next_planned": "Was ist geplant?",
+    "text": "TODO",
+}
+BULK_WEEKLY_FIELDS = ("title", "planned", "done", "next_planned")
+
+
+def regex_literals(pattern: str) -> list[str]:
+    # Literale Stuecke (>= 3 Zeichen), die jeder Treffer enthalten muss. Bei
+    # Alternativen und Gruppen-Erweiterungen lieber gar nichts vorfiltern.
+    if "|" in pattern or "(?" in pattern or re.search(r"\)[?*{]", pattern):
+        return []
+    runs, current, idx = [], "", 0
+
+    def flush():
+        nonlocal current
+        if len(current) >= 3:
+            runs.append(current)
+        current = ""
+
+    while idx < len(pattern):
+        char = pattern[idx]
+        if char == "\\":
+            flush()
+            idx += 2
+            continue
+        if char in "[{":
+            if char == "{":
+                current = current[:-1]
+            flush()
+            idx = pattern.find("]" if char == "[" else "}", idx + 1)
+            if idx < 0:
+                return runs
+        elif char in "?*":
+            current = current[:-1]
+            flush()
+        elif char in ".^$()+":
+            flush()
+        else:
+            current += char
+        idx += 1
+    flush()
+    return runs
+
+
+class TextIndex:
+    # Trigramm-Index ueber Weekly-Felder und TODO-Texte fuer Suchen & Ersetzen.
+    # Ein Eintrag je Feld: (Projekt-id, Datensatz-id, Feld) -> (Studierende, Projekt,
+    # Datensatz, Feld, Text in Kleinbuchstaben). Trigramme zeigen auf verschiedene
+    # Texte, nicht auf Eintraege; wiederholte Texte (planned = voriges next_planned)
+    # werden so nur einmal zerlegt. Geaenderte Studierende werden nur markiert und
+    # vor der naechsten Abfrage neu eingelesen.
+    def __init__(self, students: Mapping):
+        self.students = students
+        self.entries: dict[tuple, tuple] = {}
+        self._texts: dict[str, set] = {}
+        self._trigrams: dict[str, set] = {}
+        self._by_student: dict[str, list[tuple]] = {}
+        self._dirty = set(students)
+
+    def mark_dirty(self, name: str):
+        self._dirty.add(name)
+
+    def _add(self, key: tuple, student_name: str, project: dict, record: dict, field: str):
+        lowered = str(record.get(field, "")).lower()
+        self.entries[key] = (student_name, project, record, field, lowered)
+        keys = self._texts.get(lowered)
+        if keys is None:
+            keys = self._texts[lowered] = set()
+            for gram in {lowered[i : i + 3] for i in range(len(lowered) - 2)}:
+                self._trigrams.setdefault(gram, set()).add(lowered)
+        keys.add(key)
+        return key
+
+    def _remove(self, key: tuple):
+        lowered = self.entries.pop(key)[4]
+        keys = self._texts[lowered]
+        keys.discard(key)
+        if keys:
+            return
+        del self._texts[lowered]
+        for gram in {lowered[i : i + 3] for i in range(len(lowered) - 2)}:
+            bucket = self._trigrams[gram]
+            bucket.discard(lowered)
+            if not bucket:
+                del self._trigrams[gram]
+
+    def _update_student(self, name: str, entry: dict | None):
+        for key in self._by_student.pop(name, []):
+            self._remove(key)
+        if entry is None:
+            return
+        keys = []
+        for project in entry.get("projects", []):
+            for weekly in project.get("weeklies", []):
+                for field in BULK_WEEKLY_FIELDS:
+                    keys.append(self._add((project["id"], weekly["id"], field), name, project, weekly, field))
+            for todo in project.get("project_todos", []):
+                keys.append(self._add((project["id"], todo["id"], "text"), name, project, todo, "text"))
+        self._by_student[name] = keys
+
+    def candidates(self, literals: list[str], student: str | None = None, project: dict | None = None) -> list[tuple]:
+        for name in self._dirty:
+            self._update_student(name, self.students.get(name))
+        self._dirty.clear()
+
+        needles = [literal.lower() for literal in literals]
+        grams = {needle[i : i + 3] for needle in needles for i in range(len(needle) - 2)}
+        hits = None
+        if grams:
+            buckets = sorted((self._trigrams.get(gram, set()) for gram in grams), key=len)
+            texts = set(buckets[0]).intersection(*buckets[1:]) if buckets[0] else set()
+            hits = set()
+            for text in texts:
+                if all(needle in text for needle in needles):
+                    hits.update(self._texts[text])
+        if student is not None:
+            names = [student]
+        else:
+            names = sorted(self._by_student if hits is None else {self.entries[key][0] for key in hits}, key=str.lower)
+
+        results = []
+        for name in names:
+            for key in self._by_student.get(name, []):
+                if hits is not None and key not in hits:
+                    continue
+                entry = self.entries[key]
+                if (project is None or entry[1] is project) and all(needle in entry[4] for needle in needles):
+                    results.append(entry[:4])
+        return results
+
+
+def find_replacements(
+    index: TextIndex,
+    pattern: str,
+    replacement: str,
+    regex: bool = False,
+    case_sensitive: bool = False,
+    student: str | None = None,
+    project: dict | None = None,
+    fields: tuple = BULK_WEEKLY_FIELDS + ("text",),
+) -> list[dict]:
+    # re.error (ungueltiges Muster oder Ersetzung) geht an den Aufrufer.
+    compiled = re.compile(pattern if regex else re.escape(pattern), 0 if case_sensitive else re.IGNORECASE)
+    template = replacement if regex else (lambda _match: replacement)
+    literals = regex_literals(pattern) if regex else [pattern]
+    matches = []
+    for student_name, owner, record, field in index.candidates(literals, student, project):
+        if field not in fields:
+            continue
+        before = str(record.get(field, ""))
+        after, count = compiled.subn(template, before)
+        if not count or after == before:
+            continue
+        if field == "text":
+            location = f"{student_name} / {owner.get('name', 'Projekt')} / TODO"
+        else:
+            location = f"{student_name} / {owner.get('name', 'Projekt')} / {record.get('date', '')}"
+        matches.append(
+            {
+                "student": student_name,
+                "project": owner,
+                "record": record,
+                "field": field,
+                "location": location,
+                "before": before,
+                "after": after,
+                "count": count,
+            }
+        )
+    return matches
+
+
+# Filter fuer Studierenden- und Projektliste. "stale" gilt fuer Studierende, wenn
+# das letzte Weekly ueber alle Projekte zu alt ist, die uebrigen, wenn ein
+# Projekt zutrifft.
+FILTER_PREDICATES = {
+    "stale": "Kein Weekly seit 14 Tagen",
+    "overdue": "Abgelaufen mit offenen TODOs",
+    "late_phase": "Projektzeit zu ueber 80% um",
+}
+FILTER_STALE_DAYS = 14
+FILTER_LATE_PHASE = 80
+FILTER_FIELDS = {"date", "start_date", "end_date"}
+
+
+class PredicateIndex:
+    # Vorberechnete Treffermengen je Filter: Studierende (Namen) und Projekte (ids).
+    # Je Projekt werden nur Kennzahlen gehalten (Start, Ende, offene TODOs, letztes
+    # Weekly). Geaenderte Studierende werden vor der naechsten Abfrage neu
+    # eingelesen; ein neuer Tag bewertet die Kennzahlen neu, ohne die Daten zu lesen.
+    def __init__(self, students: Mapping):
+        self.students = students
+        self.today = 0
+        self.student_sets: dict[str, set] = {name: set() for name in FILTER_PREDICATES}
+        self.project_sets: dict[str, set] = {name: set() for name in FILTER_PREDICATES}
+        self._facts: dict[str, list[tuple]] = {}
+        self._dirty = set(students)
+
+    def mark_dirty(self, name: str):
+        self._dirty.add(name)
+
+    @staticmethod
+    def _project_facts(project: dict) -> tuple:
+        last_weekly = max((str(weekly.get("date", "")) for weekly in project.get("weeklies", [])), default="")
+        return (
+            project["id"],
+            iso_ordinal(project.get("start_date", "")),
+            iso_ordinal(project.get("end_date", "")),
+            sum(1 for todo in project.get("project_todos", []) if not todo.get("checked")),
+            iso_ordinal(last_weekly) if last_weekly else 0,
+        )
+
+    def _classify(self, name: str, facts: list[tuple] | None):
+        for old in self._facts.pop(name, ()):
+            for members in self.project_sets.values():
+                members.discard(old[0])
+        for members in self.student_sets.values():
+            members.discard(name)
+        if facts is None:
+            return
+
+        self._facts[name] = facts
+        latest = 0
+        for project_id, start, end, open_todos, last_weekly in facts:
+            latest = max(latest, last_weekly)
+            flags = []
+            if self.today - last_weekly > FILTER_STALE_DAYS:
+                flags.append("stale")
+            if end and self.today > end and open_todos:
+                flags.append("overdue")
+            progress = project_time_progress(start, end, self.today)
+            if progress is not None and progress > FILTER_LATE_PHASE:
+                flags.append("late_phase")
+            for flag in flags:
+                self.project_sets[flag].add(project_id)
+                if flag != "stale":
+                    self.student_sets[flag].add(name)
+        if self.today - latest > FILTER_STALE_DAYS:
+            self.student_sets["stale"].add(name)
+
+    def _refresh(self, today: int | None):
+        today = today or date.today().toordinal()
+        if today != self.today:
+            self.today = today
+            for name, facts in list(self._facts.items()):
+                self._classify(name, facts)
+        for name in self._dirty:
+            entry = self.students.get(name)
+            self._classify(name, [self._project_facts(project) for project in entry["projects"]] if entry else None)
+        self._dirty.clear()
+
+    def matching_students(self, filters, today: int | None = None) -> set:
+        self._refresh(today)
+        return set.intersection(*(self.student_sets[name] for name in filters))
+
+    def matching_projects(self, filters, today: int | None = None) -> set:
+        self._refresh(today)
+        return set.intersection(*(self.project_sets[name] for name in filters))
+
+
+def _change_snippet(before: str, after: str, width: int = 80) -> tuple[str, str]:
+    # Ausschnitt ab kurz vor der ersten Abweichung, einzeilig fuer die Vorschau.
+    start = next((idx for idx, (a, b) in enumerate(zip(before, after)) if a != b), min(len(before), len(after)))
+    left = max(0, start - 20)
+    prefix = "..." if left else ""
+    return tuple(prefix + text[left : left + width].replace("\n", " | ") for text in (before, after))
+
+
 def make_empty_project(name: str, start_date: str, end_date: str) -> dict:
     return {
+        "id": new_record_id(),
         "name": name.strip() or "Projekt",
         "start_date": normalize_iso_date(start_date),
         "end_date": normalize_iso_date(end_date),
@@ -103,17 +1009,38 @@ def _merge_old_todo_buckets(raw_project: dict) -> list[dict]:
     return combined
 
 
-def _clean_weekly(raw_weekly: dict) -> dict:
-    return {
+def _claim_record_id(raw: dict, seen: set, position: tuple) -> str:
+    # Vorhandene ids bleiben erhalten. Fehlende oder doppelte (z. B. kopierte Eintraege)
+    # werden aus der Position abgeleitet, damit eine noch nicht gespeicherte Altdatei
+    # bei jedem Laden dieselben ids bekommt. Position: (Name,), (Name, Projekt) oder
+    # (Name, Projekt, Weekly), als JSON-Liste eindeutig auch fuer Namen wie "A/0".
+    record_id = raw.get("id")
+    if not isinstance(record_id, str) or not record_id or record_id in seen:
+        encoded = json.dumps(position, ensure_ascii=False).encode("utf-8")
+        record_id = hashlib.blake2b(encoded, digest_size=6).hexdigest()
+        if record_id in seen:
+            record_id = new_record_id()
+    seen.add(record_id)
+    return record_id
+
+
+def _clean_weekly(raw_weekly: dict, seen: set, position: tuple) -> dict:
+    cleaned = {
+        "id": _claim_record_id(raw_weekly, seen, position),
         "date": normalize_iso_date(raw_weekly.get("date", QDate.currentDate().toString(Qt.DateFormat.ISODate))),
         "title": str(raw_weekly.get("title", "")),
         "planned": str(raw_weekly.get("planned", "")),
         "done": str(raw_weekly.get("done", "")),
         "next_planned": str(raw_weekly.get("next_planned", "")),
     }
+    # Nur Weeklies mit Anhaengen tragen das Feld; alle anderen bleiben byteweise wie bisher.
+    attachments = normalize_attachments(raw_weekly.get("attachments"))
+    if attachments:
+        cleaned["attachments"] = attachments
+    return cleaned
 
 
-def _clean_project(raw_project: dict, fallback_name: str) -> dict:
+def _clean_project(raw_project: dict, fallback_name: str, seen: set, position: tuple) -> dict:
     project_name = str(raw_project.get("name", fallback_name)).strip() or fallback_name
     start_date = normalize_iso_date(raw_project.get("start_date", QDate.currentDate().toString(Qt.DateFormat.ISODate)))
     end_date = normalize_iso_date(raw_project.get("end_date", QDate.currentDate().addDays(90).toString(Qt.DateFormat.ISODate)))
@@ -125,9 +1052,10 @@ def _clean_project(raw_project: dict, fallback_name: str) -> dict:
     weeklies = []
     for raw_weekly in raw_weeklies:
         if isinstance(raw_weekly, dict):
-            weeklies.append(_clean_weekly(raw_weekly))
+            weeklies.append(_clean_weekly(raw_weekly, seen, (*position, len(weeklies))))
 
     return {
+        "id": _claim_record_id(raw_project, seen, position),
         "name": project_name,
         "start_date": start_date,
         "end_date": end_date,
@@ -136,7 +1064,12 @@ def _clean_project(raw_project: dict, fallback_name: str) -> dict:
     }
 
 
-def validate_data(data: dict) -> dict:
+# Stand der Regeln in validate_data und den normalize_*-Funktionen. Bei jeder Aenderung
+# erhoehen: Snapshots enthalten schon validierte Daten und wuerden sonst weiter gelten.
+VALIDATION_RULES = 5
+
+
+def validate_data(data: dict, progress=None) -> dict:
     if not isinstance(data, dict):
         raise ValueError("JSON-Wurzel muss ein Objekt sein.")
 
@@ -144,9 +1077,12 @@ def validate_data(data: dict) -> dict:
     if not isinstance(students_raw, dict):
         students_raw = {}
 
-    cleaned = {"version": 4, "students": {}}
+    cleaned = {"version": DATA_VERSION, "students": {}}
+    seen_ids = set()
 
-    for student_name, student_value in students_raw.items():
+    for done_count, (student_name, student_value) in enumerate(students_raw.items()):
+        if progress is not None:
+            progress(done_count, len(students_raw))
         if not isinstance(student_name, str):
             continue
 
@@ -163,6 +1099,8 @@ def validate_data(data: dict) -> dict:
                         "weeklies": student_value,
                     },
                     "Standardprojekt",
+                    seen_ids,
+                    (student_name, 0),
                 )
             )
         elif isinstance(student_value, dict):
@@ -170,7 +1108,8 @@ def validate_data(data: dict) -> dict:
             if isinstance(raw_projects, list):
                 for idx, raw_project in enumerate(raw_projects):
                     if isinstance(raw_project, dict):
-                        projects.append(_clean_project(raw_project, f"Projekt {idx + 1}"))
+                        position = (student_name, len(projects))
+                        projects.append(_clean_project(raw_project, f"Projekt {idx + 1}", seen_ids, position))
             elif isinstance(student_value.get("weeklies"), list):
                 projects.append(
                     _clean_project(
@@ -184,32 +1123,1513 @@ def validate_data(data: dict) -> dict:
                             "project_todos_later": student_value.get("project_todos_later", []),
                         },
                         "Standardprojekt",
+                        seen_ids,
+                        (student_name, 0),
                     )
                 )
 
-        cleaned["students"][student_name] = {"projects": projects}
+        raw_student = student_value if isinstance(student_value, dict) else {}
+        student_id = _claim_record_id(raw_student, seen_ids, (student_name,))
+        cleaned["students"][student_name] = {"id": student_id, "projects": projects}
 
+    if progress is not None:
+        progress(len(students_raw), len(students_raw))
     return cleaned
 
 
+class RecordIndex:
+    # id -> Datensatz, id -> Eltern-id und id -> Position in der Liste der Eltern fuer
+    # Studierende, Projekte und Weeklies. Studierende bleiben in den Daten nach Namen
+    # geschluesselt; names haelt den aktuellen Namen je id.
+    def __init__(self):
+        self.records = {}
+        self.parents = {}
+        self.names = {}
+        self.positions = {}
+
+    def rebuild(self, students: Mapping):
+        self.records.clear()
+        self.parents.clear()
+        self.names.clear()
+        self.positions.clear()
+        for name, entry in students.items():
+            self.add_student(name, entry)
+
+    def add_student(self, name: str, entry: dict):
+        self.records[entry["id"]] = entry
+        self.parents[entry["id"]] = None
+        self.names[entry["id"]] = name
+        for position, project in enumerate(entry.get("projects", [])):
+            self.add_project(entry["id"], project, position)
+
+    def add_project(self, student_id: str, project: dict, position: int):
+        self.records[project["id"]] = project
+        self.parents[project["id"]] = student_id
+        self.positions[project["id"]] = position
+        for weekly_position, weekly in enumerate(project.get("weeklies", [])):
+            self.add_weekly(project["id"], weekly, weekly_position)
+
+    def add_weekly(self, project_id: str, weekly: dict, position: int):
+        self.records[weekly["id"]] = weekly
+        self.parents[weekly["id"]] = project_id
+        self.positions[weekly["id"]] = position
+
+    def discard(self, record_id: str):
+        # Nach dem Entfernen aus der Liste der Eltern: die nachfolgenden Geschwister ruecken auf.
+        parent = self.records.get(self.parents.get(record_id))
+        position = self.positions.get(record_id)
+        self._forget(record_id)
+        if parent is not None and position is not None:
+            siblings = parent.get("projects") or parent.get("weeklies", [])
+            for index in range(position, len(siblings)):
+                self.positions[siblings[index]["id"]] = index
+
+    def _forget(self, record_id: str):
+        record = self.records.pop(record_id, None)
+        self.parents.pop(record_id, None)
+        self.names.pop(record_id, None)
+        self.positions.pop(record_id, None)
+        if record is None:
+            return
+        for child in record.get("projects", ()) or record.get("weeklies", ()):
+            self._forget(child["id"])
+
+    def get(self, record_id: str) -> dict | None:
+        return self.records.get(record_id)
+
+    def lineage(self, record_id: str) -> tuple[str, str | None, str | None] | None:
+        # (Studierende, Projekt-id, Weekly-id) ueber die Eltern-ids.
+        chain = []
+        while record_id is not None:
+            if record_id not in self.records:
+                return None
+            chain.append(record_id)
+            record_id = self.parents[record_id]
+        chain.reverse()
+        chain += [None] * (3 - len(chain))
+        return self.names[chain[0]], chain[1], chain[2]
+
+    def path(self, record_id: str) -> tuple[str, int | None, int | None] | None:
+        # (Studierende, Projektindex, Weeklyindex) fuer Aenderungsprotokoll und Schnellwechsler.
+        lineage = self.lineage(record_id)
+        if lineage is None:
+            return None
+        name, project_id, weekly_id = lineage
+        return name, self.positions.get(project_id), self.positions.get(weekly_id)
+
+
+# Speicherformat: Klartext-JSON oder komprimiert. Geschrieben wird nach der Endung
+# (weeklies.json.gz, weeklies.json.xz); beim Lesen entscheidet die Signatur, damit
+# auch umbenannte Dateien laden. Beide Richtungen laufen blockweise durch den Codec.
+STORAGE_CODECS = {
+    "json": ("", None),
+    "gzip": (".gz", b"\x1f\x8b"),
+    "lzma": (".xz", b"\xfd7zXZ\x00"),
+}
+STORAGE_LABELS = {"json": "JSON", "gzip": "gzip (.gz)", "lzma": "lzma (.xz)"}
+STORAGE_GZIP_LEVEL = 6
+STORAGE_LZMA_PRESET = 2
+STORAGE_WRITE_BLOCK = 1 << 16
+
+
+def storage_codec_for(file_path: str) -> str:
+    lower = file_path.lower()
+    for codec, (suffix, _) in STORAGE_CODECS.items():
+        if suffix and lower.endswith(suffix):
+            return codec
+    return "json"
+
+
+def storage_path_for(file_path: str, codec: str) -> str:
+    # Gleicher Name mit der Endung des Formats: weeklies.json <-> weeklies.json.gz
+    suffix = STORAGE_CODECS[storage_codec_for(file_path)][0]
+    base = file_path[: -len(suffix)] if suffix else file_path
+    return base + STORAGE_CODECS[codec][0]
+
+
+def sidecar_base_for(json_path: str) -> str:
+    # Begleitdateien haengen am Namen ohne Format-Endung, damit weeklies.json, .json.gz
+    # und .json.xz dasselbe TODO-Archiv, Protokoll, Sicherungen usw. verwenden.
+    return os.path.splitext(storage_path_for(json_path, "json"))[0]
+
+
+def is_storage_file(file_name: str) -> bool:
+    return storage_path_for(file_name, "json").lower().endswith(".json")
+
+
+@contextmanager
+def open_storage_reader(file_path: str):
+    # Liefert (Codec, entpackter Strom, Rohdatei); raw.tell() zaehlt die von der Platte gelesenen Bytes.
+    with open(file_path, "rb") as raw:
+        head = raw.read(8)
+        raw.seek(0)
+        codec = next((name for name, (_, magic) in STORAGE_CODECS.items() if magic and head.startswith(magic)), "json")
+        if codec == "json":
+            yield codec, raw, raw
+            return
+        stream = gzip.GzipFile(fileobj=raw, mode="rb") if codec == "gzip" else lzma.LZMAFile(raw, mode="rb")
+        with stream:
+            yield codec, stream, raw
+
+
+def read_storage(file_path: str) -> bytes:
+    with open_storage_reader(file_path) as (_, stream, _raw):
+        return stream.read()
+
+
+def storage_report(codec: str, raw_bytes: int, stored_bytes: int, seconds: float, phase: str) -> dict:
+    return {
+        "codec": codec,
+        "raw_bytes": raw_bytes,
+        "stored_bytes": stored_bytes,
+        "ratio": round(raw_bytes / stored_bytes, 2) if stored_bytes else None,
+        f"{phase}_ms": round(seconds * 1000, 1),
+    }
+
+
+class LoadCancelled(Exception):
+    pass
+
+
+LOAD_CHUNK_SIZE = 1 << 20
+
+
+def load_validated_file(
+    file_path: str, progress=None, cancel_event: threading.Event | None = None, report: dict | None = None
+) -> dict:
+    # progress(phase, done, total) mit phase "bytes" (Bytes auf der Platte) oder "students".
+    # report wird, falls uebergeben, mit storage_report(..., "decode") gefuellt.
+    def check_cancel():
+        if cancel_event is not None and cancel_event.is_set():
+            raise LoadCancelled()
+
+    data = read_snapshot(file_path)
+    if data is not None:
+        return data
+
+    total_bytes = os.path.getsize(file_path)
+    chunks = []
+    started = time.perf_counter()
+    with open_storage_reader(file_path) as (codec, stream, raw):
+        for chunk in iter(lambda: stream.read(LOAD_CHUNK_SIZE), b""):
+            check_cancel()
+            chunks.append(chunk)
+            if progress is not None:
+                progress("bytes", min(raw.tell(), total_bytes), total_bytes)
+    if report is not None:
+        report.update(
+            storage_report(codec, sum(map(len, chunks)), total_bytes, time.perf_counter() - started, "decode")
+        )
+
+    raw = json.loads(b"".join(chunks).decode("utf-8"))
+    del chunks
+    check_cancel()
+
+    def on_students(done: int, total: int):
+        check_cancel()
+        if progress is not None:
+            progress("students", done, total)
+
+    data = validate_data(raw, on_students)
+    write_snapshot(file_path, data)
+    return data
+
+
+class LoadWorker(QObject):
+    progress = pyqtSignal(str, int, int)
+    finished = pyqtSignal(str, dict)
+    failed = pyqtSignal(str, str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+        self.cancel_event = threading.Event()
+        self.storage = {}
+
+    def _report(self, phase: str, done: int, total: int):
+        # Hoechstens ~100 Meldungen pro Phase an den GUI-Thread.
+        step = max(1, total // 100)
+        if done == total or done % step == 0:
+            self.progress.emit(phase, done, total)
+
+    def run(self):
+        try:
+            data = load_validated_file(self.file_path, self._report, self.cancel_event, self.storage)
+        except LoadCancelled:
+            self.cancelled.emit()
+        except Exception as exc:
+            self.failed.emit(self.file_path, str(exc))
+        else:
+            self.finished.emit(self.file_path, data)
+
+
+class ApiBridge(QObject):
+    # Die HTTP-Threads duerfen die Daten nicht selbst lesen, waehrend die Oberflaeche sie
+    # aendert: Cache-Fehlschlaege laufen als Auftrag auf dem Qt-Hauptthread.
+    TIMEOUT_S = 10
+    job_posted = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.job_posted.connect(self._execute, Qt.ConnectionType.QueuedConnection)
+
+    def run(self, job):
+        if threading.current_thread() is threading.main_thread():
+            return job()
+        box = {"done": threading.Event()}
+        self.job_posted.emit((job, box))
+        if not box["done"].wait(self.TIMEOUT_S):
+            raise ApiError(503, "Die Oberflaeche antwortet nicht")
+        if "error" in box:
+            raise box["error"]
+        return box["result"]
+
+    def _execute(self, payload):
+        job, box = payload
+        try:
+            box["result"] = job()
+        except Exception as exc:
+            box["error"] = exc
+        finally:
+            box["done"].set()
+
+
+# Speichern ueber zwischengespeicherte JSON-Fragmente: Studierende, Projekte und
+# Weeklies werden einzeln als Bytes kodiert und nur nach einer Aenderung neu erzeugt.
+# Die Datei entspricht byteweise json.dump(data, indent=2, ensure_ascii=False) im
+# Textmodus (inkl. os.linesep). Jeder Eintrag traegt einen Hash (Merkle-artig ueber
+# die Kinder), damit ein Speichern ohne inhaltliche Aenderung erkannt werden kann.
+FRAGMENT_LAYOUT = {
+    "root": ("students", "student"),
+    "student": ("projects", "project"),
+    "project": ("weeklies", "weekly"),
+    "weekly": (None, None),
+}
+FRAGMENT_NEWLINE = os.linesep.encode("ascii")
+FRAGMENT_IOV_MAX = 1024
+
+
+def _indent_json(value, level: int) -> bytes:
+    text = json.dumps(value, ensure_ascii=False, indent=2).replace("\n", "\n" + "  " * level)
+    return text.encode("utf-8").replace(b"\n", FRAGMENT_NEWLINE)
+
+
+class FragmentSerializer:
+    def __init__(self):
+        # id(record) -> (record, fragment, hash). Der Record selbst wird mitgehalten,
+        # damit eine wiederverwendete id nie ein fremdes Fragment liefert. Entfernte
+        # Records muessen per discard() freigegeben werden.
+        self._cache: dict[int, tuple[object, bytes, bytes]] = {}
+        self.encoded = 0
+
+    def reset(self):
+        self._cache.clear()
+
+    def invalidate(self, *records):
+        for record in records:
+            if record is not None:
+                self._cache.pop(id(record), None)
+
+    def discard(self, record: dict):
+        # Entfernten Record samt Projekten bzw. Weeklies aus dem Cache nehmen.
+        cached = self._cache.get(id(record))
+        if cached is not None and cached[0] is record:
+            del self._cache[id(record)]
+        for child in record.get("projects", ()) or record.get("weeklies", ()):
+            self.discard(child)
+
+    def encode(self, data: dict) -> tuple[list[bytes], bytes]:
+        # Liefert die Datei als Liste von Byte-Stuecken; die Fragmente der
+        # Studierenden werden nicht mehr zu einem grossen Block zusammenkopiert.
+        self.encoded = 0
+        return self._node(data, 0, "root")
+
+    def dumps(self, data: dict) -> bytes:
+        return b"".join(self.encode(data)[0])
+
+    def _node(self, value, level: int, kind: str):
+        key = id(value)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] is value:
+            return cached[1], cached[2]
+
+        child_key, child_kind = FRAGMENT_LAYOUT[kind]
+        if child_key is None or not isinstance(value, dict) or not value:
+            chunks = [_indent_json(value, level)]
+            digest = hashlib.blake2b(chunks[0], digest_size=16).digest()
+        else:
+            hasher = hashlib.blake2b(digest_size=16)
+            pad = b"  " * (level + 1)
+            parts = []
+            for member, item in value.items():
+                if member == child_key and isinstance(item, (dict, list)) and item:
+                    item_chunks, item_digest = self._container(item, level + 1, child_kind)
+                else:
+                    item_chunks = [_indent_json(item, level + 1)]
+                    item_digest = item_chunks[0]
+                encoded_key = json.dumps(member, ensure_ascii=False).encode("utf-8")
+                hasher.update(encoded_key)
+                hasher.update(item_digest)
+                parts.append(pad + encoded_key + b": ")
+                parts.extend(item_chunks)
+                parts.append(None)
+            chunks = _join_members(b"{", parts, level, b"}")
+            digest = hasher.digest()
+
+        self.encoded += 1
+        if kind == "root":
+            return chunks, digest
+        fragment = b"".join(chunks)
+        self._cache[key] = (value, fragment, digest)
+        return fragment, digest
+
+    def _container(self, items, level: int, kind: str) -> tuple[list[bytes], bytes]:
+        hasher = hashlib.blake2b(digest_size=16)
+        pad = b"  " * (level + 1)
+        parts = []
+        if isinstance(items, dict):
+            for member, item in items.items():
+                encoded_key = json.dumps(member, ensure_ascii=False).encode("utf-8")
+                fragment, digest = self._node(item, level + 1, kind)
+                hasher.update(encoded_key)
+                hasher.update(digest)
+                parts.extend((pad + encoded_key + b": ", fragment, None))
+            return _join_members(b"{", parts, level, b"}"), hasher.digest()
+        for item in items:
+            fragment, digest = self._node(item, level + 1, kind)
+            hasher.update(digest)
+            parts.extend((pad, fragment, None))
+        return _join_members(b"[", parts, level, b"]"), hasher.digest()
+
+
+def _join_members(opening: bytes, parts: list, level: int, closing: bytes) -> list[bytes]:
+    # parts: Stuecke je Eintrag, jeweils mit None abgeschlossen.
+    chunks = [opening + FRAGMENT_NEWLINE]
+    separator = b"," + FRAGMENT_NEWLINE
+    for part in parts[:-1]:
+        chunks.append(separator if part is None else part)
+    chunks.append(FRAGMENT_NEWLINE + b"  " * level + closing)
+    return chunks
+
+
+def write_json_chunks(file_path: str, chunks: list[bytes]):
+    # Ein writev pro Block statt vieler kleiner write-Aufrufe; ohne writev
+    # (Windows) ein einziger gepufferter Schreibvorgang.
+    if not hasattr(os, "writev"):
+        with open(file_path, "wb") as handle:
+            handle.write(b"".join(chunks))
+        return
+
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        pending = [chunk for chunk in chunks if chunk]
+        while pending:
+            batch = pending[:FRAGMENT_IOV_MAX]
+            written = os.writev(fd, batch)
+            # Teilweise geschriebene Bloecke beim naechsten Durchlauf fortsetzen.
+            consumed = 0
+            while consumed < len(batch) and written >= len(batch[consumed]):
+                written -= len(batch[consumed])
+                consumed += 1
+            pending = pending[consumed:]
+            if written:
+                pending[0] = pending[0][written:]
+    finally:
+        os.close(fd)
+
+
+def write_storage_chunks(file_path: str, chunks: list[bytes]) -> dict:
+    # Komprimiert werden die Bloecke gesammelt (STORAGE_WRITE_BLOCK) durch den Encoder
+    # geschrieben; der ganze Text wird dabei nie zusammengefuegt.
+    codec = storage_codec_for(file_path)
+    started = time.perf_counter()
+    raw_bytes = sum(map(len, chunks))
+    if codec == "json":
+        write_json_chunks(file_path, chunks)
+    else:
+        with open(file_path, "wb") as raw:
+            if codec == "gzip":
+                # mtime=0: gleicher Inhalt ergibt dieselbe Datei.
+                stream = gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=STORAGE_GZIP_LEVEL, mtime=0)
+            else:
+                stream = lzma.LZMAFile(raw, mode="wb", preset=STORAGE_LZMA_PRESET)
+            with stream:
+                pending, size = [], 0
+                for chunk in chunks:
+                    pending.append(chunk)
+                    size += len(chunk)
+                    if size >= STORAGE_WRITE_BLOCK:
+                        stream.write(b"".join(pending))
+                        pending, size = [], 0
+                stream.write(b"".join(pending))
+    return storage_report(codec, raw_bytes, os.path.getsize(file_path), time.perf_counter() - started, "encode")
+
+
+# Versionierte Sicherungen in .<name>.backups/: eine lzma-komprimierte Basis und
+# je Version ein zlib-Delta gegen diese Basis. Das Delta arbeitet auf Abschnitten
+# je Studierende/Projekt (Zeilenanfang auf Ebene 2 bzw. 4 des JSON) und speichert
+# nur Abschnitte, die in der Basis nicht vorkommen. Jede Version laesst sich so aus
+# genau zwei Dateien rekonstruieren. Wird ein Delta zu gross, beginnt eine neue Basis.
+BACKUP_POLICY_DEFAULTS = {
+    "interval_minutes": 5,
+    "keep_all_minutes": 120,
+    "keep_hourly": 48,
+    "keep_daily": 30,
+    "rebase_ratio": 0.25,
+}
+BACKUP_BASE_PRESET = 3
+BACKUP_CHUNK_RE = re.compile(rb"\n(?= {4}\"| {8}\{)")
+BACKUP_COPY = struct.Struct("<cqq")
+BACKUP_LITERAL = struct.Struct("<cq")
+
+
+def backup_dir_for(json_path: str) -> str:
+    directory, name = os.path.split(storage_path_for(os.path.abspath(json_path), "json"))
+    return os.path.join(directory, f".{name}.backups")
+
+
+def load_backup_policy(file_path: str) -> dict:
+    policy = dict(BACKUP_POLICY_DEFAULTS)
+    try:
+        with open(file_path, "r", encoding="utf-8") as handle:
+            raw = json.load(handle)
+    except (OSError, ValueError):
+        return policy
+    if isinstance(raw, dict):
+        for key, default in BACKUP_POLICY_DEFAULTS.items():
+            value = raw.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+                policy[key] = type(default)(value)
+    return policy
+
+
+def _backup_chunks(content: bytes) -> list[tuple[int, int]]:
+    starts = [0] + [match.end() for match in BACKUP_CHUNK_RE.finditer(content)]
+    return list(zip(starts, starts[1:] + [len(content)]))
+
+
+def index_backup_chunks(base: bytes) -> dict[int, tuple[int, int]]:
+    return {hash(base[start:end]): (start, end) for start, end in _backup_chunks(base)}
+
+
+def make_delta(base: bytes, content: bytes, base_index: dict | None = None) -> bytes:
+    if base_index is None:
+        base_index = index_backup_chunks(base)
+    ops = []
+    copy = None
+    for start, end in _backup_chunks(content):
+        piece = content[start:end]
+        hit = base_index.get(hash(piece))
+        if hit is not None and base[hit[0] : hit[1]] == piece:
+            if copy is not None and copy[1] == hit[0]:
+                copy = (copy[0], hit[1])
+            else:
+                if copy is not None:
+                    ops.append(BACKUP_COPY.pack(b"C", copy[0], copy[1] - copy[0]))
+                copy = hit
+            continue
+        if copy is not None:
+            ops.append(BACKUP_COPY.pack(b"C", copy[0], copy[1] - copy[0]))
+            copy = None
+        ops.append(BACKUP_LITERAL.pack(b"L", len(piece)))
+        ops.append(piece)
+    if copy is not None:
+        ops.append(BACKUP_COPY.pack(b"C", copy[0], copy[1] - copy[0]))
+    return zlib.compress(b"".join(ops))
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    raw = zlib.decompress(delta)
+    parts = []
+    pos = 0
+    while pos < len(raw):
+        if raw[pos : pos + 1] == b"C":
+            _, offset, length = BACKUP_COPY.unpack_from(raw, pos)
+            parts.append(base[offset : offset + length])
+            pos += BACKUP_COPY.size
+        else:
+            _, length = BACKUP_LITERAL.unpack_from(raw, pos)
+            pos += BACKUP_LITERAL.size
+            parts.append(raw[pos : pos + length])
+            pos += length
+    return b"".join(parts)
+
+
+class BackupStore:
+    INDEX_NAME = "index.json"
+
+    def __init__(self, directory: str, policy: dict | None = None):
+        self.directory = directory
+        self.policy = policy or dict(BACKUP_POLICY_DEFAULTS)
+        self.versions = self._read_index()
+        self._base_cache: tuple[int, bytes, dict] | None = None
+
+    def _read_index(self) -> list[dict]:
+        try:
+            with open(os.path.join(self.directory, self.INDEX_NAME), "r", encoding="utf-8") as handle:
+                raw = json.load(handle)
+        except (OSError, ValueError):
+            return []
+        return [v for v in raw.get("versions", []) if isinstance(v, dict)] if isinstance(raw, dict) else []
+
+    def _write_file(self, name: str, payload: bytes):
+        tmp_path = os.path.join(self.directory, name + ".tmp")
+        with open(tmp_path, "wb") as handle:
+            handle.write(payload)
+        os.replace(tmp_path, os.path.join(self.directory, name))
+
+    def _write_index(self):
+        self._write_file(self.INDEX_NAME, json.dumps({"version": 1, "versions": self.versions}).encode("utf-8"))
+
+    def _version(self, seq: int) -> dict:
+        for version in self.versions:
+            if version["seq"] == seq:
+                return version
+        raise KeyError(seq)
+
+    def _read_payload(self, version: dict) -> bytes:
+        with open(os.path.join(self.directory, version["file"]), "rb") as handle:
+            return handle.read()
+
+    def _load_base(self, base_seq: int) -> tuple[bytes, dict]:
+        if self._base_cache is None or self._base_cache[0] != base_seq:
+            content = lzma.decompress(self._read_payload(self._version(base_seq)))
+            self._base_cache = (base_seq, content, index_backup_chunks(content))
+        return self._base_cache[1], self._base_cache[2]
+
+    def snapshot(self, content: bytes, now: float | None = None) -> dict | None:
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        if self.versions and self.versions[-1]["hash"] == digest:
+            return None
+        now = time.time() if now is None else now
+        os.makedirs(self.directory, exist_ok=True)
+        seq = self.versions[-1]["seq"] + 1 if self.versions else 1
+
+        version = None
+        if self.versions:
+            base = self._version(self.versions[-1]["base"])
+            base_content, base_index = self._load_base(base["seq"])
+            delta = make_delta(base_content, content, base_index)
+            if len(delta) <= self.policy["rebase_ratio"] * base["stored"]:
+                version = {"kind": "delta", "base": base["seq"], "file": f"v{seq:06d}.delta.z", "payload": delta}
+        if version is None:
+            version = {"kind": "base", "base": seq, "file": f"v{seq:06d}.base.xz", "payload": lzma.compress(content, preset=BACKUP_BASE_PRESET)}
+            self._base_cache = (seq, content, index_backup_chunks(content))
+
+        payload = version.pop("payload")
+        self._write_file(version["file"], payload)
+        version.update({"seq": seq, "ts": now, "size": len(content), "stored": len(payload), "hash": digest})
+        self.versions.append(version)
+        self.prune(now)
+        self._write_index()
+        return version
+
+    def restore(self, seq: int) -> bytes:
+        version = self._version(seq)
+        if version["kind"] == "base":
+            content = self._load_base(seq)[0]
+        else:
+            content = apply_delta(self._load_base(version["base"])[0], self._read_payload(version))
+        if hashlib.blake2b(content, digest_size=16).hexdigest() != version["hash"]:
+            raise ValueError(f"Sicherung {seq} ist beschaedigt.")
+        return content
+
+    def prune(self, now: float | None = None):
+        # Alles aus den letzten Minuten, danach je Stunde bzw. Tag nur die neueste Version.
+        now = time.time() if now is None else now
+        keep = {self.versions[-1]["seq"]} if self.versions else set()
+        hours, days = set(), set()
+        for version in reversed(self.versions):
+            age = now - version["ts"]
+            hour = int(version["ts"] // 3600)
+            day = time.localtime(version["ts"])[:3]
+            if age <= self.policy["keep_all_minutes"] * 60:
+                keep.add(version["seq"])
+            if age <= self.policy["keep_hourly"] * 3600 and hour not in hours:
+                hours.add(hour)
+                keep.add(version["seq"])
+            if age <= self.policy["keep_daily"] * 86400 and day not in days:
+                days.add(day)
+                keep.add(version["seq"])
+        # Basen bleiben erhalten, solange ein behaltenes Delta sie braucht.
+        keep |= {version["base"] for version in self.versions if version["seq"] in keep}
+
+        removed = [version for version in self.versions if version["seq"] not in keep]
+        self.versions = [version for version in self.versions if version["seq"] in keep]
+        for version in removed:
+            try:
+                os.remove(os.path.join(self.directory, version["file"]))
+            except OSError:
+                pass
+
+
+# Binaer-Snapshot neben der JSON-Datei: Header + marshal der validierten Daten.
+# Gueltig, solange mtime/Groesse (oder notfalls der Inhalts-Hash) und der Stand der
+# Validierungsregeln passen.
+SNAPSHOT_MAGIC = b"WKLYSNAP"
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_HEADER = struct.Struct("<8sHHBBqq32s")
+
+
+def snapshot_path_for(json_path: str) -> str:
+    # Geteilt zwischen den Formaten; Groesse und Hash im Kopf verhindern einen fremden Stand.
+    directory, filename = os.path.split(storage_path_for(os.path.abspath(json_path), "json"))
+    return os.path.join(directory, f".{filename}.snapshot")
+
+
+def _hash_file(file_path: str) -> bytes:
+    digest = hashlib.blake2b(digest_size=32)
+    with open(file_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def read_snapshot(json_path: str) -> dict | None:
+    try:
+        stat = os.stat(json_path)
+        with open(snapshot_path_for(json_path), "rb") as handle:
+            header = handle.read(SNAPSHOT_HEADER.size)
+            magic, fmt, rules, py_major, py_minor, mtime_ns, size, digest = SNAPSHOT_HEADER.unpack(header)
+            if magic != SNAPSHOT_MAGIC or fmt != SNAPSHOT_FORMAT or (py_major, py_minor) != sys.version_info[:2]:
+                return None
+            if rules != VALIDATION_RULES:
+                return None
+            if size != stat.st_size:
+                return None
+            # Gleiche Groesse, andere mtime (z. B. kopiert): nur der Hash entscheidet.
+            if mtime_ns != stat.st_mtime_ns and digest != _hash_file(json_path):
+                return None
+            data = marshal.loads(handle.read())
+    except (OSError, ValueError, EOFError, TypeError, struct.error):
+        return None
+    return data if isinstance(data, dict) and data.get("version") == DATA_VERSION else None
+
+
+def write_snapshot(json_path: str, data: dict) -> bool:
+    snapshot_path = snapshot_path_for(json_path)
+    tmp_path = snapshot_path + ".tmp"
+    try:
+        stat = os.stat(json_path)
+        header = SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_FORMAT,
+            VALIDATION_RULES,
+            sys.version_info[0],
+            sys.version_info[1],
+            stat.st_mtime_ns,
+            stat.st_size,
+            _hash_file(json_path),
+        )
+        with open(tmp_path, "wb") as handle:
+            handle.write(header)
+            handle.write(marshal.dumps(data))
+        os.replace(tmp_path, snapshot_path)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+# Anhaenge: inhaltsadressiert unter <name>.attachments/blobs/<2>/<sha256>, jeder Inhalt
+# liegt nur einmal vor, egal unter welchem Dateinamen er kam. Ein Weekly haelt nur
+# Referenzen {"name", "blob", "size"}; die Endung steht im Namen. Speichern und Laden der
+# Hauptdatei werden dadurch nicht groesser oder langsamer. Vorschaubilder entstehen im
+# Thread-Pool und liegen unter thumbs/, zum Oeffnen gibt es unter open/ eine benannte Kopie.
+ATTACHMENT_THUMB_PX = 96
+ATTACHMENT_THUMB_WORKERS = 2
+ATTACHMENT_IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp")
+_ATTACHMENT_BLOB_RE = re.compile(r"([0-9a-f]{2})/\1[0-9a-f]{62}")
+
+
+def attachments_dir_for(json_path: str) -> str:
+    return sidecar_base_for(os.path.abspath(json_path)) + ".attachments"
+
+
+def normalize_attachments(raw) -> list[dict]:
+    # Nur Referenzen mit gueltigem Blob-Pfad; damit kann keine Referenz aus der Ablage herauszeigen.
+    if not isinstance(raw, list):
+        return []
+    attachments = []
+    for item in raw:
+        if not isinstance(item, dict) or not _ATTACHMENT_BLOB_RE.fullmatch(str(item.get("blob", ""))):
+            continue
+        size = item.get("size", 0)
+        attachments.append(
+            {
+                "name": str(item.get("name", "")) or item["blob"].split("/")[1],
+                "blob": item["blob"],
+                "size": size if isinstance(size, int) and size >= 0 else 0,
+            }
+        )
+    return attachments
+
+
+class AttachmentStore:
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def blob_path(self, blob: str) -> str:
+        return os.path.join(self.directory, "blobs", *blob.split("/"))
+
+    def thumbnail_path(self, blob: str) -> str:
+        return os.path.join(self.directory, "thumbs", f"{blob.split('/')[1]}-{ATTACHMENT_THUMB_PX}.png")
+
+    def open_path(self, attachment: dict) -> str:
+        # Blobs haben keine Endung; zum Oeffnen mit dem passenden Programm ein Hardlink
+        # (sonst eine Kopie) unter dem urspruenglichen Namen.
+        digest = attachment["blob"].split("/")[1]
+        name = os.path.basename(attachment["name"].replace("\\", "/")) or digest
+        path = os.path.join(self.directory, "open", digest[:16], name)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            try:
+                os.link(self.blob_path(attachment["blob"]), path)
+            except OSError:
+                shutil.copyfile(self.blob_path(attachment["blob"]), path)
+        return path
+
+    def add(self, source_path: str) -> dict:
+        # Beim Kopieren hashen; existiert der Blob schon, wird die Kopie verworfen.
+        blobs_dir = os.path.join(self.directory, "blobs")
+        os.makedirs(blobs_dir, exist_ok=True)
+        tmp_path = os.path.join(blobs_dir, f".{uuid.uuid4().hex}.part")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(source_path, "rb") as source, open(tmp_path, "wb") as target:
+                for chunk in iter(lambda: source.read(1 << 20), b""):
+                    digest.update(chunk)
+                    target.write(chunk)
+                    size += len(chunk)
+            hexdigest = digest.hexdigest()
+            blob = f"{hexdigest[:2]}/{hexdigest}"
+            blob_path = self.blob_path(blob)
+            if os.path.exists(blob_path):
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                os.replace(tmp_path, blob_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return {"name": os.path.basename(source_path), "blob": blob, "size": size}
+
+
+def render_thumbnail(source_path: str, thumb_path: str, px: int = ATTACHMENT_THUMB_PX) -> bool:
+    # Laeuft im Thread-Pool: nur QImage, keine QPixmap (die gehoert dem UI-Thread).
+    image = QImage(source_path)
+    if image.isNull():
+        return False
+    scaled = image.scaled(px, px, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
+    tmp_path = thumb_path + ".tmp"
+    if not scaled.save(tmp_path, "PNG"):
+        return False
+    os.replace(tmp_path, thumb_path)
+    return True
+
+
+class ThumbnailLoader(QObject):
+    # ready(blob, Pfad des Vorschaubilds oder "") kommt aus dem Pool und wird in den UI-Thread zugestellt.
+    ready = pyqtSignal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = None
+        self._pending = set()
+        self.ready.connect(self._forget)
+
+    def request(self, store: AttachmentStore, attachment: dict) -> str | None:
+        blob = attachment["blob"]
+        thumb_path = store.thumbnail_path(blob)
+        if os.path.exists(thumb_path):
+            return thumb_path
+        if blob not in self._pending and attachment["name"].lower().endswith(ATTACHMENT_IMAGE_SUFFIXES):
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=ATTACHMENT_THUMB_WORKERS, thread_name_prefix="thumbs")
+            self._pending.add(blob)
+            self._pool.submit(self._render, store.blob_path(blob), thumb_path, blob)
+        return None
+
+    def _render(self, source_path: str, thumb_path: str, blob: str):
+        try:
+            done = render_thumbnail(source_path, thumb_path)
+        except OSError:
+            done = False
+        self.ready.emit(blob, thumb_path if done else "")
+
+    def _forget(self, blob: str, _thumb_path: str):
+        self._pending.discard(blob)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+
+# Nur-Lese-Archiv (*.wkarc), wird per mmap geoeffnet:
+#   Header | Weekly-Texte (JSON) | Projektindex je Studierende (marshal) | Studierendenindex (marshal)
+# Im Speicher liegt nur der Studierendenindex; Projektindizes werden bei Bedarf
+# dekodiert (LRU), Weekly-Texte erst beim Anzeigen.
+ARCHIVE_MAGIC = b"WKLYARC3"
+ARCHIVE_HEADER = struct.Struct("<8sqqqq")
+ARCHIVE_STUDENT_CACHE = 16
+ARCHIVE_LAZY_FIELDS = ("planned", "done", "next_planned")
+
+
+def archive_path_for(json_path: str) -> str:
+    return sidecar_base_for(json_path) + ".wkarc"
+
+
+def build_mapped_archive(data: dict, archive_path: str, source_path: str | None = None) -> str:
+    source_stat = os.stat(source_path) if source_path else None
+    tmp_path = archive_path + ".tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(b"\0" * ARCHIVE_HEADER.size)
+        student_index = []
+        for student_name, student_entry in data["students"].items():
+            projects = []
+            for project in student_entry["projects"]:
+                weekly_index = []
+                for weekly in project["weeklies"]:
+                    blob = json.dumps([weekly[key] for key in ARCHIVE_LAZY_FIELDS], ensure_ascii=False).encode("utf-8")
+                    weekly_index.append(
+                        (
+                            weekly["id"],
+                            weekly["date"],
+                            weekly["title"],
+                            handle.tell(),
+                            len(blob),
+                            weekly.get("attachments", []),
+                        )
+                    )
+                    handle.write(blob)
+                projects.append(
+                    (
+                        project["id"],
+                        project["name"],
+                        project["start_date"],
+                        project["end_date"],
+                        project["project_todos"],
+                        weekly_index,
+                    )
+                )
+            block = marshal.dumps(projects)
+            student_index.append((student_name, student_entry["id"], handle.tell(), len(block)))
+            handle.write(block)
+
+        index_blob = marshal.dumps(student_index)
+        index_offset = handle.tell()
+        handle.write(index_blob)
+        handle.seek(0)
+        handle.write(
+            ARCHIVE_HEADER.pack(
+                ARCHIVE_MAGIC,
+                source_stat.st_mtime_ns if source_stat else 0,
+                source_stat.st_size if source_stat else 0,
+                index_offset,
+                len(index_blob),
+            )
+        )
+    os.replace(tmp_path, archive_path)
+    return archive_path
+
+
+def mapped_archive_is_current(archive_path: str, source_path: str) -> bool:
+    try:
+        source_stat = os.stat(source_path)
+        with open(archive_path, "rb") as handle:
+            magic, mtime_ns, size, _, _ = ARCHIVE_HEADER.unpack(handle.read(ARCHIVE_HEADER.size))
+    except (OSError, struct.error):
+        return False
+    return magic == ARCHIVE_MAGIC and mtime_ns == source_stat.st_mtime_ns and size == source_stat.st_size
+
+
+class MappedArchive:
+    def __init__(self, archive_path: str):
+        self.path = archive_path
+        self._handle = open(archive_path, "rb")
+        try:
+            self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, _, _, index_offset, index_length = ARCHIVE_HEADER.unpack(self._map[: ARCHIVE_HEADER.size])
+            if magic != ARCHIVE_MAGIC:
+                raise ValueError("Keine gueltige Archivdatei.")
+            student_index = marshal.loads(self._map[index_offset : index_offset + index_length])
+            self.student_offsets = {name: (offset, length) for name, _, offset, length in student_index}
+            self.student_ids = {name: student_id for name, student_id, _, _ in student_index}
+        except Exception:
+            self._handle.close()
+            raise
+        self._projects_cache = OrderedDict()
+
+    def student_projects(self, student_name: str) -> list[dict]:
+        cached = self._projects_cache.get(student_name)
+        if cached is not None:
+            self._projects_cache.move_to_end(student_name)
+            return cached
+
+        offset, length = self.student_offsets[student_name]
+        projects = [
+            {
+                "id": project_id,
+                "name": name,
+                "start_date": start_date,
+                "end_date": end_date,
+                "project_todos": todos,
+                "weeklies": [
+                    MappedWeekly(self, weekly_id, date, title, weekly_offset, weekly_length, attachments)
+                    for weekly_id, date, title, weekly_offset, weekly_length, attachments in weekly_index
+                ],
+            }
+            for project_id, name, start_date, end_date, todos, weekly_index in marshal.loads(
+                self._map[offset : offset + length]
+            )
+        ]
+        self._projects_cache[student_name] = projects
+        if len(self._projects_cache) > ARCHIVE_STUDENT_CACHE:
+            self._projects_cache.popitem(last=False)
+        return projects
+
+    def weekly_texts(self, offset: int, length: int) -> list[str]:
+        return json.loads(self._map[offset : offset + length].decode("utf-8"))
+
+    def close(self):
+        self._projects_cache.clear()
+        self._map.close()
+        self._handle.close()
+
+
+class MappedWeekly(dict):
+    # Datum, Titel und Anhang-Referenzen liegen direkt vor (fuer weekly_list), die Texte
+    # werden erst beim ersten Zugriff aus der gemappten Datei gelesen.
+    def __init__(
+        self,
+        archive: MappedArchive,
+        weekly_id: str,
+        date: str,
+        title: str,
+        offset: int,
+        length: int,
+        attachments: list | None = None,
+    ):
+        super().__init__(id=weekly_id, date=date, title=title)
+        if attachments:
+            self["attachments"] = attachments
+        self._archive = archive
+        self._span = (offset, length)
+
+    def _load_texts(self):
+        if "planned" not in self.keys():
+            self.update(zip(ARCHIVE_LAZY_FIELDS, self._archive.weekly_texts(*self._span)))
+
+    def __getitem__(self, key):
+        if key in ARCHIVE_LAZY_FIELDS:
+            self._load_texts()
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        if key in ARCHIVE_LAZY_FIELDS:
+            self._load_texts()
+        return super().get(key, default)
+
+
+class MappedStudents(Mapping):
+    def __init__(self, archive: MappedArchive):
+        self.archive = archive
+
+    def __getitem__(self, student_name: str) -> dict:
+        if student_name not in self.archive.student_offsets:
+            raise KeyError(student_name)
+        return {"id": self.archive.student_ids[student_name], "projects": self.archive.student_projects(student_name)}
+
+    def __iter__(self):
+        return iter(self.archive.student_offsets)
+
+    def __len__(self) -> int:
+        return len(self.archive.student_offsets)
+
+
+WEEKLY_FIELDS = ("date", "title", "planned", "done", "next_planned")
+
+
+class TodoRecord:
+    __slots__ = ("id", "text", "checked", "priority", "due")
+
+    def __init__(self, todo_id: str, text: str, checked: bool = False, priority: int = 0, due: str = ""):
+        self.id = todo_id
+        self.text = text
+        self.checked = checked
+        self.priority = priority
+        self.due = due
+
+    def to_dict(self) -> dict:
+        return {"id": self.id, "text": self.text, "checked": self.checked, "priority": self.priority, "due": self.due}
+
+
+class WeeklyRecord:
+    # attachments: Tupel aus (name, blob, size); leer fuer Weeklies ohne Anhaenge.
+    __slots__ = ("id",) + WEEKLY_FIELDS + ("attachments",)
+
+    def __init__(
+        self,
+        weekly_id: str,
+        date: str,
+        title: str,
+        planned: str,
+        done: str,
+        next_planned: str,
+        attachments: tuple = (),
+    ):
+        self.id = weekly_id
+        self.date = date
+        self.title = title
+        self.planned = planned
+        self.done = done
+        self.next_planned = next_planned
+        self.attachments = attachments
+
+    def to_dict(self) -> dict:
+        data = {key: getattr(self, key) for key in ("id",) + WEEKLY_FIELDS}
+        if self.attachments:
+            data["attachments"] = [{"name": name, "blob": blob, "size": size} for name, blob, size in self.attachments]
+        return data
+
+
+class ProjectRecord:
+    __slots__ = ("id", "name", "start_date", "end_date", "todos", "weeklies")
+
+    def __init__(self, project_id: str, name: str, start_date: str, end_date: str, todos: tuple, weeklies: tuple):
+        self.id = project_id
+        self.name = name
+        self.start_date = start_date
+        self.end_date = end_date
+        self.todos = todos
+        self.weeklies = weeklies
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "project_todos": [todo.to_dict() for todo in self.todos],
+            "weeklies": [weekly.to_dict() for weekly in self.weeklies],
+        }
+
+
+class CompactDataset:
+    # Kompakte, unveraenderliche Sicht auf validierte Daten (DATA_VERSION).
+    # Datumswerte und Namen werden per sys.intern geteilt, wiederholte
+    # Texte (z. B. next_planned -> planned) ueber einen Pool pro Datensatz.
+    __slots__ = ("students", "student_ids")
+
+    def __init__(self, students: dict[str, tuple[ProjectRecord, ...]], student_ids: dict[str, str]):
+        self.students = students
+        self.student_ids = student_ids
+
+    @classmethod
+    def from_data(cls, data: dict) -> "CompactDataset":
+        pool = {}
+
+        def shared(value: str) -> str:
+            return pool.setdefault(value, value)
+
+        def todo_records(todos: list[dict]) -> tuple[TodoRecord, ...]:
+            return tuple(
+                TodoRecord(
+                    todo["id"],
+                    shared(todo["text"]),
+                    bool(todo["checked"]),
+                    todo["priority"],
+                    sys.intern(todo["due"]),
+                )
+                for todo in todos
+            )
+
+        students = {}
+        student_ids = {}
+        for student_name, student_entry in data["students"].items():
+            projects = []
+            for project in student_entry["projects"]:
+                weeklies = tuple(
+                    WeeklyRecord(
+                        weekly["id"],
+                        sys.intern(weekly["date"]),
+                        shared(weekly["title"]),
+                        shared(weekly["planned"]),
+                        shared(weekly["done"]),
+                        shared(weekly["next_planned"]),
+                        tuple(
+                            (shared(item["name"]), sys.intern(item["blob"]), item["size"])
+                            for item in weekly.get("attachments", ())
+                        ),
+                    )
+                    for weekly in project["weeklies"]
+                )
+                projects.append(
+                    ProjectRecord(
+                        project["id"],
+                        shared(project["name"]),
+                        sys.intern(project["start_date"]),
+                        sys.intern(project["end_date"]),
+                        todo_records(project["project_todos"]),
+                        weeklies,
+                    )
+                )
+            students[sys.intern(student_name)] = tuple(projects)
+            student_ids[student_name] = student_entry["id"]
+        return cls(students, student_ids)
+
+    @classmethod
+    def loads(cls, text: str) -> "CompactDataset":
+        return cls.from_data(validate_data(json.loads(text)))
+
+    def to_data(self) -> dict:
+        return {
+            "version": DATA_VERSION,
+            "students": {
+                student_name: {
+                    "id": self.student_ids[student_name],
+                    "projects": [project.to_dict() for project in projects],
+                }
+                for student_name, projects in self.students.items()
+            },
+        }
+
+    def dumps(self) -> str:
+        return json.dumps(self.to_data(), ensure_ascii=False, indent=2)
+
+    def weekly_count(self) -> int:
+        return sum(len(project.weeklies) for projects in self.students.values() for project in projects)
+
+
+def _load_semester_file(file_path: str) -> CompactDataset:
+    # Laeuft im Worker-Prozess: nur Pfad rein, kompakte validierte Daten raus.
+    # Pickle behaelt geteilte Strings als Referenzen bei.
+    return CompactDataset.loads(read_storage(file_path).decode("utf-8"))
+
+
+def load_semester_archive(directory: str, max_workers: int | None = None) -> tuple[dict, dict]:
+    file_paths = sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if is_storage_file(name) and os.path.isfile(os.path.join(directory, name))
+    )
+
+    semesters = {}
+    errors = {}
+    if not file_paths:
+        return semesters, errors
+
+    workers = max(1, min(len(file_paths), max_workers or os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_load_semester_file, path): path for path in file_paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            semester = os.path.splitext(os.path.basename(storage_path_for(path, "json")))[0]
+            try:
+                semesters[semester] = future.result()
+            except Exception as exc:
+                errors[semester] = str(exc)
+
+    return dict(sorted(semesters.items())), dict(sorted(errors.items()))
+
+
+def iter_archive_weeklies(semesters: dict):
+    for semester, dataset in semesters.items():
+        for student_name, projects in dataset.students.items():
+            for project in projects:
+                for weekly in project.weeklies:
+                    yield semester, student_name, project.name, weekly
+
+
+def search_archive(semesters: dict, query: str) -> list[tuple[str, str, str, WeeklyRecord]]:
+    needle = query.strip().lower()
+    hits = []
+    for semester, student_name, project_name, weekly in iter_archive_weeklies(semesters):
+        if (
+            needle in student_name.lower()
+            or needle in project_name.lower()
+            or any(needle in getattr(weekly, key).lower() for key in WEEKLY_FIELDS)
+        ):
+            hits.append((semester, student_name, project_name, weekly))
+    return hits
+
+
+THEME_COLOR_KEYS = (
+    "bg",
+    "surface",
+    "surface_alt",
+    "border",
+    "text",
+    "subtle",
+    "accent",
+    "accent_border",
+    "hover",
+    "selected",
+)
+
+BUILTIN_THEMES = {
+    "light": {
+        "dark": False,
+        "colors": {
+            "bg": "#f3f6fb",
+            "surface": "#ffffff",
+            "surface_alt": "#fbfcff",
+            "border": "#e3e8f0",
+            "text": "#1f2a37",
+            "subtle": "#5b6b7a",
+            "accent": "#2563eb",
+            "accent_border": "#1d4ed8",
+            "hover": "#eef3ff",
+            "selected": "#dbeafe",
+        },
+    },
+    "dark": {
+        "dark": True,
+        "colors": {
+            "bg": "#0f172a",
+            "surface": "#111827",
+            "surface_alt": "#1f2937",
+            "border": "#334155",
+            "text": "#e5e7eb",
+            "subtle": "#94a3b8",
+            "accent": "#3b82f6",
+            "accent_border": "#1d4ed8",
+            "hover": "#1e293b",
+            "selected": "#1d4ed8",
+        },
+    },
+}
+
+THEME_STYLESHEET = """
+QMainWindow {{ background: {bg}; }}
+QWidget {{ color: {text}; }}
+QToolBar {{
+    background: {surface};
+    border: 1px solid {border};
+    spacing: 6px;
+    padding: 6px;
+    border-radius: 10px;
+}}
+QToolButton {{
+    background: transparent;
+    border: 1px solid transparent;
+    border-radius: 8px;
+    padding: 6px 10px;
+}}
+QToolButton:hover {{
+    background: {hover};
+    border: 1px solid {border};
+}}
+QLabel#SubtleLabel {{ color: {subtle}; }}
+QFrame#Card {{
+    background: {surface};
+    border: 1px solid {border};
+    border-radius: 14px;
+}}
+QLabel#CardTitle {{
+    font-size: 15px;
+    font-weight: 700;
+    color: {text};
+    padding-bottom: 4px;
+}}
+QListWidget {{
+    background: {surface_alt};
+    border: 1px solid {border};
+    border-radius: 10px;
+    padding: 6px;
+}}
+QListWidget::item {{ border-radius: 8px; padding: 8px; margin: 2px 0px; }}
+QListWidget::item:selected {{
+    background: {selected};
+    border: 1px solid {accent_border};
+}}
+QListWidget::item:hover:!selected {{ background: {hover}; }}
+QPushButton {{
+    background: {surface};
+    border: 1px solid {border};
+    border-radius: 10px;
+    padding: 8px 12px;
+}}
+QPushButton:hover {{
+    background: {hover};
+    border-color: {accent_border};
+}}
+QPushButton:disabled {{
+    color: {subtle};
+    background: {surface_alt};
+    border-color: {border};
+}}
+QTextEdit, QDateEdit, QLineEdit {{
+    background: {surface};
+    border: 1px solid {border};
+    border-radius: 10px;
+    padding: 6px;
+}}
+QProgressBar {{
+    background: {surface};
+    border: 1px solid {border};
+    border-radius: 10px;
+    min-height: 24px;
+    padding: 0px;
+    text-align: center;
+}}
+QTextEdit:focus, QDateEdit:focus, QLineEdit:focus {{
+    border: 1px solid {accent};
+}}
+QProgressBar::chunk {{
+    background: {accent};
+    border-radius: 8px;
+}}
+QGroupBox {{
+    font-weight: 600;
+    border: 1px solid {border};
+    border-radius: 12px;
+    margin-top: 8px;
+    background: {surface_alt};
+}}
+QGroupBox::title {{
+    subcontrol-origin: margin;
+    left: 12px;
+    padding: 0 4px;
+}}
+QStatusBar {{
+    background: {surface};
+    border-top: 1px solid {border};
+}}
+"""
+
+
+def themes_dir_for(directory: str) -> str:
+    return os.path.join(directory, "weekly_themes")
+
+
+class CompiledTheme:
+    __slots__ = ("name", "dark", "colors", "stylesheet", "palette")
+
+    PALETTE_ROLES = (
+        (QPalette.ColorRole.Window, "bg"),
+        (QPalette.ColorRole.WindowText, "text"),
+        (QPalette.ColorRole.Base, "surface"),
+        (QPalette.ColorRole.AlternateBase, "surface_alt"),
+        (QPalette.ColorRole.Text, "text"),
+        (QPalette.ColorRole.Button, "surface"),
+        (QPalette.ColorRole.ButtonText, "text"),
+        (QPalette.ColorRole.ToolTipBase, "surface"),
+        (QPalette.ColorRole.ToolTipText, "text"),
+        (QPalette.ColorRole.PlaceholderText, "subtle"),
+        (QPalette.ColorRole.Highlight, "selected"),
+        (QPalette.ColorRole.HighlightedText, "text"),
+        (QPalette.ColorRole.Mid, "border"),
+        (QPalette.ColorRole.Link, "accent"),
+    )
+
+    def __init__(self, name: str, dark: bool, colors: dict):
+        self.name = name
+        self.dark = dark
+        self.colors = dict(colors)
+        self.stylesheet = THEME_STYLESHEET.format_map(self.colors)
+        self.palette = QPalette()
+        for role, key in self.PALETTE_ROLES:
+            self.palette.setColor(role, QColor(self.colors[key]))
+        for role in (QPalette.ColorRole.Text, QPalette.ColorRole.ButtonText, QPalette.ColorRole.WindowText):
+            self.palette.setColor(QPalette.ColorGroup.Disabled, role, QColor(self.colors["subtle"]))
+
+
+class ThemeRegistry:
+    # Eingebaute Themes plus eigene Dateien (weekly_themes/*.json), je Farbsatz einmal uebersetzt.
+    # Dateiformat: {"name": "...", "base": "dark", "colors": {"accent": "#..."}}; fehlende Farben kommen aus base.
+    def __init__(self, directory: str | None = None):
+        self.directory = directory
+        self._sources = {}
+        self._compiled = {}
+        self.errors = []
+        self.reload()
+
+    def reload(self):
+        sources = {name: (spec["dark"], dict(spec["colors"])) for name, spec in BUILTIN_THEMES.items()}
+        errors = []
+        try:
+            filenames = sorted(os.listdir(self.directory)) if self.directory else []
+        except OSError:
+            filenames = []
+        for filename in filenames:
+            if not filename.endswith(".json"):
+                continue
+            try:
+                name, dark, colors = self._read_theme_file(os.path.join(self.directory, filename))
+            except (OSError, ValueError) as exc:
+                errors.append(f"{filename}: {exc}")
+                continue
+            sources[name] = (dark, colors)
+        self._sources = sources
+        self.errors = errors
+
+    @staticmethod
+    def _read_theme_file(file_path: str) -> tuple[str, bool, dict]:
+        with open(file_path, "r", encoding="utf-8") as handle:
+            raw = json.load(handle)
+        if not isinstance(raw, dict):
+            raise ValueError("Theme muss ein JSON-Objekt sein")
+        base = BUILTIN_THEMES.get(raw.get("base", "light"))
+        if base is None:
+            raise ValueError(f"unbekanntes Basis-Theme: {raw.get('base')}")
+        colors = dict(base["colors"])
+        for key, value in (raw.get("colors") or {}).items():
+            if key not in THEME_COLOR_KEYS:
+                raise ValueError(f"unbekannte Farbe: {key}")
+            if not isinstance(value, str) or not QColor(value).isValid():
+                raise ValueError(f"ungueltiger Farbwert fuer {key}: {value}")
+            colors[key] = value
+        name = str(raw.get("name") or os.path.splitext(os.path.basename(file_path))[0]).strip()
+        return name, bool(raw.get("dark", base["dark"])), colors
+
+    def names(self) -> list[str]:
+        return list(self._sources)
+
+    def get(self, name: str) -> CompiledTheme | None:
+        source = self._sources.get(name)
+        if source is None:
+            return None
+        cached = self._compiled.get(name)
+        if cached is None or (cached.dark, cached.colors) != source:
+            cached = self._compiled[name] = CompiledTheme(name, *source)
+        return cached
+
+
 class TaskListWidget(QWidget):
     tasksChanged = pyqtSignal()
+    moveRequested = pyqtSignal(list)
 
     def __init__(self, placeholder: str, parent=None):
         super().__init__(parent)
         self._loading = False
+        self.model = None
 
         self.list_widget = QListWidget()
+        self.list_widget.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+        self.list_widget.setDragDropMode(QListWidget.DragDropMode.InternalMove)
+        self.list_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.list_widget.itemChanged.connect(self._on_item_changed)
+        self.list_widget.model().rowsMoved.connect(self._on_rows_moved)
+        self.list_widget.customContextMenuRequested.connect(self._show_context_menu)
 
         self.input_edit = QLineEdit()
         self.input_edit.setPlaceholderText(placeholder)
         self.btn_add = QPushButton("Hinzufuegen")
-        self.btn_remove_checked = QPushButton("Erledigte entfernen")
+        self.btn_check_all = QPushButton("Alle abhaken")
+        self.btn_archive_checked = QPushButton("Erledigte archivieren")
+        self.btn_move = QPushButton("Verschieben ...")
+        self.btn_move.setToolTip("Ausgewaehlte (oder erledigte) TODOs in ein anderes Projekt verschieben")
 
         self.btn_add.clicked.connect(self._add_from_input)
         self.input_edit.returnPressed.connect(self._add_from_input)
-        self.btn_remove_checked.clicked.connect(self._remove_checked)
+        self.btn_check_all.clicked.connect(self._check_all)
+        self.btn_archive_checked.clicked.connect(self._archive_checked)
+        self.btn_move.clicked.connect(self._request_move)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
@@ -218,58 +2638,375 @@ class TaskListWidget(QWidget):
         row = QHBoxLayout()
         row.addWidget(self.input_edit, 1)
         row.addWidget(self.btn_add)
-        row.addWidget(self.btn_remove_checked)
         root.addLayout(row)
 
-    def _create_item(self, text: str, checked: bool) -> QListWidgetItem:
-        item = QListWidgetItem(text)
+        bulk_row = QHBoxLayout()
+        bulk_row.addWidget(self.btn_check_all)
+        bulk_row.addWidget(self.btn_archive_checked)
+        bulk_row.addWidget(self.btn_move)
+        bulk_row.addStretch(1)
+        root.addLayout(bulk_row)
+
+    def _create_item(self, todo: dict) -> QListWidgetItem:
+        item = QListWidgetItem(todo["text"])
         item.setFlags(
             item.flags()
             | Qt.ItemFlag.ItemIsUserCheckable
             | Qt.ItemFlag.ItemIsEditable
             | Qt.ItemFlag.ItemIsSelectable
             | Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsDragEnabled
         )
-        item.setCheckState(Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked)
+        item.setData(Qt.ItemDataRole.UserRole, todo["id"])
+        self._apply_item_state(item, todo)
         return item
 
-    def set_tasks(self, tasks: list[dict]):
+    def _apply_item_state(self, item: QListWidgetItem, todo: dict):
+        item.setCheckState(Qt.CheckState.Checked if todo["checked"] else Qt.CheckState.Unchecked)
+        font = item.font()
+        font.setBold(todo["priority"] > 0)
+        font.setItalic(todo["priority"] < 0)
+        item.setFont(font)
+
+        tooltip = f"Prioritaet: {TODO_PRIORITY_LABELS.get(todo['priority'], 'normal')}"
+        due = QDate.fromString(todo["due"], Qt.DateFormat.ISODate)
+        if due.isValid():
+            tooltip += f"\nFaellig: {due.toString('dd.MM.yyyy')}"
+            if not todo["checked"] and due < QDate.currentDate():
+                item.setForeground(QColor("#dc2626"))
+            else:
+                item.setData(Qt.ItemDataRole.ForegroundRole, None)
+        else:
+            item.setData(Qt.ItemDataRole.ForegroundRole, None)
+        item.setToolTip(tooltip)
+
+    def set_model(self, model: "TodoModel | None"):
+        if self.model is not None:
+            self.model.on_change = None
+        self.model = model
+        if model is not None:
+            model.on_change = self.tasksChanged.emit
+        self._rebuild()
+
+    def _rebuild(self):
         self._loading = True
+        self.list_widget.setUpdatesEnabled(False)
         self.list_widget.blockSignals(True)
         self.list_widget.clear()
-        for task in tasks:
-            text = str(task.get("text", "")).strip()
-            if text:
-                self.list_widget.addItem(self._create_item(text, bool(task.get("checked", False))))
+        if self.model is not None:
+            for todo in self.model.todos:
+                self.list_widget.addItem(self._create_item(todo))
         self.list_widget.blockSignals(False)
+        self.list_widget.setUpdatesEnabled(True)
         self._loading = False
 
     def get_tasks(self) -> list[dict]:
-        tasks = []
-        for idx in range(self.list_widget.count()):
-            item = self.list_widget.item(idx)
-            text = item.text().strip()
-            if text:
-                tasks.append({"text": text, "checked": item.checkState() == Qt.CheckState.Checked})
-        return tasks
+        return list(self.model.todos) if self.model is not None else []
 
     def _add_from_input(self):
         text = self.input_edit.text().strip()
-        if not text:
+        if not text or self.model is None:
             return
-        self.list_widget.addItem(self._create_item(text, False))
+        todo = self.model.add(text)
+        self._loading = True
+        self.list_widget.addItem(self._create_item(todo))
+        self._loading = False
         self.input_edit.clear()
-        self.tasksChanged.emit()
 
-    def _remove_checked(self):
-        for idx in reversed(range(self.list_widget.count())):
-            if self.list_widget.item(idx).checkState() == Qt.CheckState.Checked:
-                self.list_widget.takeItem(idx)
-        self.tasksChanged.emit()
+    def _check_all(self):
+        if self.model is None:
+            return
+        self.model.set_all_checked(True)
+        self._loading = True
+        for row in range(self.list_widget.count()):
+            self.list_widget.item(row).setCheckState(Qt.CheckState.Checked)
+        self._loading = False
+
+    def _archive_checked(self):
+        if self.model is not None and self.model.archive_completed():
+            self._rebuild()
+
+    def _request_move(self):
+        if self.model is None:
+            return
+        todo_ids = [item.data(Qt.ItemDataRole.UserRole) for item in self.list_widget.selectedItems()]
+        if not todo_ids:
+            todo_ids = [todo["id"] for todo in self.model.todos if todo["checked"]]
+        if todo_ids:
+            self.moveRequested.emit(todo_ids)
+
+    def _show_context_menu(self, pos):
+        item = self.list_widget.itemAt(pos)
+        if item is None or self.model is None:
+            return
+        todo = self.model.get(item.data(Qt.ItemDataRole.UserRole))
+        if todo is None:
+            return
+
+        menu = QMenu(self)
+        for priority, label in TODO_PRIORITY_LABELS.items():
+            action = menu.addAction(f"Prioritaet {label}")
+            action.setCheckable(True)
+            action.setChecked(todo["priority"] == priority)
+            action.setData(("priority", priority))
+        menu.addSeparator()
+        menu.addAction("Faelligkeit setzen ...").setData(("due", None))
+        if todo["due"]:
+            menu.addAction("Faelligkeit entfernen").setData(("due", ""))
+
+        chosen = menu.exec(self.list_widget.viewport().mapToGlobal(pos))
+        if chosen is None or chosen.data() is None:
+            return
+        field, value = chosen.data()
+        if field == "due" and value is None:
+            value = self._ask_due_date(todo["due"])
+            if value is None:
+                return
+        if self.model.update(todo["id"], **{field: value}):
+            self._loading = True
+            self._apply_item_state(item, todo)
+            self._loading = False
+
+    def _ask_due_date(self, current: str) -> str | None:
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Faelligkeit")
+        layout = QVBoxLayout(dialog)
+        date_edit = QDateEdit()
+        date_edit.setCalendarPopup(True)
+        date_edit.setDisplayFormat("dd.MM.yyyy")
+        qd = QDate.fromString(current, Qt.DateFormat.ISODate)
+        date_edit.setDate(qd if qd.isValid() else QDate.currentDate().addDays(7))
+        layout.addWidget(date_edit)
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return None
+        return date_edit.date().toString(Qt.DateFormat.ISODate)
+
+    def _on_item_changed(self, item: QListWidgetItem):
+        if self._loading or self.model is None:
+            return
+        todo = self.model.get(item.data(Qt.ItemDataRole.UserRole))
+        if todo is None:
+            return
+        text = item.text().strip()
+        if not text:
+            # Leere TODOs gibt es nicht: alten Text wiederherstellen.
+            self._loading = True
+            item.setText(todo["text"])
+            self._loading = False
+            text = todo["text"]
+        checked = item.checkState() == Qt.CheckState.Checked
+        if self.model.update(todo["id"], text=text, checked=checked):
+            self._loading = True
+            self._apply_item_state(item, todo)
+            self._loading = False
+
+    def _on_rows_moved(self, *_args):
+        if self._loading or self.model is None:
+            return
+        self.model.reorder(
+            [self.list_widget.item(row).data(Qt.ItemDataRole.UserRole) for row in range(self.list_widget.count())]
+        )
+
+
+class CompletingTextEdit(QTextEdit):
+    def __init__(self, phrase_cache: PhraseCache, parent=None):
+        super().__init__(parent)
+        self.phrase_cache = phrase_cache
+        self._completer = None
+
+    @property
+    def completer(self) -> QCompleter:
+        # Erst beim ersten Tippen anlegen; spart beim Start drei Popups.
+        if self._completer is None:
+            self._completer = QCompleter(self)
+            self._completer.setModel(QStringListModel(self._completer))
+            self._completer.setWidget(self)
+            self._completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+            self._completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+            self._completer.activated.connect(self._insert_completion)
+        return self._completer
+
+    def _line_prefix(self) -> str:
+        cursor = self.textCursor()
+        return _PHRASE_BULLET_RE.sub("", cursor.block().text()[: cursor.positionInBlock()])
+
+    def _insert_completion(self, phrase: str):
+        cursor = self.textCursor()
+        cursor.movePosition(
+            cursor.MoveOperation.Left, cursor.MoveMode.KeepAnchor, len(self._line_prefix())
+        )
+        cursor.insertText(phrase)
+        self.setTextCursor(cursor)
+        self.phrase_cache.add(phrase)
+
+    def keyPressEvent(self, event):
+        popup = self.completer.popup()
+        if popup.isVisible() and event.key() in (
+            Qt.Key.Key_Enter,
+            Qt.Key.Key_Return,
+            Qt.Key.Key_Escape,
+            Qt.Key.Key_Tab,
+            Qt.Key.Key_Backtab,
+        ):
+            # Die Taste gehoert dem Popup.
+            event.ignore()
+            return
+
+        super().keyPressEvent(event)
+        if self.isReadOnly() or not event.text():
+            popup.hide()
+            return
+
+        suggestions = self.phrase_cache.lookup(self._line_prefix())
+        if not suggestions:
+            popup.hide()
+            return
+
+        self.completer.model().setStringList(suggestions)
+        rect = self.cursorRect()
+        rect.setWidth(popup.sizeHintForColumn(0) + popup.verticalScrollBar().sizeHint().width())
+        self.completer.complete(rect)
+        popup.setCurrentIndex(self.completer.completionModel().index(0, 0))
+
+
+# Markdown-Vorschau der Weekly-Felder: kleiner Renderer in reinem Python fuer das,
+# was in Weeklies vorkommt (Absaetze, Ueberschriften, Listen, Code, Links, Betonung).
+MARKDOWN_FIELDS = ("planned", "done", "next_planned")
+MARKDOWN_CACHE_ENTRIES = 600
+_MARKDOWN_HEADING_RE = re.compile(r"(#{1,3})\s+(.*)")
+_MARKDOWN_ITEM_RE = re.compile(r"([-*+]|\d+[.)])\s+(.*)")
+_MARKDOWN_INLINE_RE = re.compile(
+    r"`([^`]+)`"
+    r"|\[([^\]]+)\]\(((?:https?://|mailto:)[^\s)]+)\)"
+    r"|\*\*(.+?)\*\*"
+    r"|(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*"
+    r"|(https?://[^\s<]+[^\s<.,;:!?)])"
+)
+
+
+def _markdown_inline_sub(match: re.Match) -> str:
+    code, label, target, strong, emphasis, url = match.groups()
+    if code is not None:
+        return f"<code>{code}</code>"
+    if label is not None:
+        return f'<a href="{target}">{label}</a>'
+    if strong is not None:
+        return f"<b>{strong}</b>"
+    if emphasis is not None:
+        return f"<i>{emphasis}</i>"
+    return f'<a href="{url}">{url}</a>'
+
+
+def _markdown_inline(text: str) -> str:
+    return _MARKDOWN_INLINE_RE.sub(_markdown_inline_sub, html.escape(text))
+
+
+def render_markdown(text: str) -> str:
+    blocks = []
+    paragraph = []
+    list_tag = None
+    code = None
+
+    def flush_paragraph():
+        if paragraph:
+            blocks.append("<p>" + "<br>".join(_markdown_inline(line) for line in paragraph) + "</p>")
+            paragraph.clear()
+
+    def close_list():
+        nonlocal list_tag
+        if list_tag is not None:
+            blocks.append(f"</{list_tag}>")
+            list_tag = None
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if code is not None:
+            if stripped.startswith("```"):
+                blocks.append("<pre>" + html.escape("\n".join(code)) + "</pre>")
+                code = None
+            else:
+                code.append(line)
+            continue
+        if stripped.startswith("```"):
+            flush_paragraph()
+            close_list()
+            code = []
+            continue
+        if not stripped:
+            flush_paragraph()
+            close_list()
+            continue
+        heading = _MARKDOWN_HEADING_RE.fullmatch(stripped)
+        if heading:
+            flush_paragraph()
+            close_list()
+            # h3-h5: im Feld soll eine Ueberschrift nicht groesser als die Gruppentitel werden.
+            level = len(heading.group(1)) + 2
+            blocks.append(f"<h{level}>{_markdown_inline(heading.group(2))}</h{level}>")
+            continue
+        item = _MARKDOWN_ITEM_RE.fullmatch(stripped)
+        if item:
+            flush_paragraph()
+            tag = "ol" if item.group(1)[0].isdigit() else "ul"
+            if tag != list_tag:
+                close_list()
+                blocks.append(f"<{tag}>")
+                list_tag = tag
+            blocks.append(f"<li>{_markdown_inline(item.group(2))}</li>")
+            continue
+        close_list()
+        paragraph.append(stripped)
+
+    if code is not None:
+        blocks.append("<pre>" + html.escape("\n".join(code)) + "</pre>")
+    flush_paragraph()
+    close_list()
+    return "\n".join(blocks)
+
+
+class MarkdownCache:
+    # (Weekly-id, Feld) -> (Inhalts-Hash, HTML) mit LRU-Verdraengung. Ein geaenderter
+    # Text hat einen anderen Hash und gilt als Fehlschlag; alles andere bleibt gerendert.
+    def __init__(self, max_entries: int = MARKDOWN_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, weekly_id: str, field: str, digest: bytes) -> str | None:
+        entry = self._entries.get((weekly_id, field))
+        if entry is None or entry[0] != digest:
+            self.misses += 1
+            return None
+        self._entries.move_to_end((weekly_id, field))
+        self.hits += 1
+        return entry[1]
+
+    def put(self, weekly_id: str, field: str, digest: bytes, markup: str):
+        self._entries[(weekly_id, field)] = (digest, markup)
+        self._entries.move_to_end((weekly_id, field))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
-    def _on_item_changed(self, _item: QListWidgetItem):
-        if not self._loading:
-            self.tasksChanged.emit()
+class MarkdownWorker(QObject):
+    # Laeuft im eigenen QThread; Ergebnisse gehen per Signal an den Cache im UI-Thread.
+    rendered = pyqtSignal(str, str, bytes, str)
+
+    def render(self, jobs: list):
+        for weekly_id, field, digest, text in jobs:
+            self.rendered.emit(weekly_id, field, digest, render_markdown(text))
 
 
 class DeselectableListWidget(QListWidget):
@@ -300,37 +3037,526 @@ class Card(QFrame):
         layout.addLayout(self.content_layout)
 
 
-class WeeklyManagerWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Studierenden-Weeklies-Manager")
-        self.resize(1460, 900)
+class ArchiveDialog(QDialog):
+    def __init__(self, semesters: dict, errors: dict, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Semester-Archiv (nur lesen)")
+        self.resize(1100, 720)
+        self.semesters = semesters
 
-        self.data = {"version": 4, "students": {}}
-        self.current_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "weeklies.json")
-        self.default_open_dir = os.path.dirname(os.path.abspath(__file__))
+        root = QVBoxLayout(self)
+
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Suche in Studierenden, Projekten und Weeklies ...")
+        root.addWidget(self.search_edit)
+
+        self.summary_label = QLabel()
+        self.summary_label.setObjectName("SubtleLabel")
+        root.addWidget(self.summary_label)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        root.addWidget(splitter, 1)
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["Eintrag", "Details"])
+        splitter.addWidget(self.tree)
+
+        self.preview = QTextEdit()
+        self.preview.setReadOnly(True)
+        splitter.addWidget(self.preview)
+        splitter.setSizes([600, 500])
+
+        if errors:
+            error_label = QLabel(
+                "Nicht geladen: " + "; ".join(f"{semester}: {message}" for semester, message in errors.items())
+            )
+            error_label.setWordWrap(True)
+            root.addWidget(error_label)
+
+        self.search_edit.textChanged.connect(self._rebuild_tree)
+        self.tree.currentItemChanged.connect(self._on_item_changed)
+        self._rebuild_tree()
+
+    def _rebuild_tree(self):
+        query = self.search_edit.text().strip()
+        self.tree.clear()
+        self.preview.clear()
+
+        if query:
+            hits = search_archive(self.semesters, query)
+        else:
+            hits = list(iter_archive_weeklies(self.semesters))
+
+        nodes = {}
+        for semester, student_name, project_name, weekly in hits:
+            parent = self.tree.invisibleRootItem()
+            path = ()
+            for label in (semester, student_name, project_name):
+                path += (label,)
+                node = nodes.get(path)
+                if node is None:
+                    node = QTreeWidgetItem(parent, [label, ""])
+                    nodes[path] = node
+                parent = node
+            item = QTreeWidgetItem(parent, [weekly.date, weekly.title.strip() or "Ohne Titel"])
+            item.setData(0, Qt.ItemDataRole.UserRole, weekly)
+
+        student_count = len({(semester, student) for semester, student, _, _ in hits})
+        self.summary_label.setText(
+            f"{len(self.semesters)} Semester - {student_count} Studierende - {len(hits)} Weekly(s)"
+        )
+        if query:
+            self.tree.expandAll()
+
+    def _on_item_changed(self, current: QTreeWidgetItem, previous: QTreeWidgetItem):
+        weekly = current.data(0, Qt.ItemDataRole.UserRole) if current is not None else None
+        if not isinstance(weekly, WeeklyRecord):
+            self.preview.clear()
+            return
+        self.preview.setPlainText(
+            f"{weekly.date} - {weekly.title or 'Ohne Titel'}\n\n"
+            f"Was war geplant?\n{weekly.planned}\n\n"
+            f"Was wurde gemacht?\n{weekly.done}\n\n"
+            f"Was ist geplant?\n{weekly.next_planned}"
+        )
+
+
+class TodoArchiveDialog(QDialog):
+    ALL_STUDENTS = "Alle Studierenden"
+
+    def __init__(self, store: TodoColdStore, students: dict[str, str], current_student: str | None, parent=None):
+        # students: Name -> id; angezeigt wird der aktuelle Name, auch fuer vor dem Umbenennen Archiviertes.
+        super().__init__(parent)
+        self.setWindowTitle("Archivierte TODOs")
+        self.resize(760, 560)
+        self.store = store
+        self.students = students
+        self._names_by_id = {student_id: name for name, student_id in students.items()}
+
+        root = QVBoxLayout(self)
+        filter_row = QHBoxLayout()
+        self.student_combo = QComboBox()
+        self.student_combo.addItem(self.ALL_STUDENTS)
+        self.student_combo.addItems(sorted(students, key=str.lower))
+        if current_student in students:
+            self.student_combo.setCurrentText(current_student)
+        filter_row.addWidget(self.student_combo, 1)
+
+        filter_row.addWidget(QLabel("Von"))
+        self.since_edit = QDateEdit(QDate.currentDate().addMonths(-6))
+        self.since_edit.setCalendarPopup(True)
+        self.since_edit.setDisplayFormat("dd.MM.yyyy")
+        filter_row.addWidget(self.since_edit)
+        filter_row.addWidget(QLabel("Bis"))
+        self.until_edit = QDateEdit(QDate.currentDate())
+        self.until_edit.setCalendarPopup(True)
+        self.until_edit.setDisplayFormat("dd.MM.yyyy")
+        filter_row.addWidget(self.until_edit)
+
+        self.text_edit = QLineEdit()
+        self.text_edit.setPlaceholderText("Text enthaelt ...")
+        filter_row.addWidget(self.text_edit, 1)
+        self.btn_query = QPushButton("Abfragen")
+        filter_row.addWidget(self.btn_query)
+        root.addLayout(filter_row)
+
+        self.summary_label = QLabel()
+        self.summary_label.setObjectName("SubtleLabel")
+        root.addWidget(self.summary_label)
+        self.result_list = QListWidget()
+        self.result_list.setSelectionMode(QListWidget.SelectionMode.NoSelection)
+        root.addWidget(self.result_list, 1)
+
+        self.btn_query.clicked.connect(self.run_query)
+        self.text_edit.returnPressed.connect(self.run_query)
+        self.run_query()
+
+    def run_query(self):
+        student = self.student_combo.currentText()
+        records = self.store.query(
+            student=None if student == self.ALL_STUDENTS else student,
+            since=self.since_edit.date().toString(Qt.DateFormat.ISODate),
+            until=self.until_edit.date().toString(Qt.DateFormat.ISODate),
+            text=self.text_edit.text(),
+            student_id=self.students.get(student),
+        )
+        self.result_list.clear()
+        for record in records:
+            archived_at = QDate.fromString(record.get("archived_at", ""), Qt.DateFormat.ISODate).toString("dd.MM.yyyy")
+            name = self._names_by_id.get(record.get("student_id"), record.get("student", ""))
+            self.result_list.addItem(f"{archived_at} [{name} | {record.get('project', '')}] {record.get('text', '')}")
+        self.summary_label.setText(f"{len(records)} erledigte TODO(s) im Zeitraum")
+
+
+class BackupDialog(QDialog):
+    def __init__(self, store: BackupStore, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Sicherungen")
+        self.resize(560, 480)
+
+        root = QVBoxLayout(self)
+        hint = QLabel("Gewaehlten Stand wiederherstellen. Der aktuelle Stand wird vorher ebenfalls gesichert.")
+        hint.setObjectName("SubtleLabel")
+        hint.setWordWrap(True)
+        root.addWidget(hint)
+
+        self.version_list = QListWidget()
+        for version in reversed(store.versions):
+            stamp = QDateTime.fromSecsSinceEpoch(int(version["ts"])).toString("dd.MM.yyyy HH:mm")
+            kind = "Basis" if version["kind"] == "base" else "Delta"
+            item = QListWidgetItem(
+                f"{stamp}  -  {version['size'] / 1024:.0f} KB  ({kind}, gespeichert {version['stored'] / 1024:.1f} KB)"
+            )
+            item.setData(Qt.ItemDataRole.UserRole, version["seq"])
+            self.version_list.addItem(item)
+        self.version_list.setCurrentRow(0)
+        root.addWidget(self.version_list, 1)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Cancel)
+        self.btn_restore = buttons.addButton("Wiederherstellen", QDialogButtonBox.ButtonRole.AcceptRole)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        self.version_list.itemDoubleClicked.connect(lambda _item: self.accept())
+        root.addWidget(buttons)
 
+    def selected_seq(self) -> int | None:
+        item = self.version_list.currentItem()
+        return int(item.data(Qt.ItemDataRole.UserRole)) if item is not None else None
+
+
+class QuickSwitcherDialog(QDialog):
+    def __init__(self, index: SwitcherIndex, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Springen zu ...")
+        self.resize(620, 420)
+        self.index = index
+
+        root = QVBoxLayout(self)
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Name, Projekt, Datum oder Titel ...")
+        self.search_edit.installEventFilter(self)
+        root.addWidget(self.search_edit)
+        self.result_list = QListWidget()
+        root.addWidget(self.result_list, 1)
+
+        self.search_edit.textChanged.connect(self.run_query)
+        self.search_edit.returnPressed.connect(self.accept)
+        self.result_list.itemActivated.connect(lambda _item: self.accept())
+
+    def eventFilter(self, obj, event):
+        # Pfeiltasten im Suchfeld bewegen die Auswahl in der Trefferliste.
+        if obj is self.search_edit and event.type() == event.Type.KeyPress:
+            if event.key() in (Qt.Key.Key_Down, Qt.Key.Key_Up):
+                step = 1 if event.key() == Qt.Key.Key_Down else -1
+                row = max(0, min(self.result_list.count() - 1, self.result_list.currentRow() + step))
+                self.result_list.setCurrentRow(row)
+                return True
+        return super().eventFilter(obj, event)
+
+    def run_query(self, text: str):
+        self.result_list.clear()
+        for path, label in self.index.query(text):
+            item = QListWidgetItem(label)
+            item.setData(Qt.ItemDataRole.UserRole, path)
+            self.result_list.addItem(item)
+        self.result_list.setCurrentRow(0)
+
+    def selected_path(self) -> tuple | None:
+        item = self.result_list.currentItem()
+        return tuple(item.data(Qt.ItemDataRole.UserRole)) if item is not None else None
+
+
+class AnalyticsDialog(QDialog):
+    def __init__(self, report: dict, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Auswertung")
+        self.resize(760, 600)
+
+        root = QVBoxLayout(self)
+        completion = report["todo_completion"]
+        summary = QLabel(
+            f"{report['students']} Studierende - {report['weeklies']} Weekly(s) - "
+            f"Zeichen erledigt/geplant: {report['avg_done_chars']:.0f}/{report['avg_planned_chars']:.0f} - "
+            f"TODO-Quote: {'-' if completion is None else f'{completion:.0%}'}"
+        )
+        summary.setObjectName("SubtleLabel")
+        root.addWidget(summary)
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["Eintrag", "Wert"])
+        self.tree.setColumnWidth(0, 380)
+        root.addWidget(self.tree, 1)
+
+        behind = QTreeWidgetItem([f"Projekte im Verzug ({len(report['behind_schedule'])})", ""])
+        for row in report["behind_schedule"]:
+            QTreeWidgetItem(
+                behind,
+                [
+                    f"{row['student']} | {row['project']}",
+                    f"Zeit {row['time_progress']}% - TODOs {row['todo_completion']:.0%}",
+                ],
+            )
+        weeks = QTreeWidgetItem(["Weeklies je Woche", ""])
+        for row in reversed(report["weeks"]):
+            monday = QDate.fromString(row["week"], Qt.DateFormat.ISODate).toString("dd.MM.yyyy")
+            QTreeWidgetItem(
+                weeks,
+                [
+                    f"Woche ab {monday}",
+                    f"{row['weeklies']} Weekly(s), {row['students']} Studierende, "
+                    f"{row['weeklies_per_student']:.1f} je Person",
+                ],
+            )
+        students = QTreeWidgetItem(["Je Studierende", ""])
+        for name in sorted(report["per_student"], key=str.lower):
+            row = report["per_student"][name]
+            rate = "-" if row["todo_completion"] is None else f"{row['todo_completion']:.0%}"
+            QTreeWidgetItem(
+                students,
+                [
+                    name,
+                    f"{row['weeklies']} Weekly(s), erledigt/geplant "
+                    f"{row['avg_done_chars']:.0f}/{row['avg_planned_chars']:.0f} Zeichen, TODOs {rate}",
+                ],
+            )
+        self.tree.addTopLevelItems([behind, weeks, students])
+        behind.setExpanded(True)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(self.reject)
+        root.addWidget(buttons)
+
+
+class BulkReplaceDialog(QDialog):
+    # search(muster, ersetzung, regex, gross_klein, bereich, felder) -> Treffer aus find_replacements.
+    def __init__(self, search, scopes: list[tuple[str, str]], parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Suchen und Ersetzen")
+        self.resize(980, 620)
+        self.search = search
+        self.matches = []
+
+        root = QVBoxLayout(self)
+        form = QFormLayout()
+        self.find_edit = QLineEdit()
+        form.addRow("Suchen:", self.find_edit)
+        self.replace_edit = QLineEdit()
+        form.addRow("Ersetzen durch:", self.replace_edit)
+        self.scope_combo = QComboBox()
+        for label, scope in scopes:
+            self.scope_combo.addItem(label, scope)
+        form.addRow("Bereich:", self.scope_combo)
+        root.addLayout(form)
+
+        options = QHBoxLayout()
+        self.chk_regex = QCheckBox("Regulaerer Ausdruck")
+        self.chk_case = QCheckBox("Gross-/Kleinschreibung beachten")
+        self.chk_weeklies = QCheckBox("Weeklies")
+        self.chk_weeklies.setChecked(True)
+        self.chk_todos = QCheckBox("TODOs")
+        self.chk_todos.setChecked(True)
+        self.btn_preview = QPushButton("Vorschau")
+        for widget in (self.chk_regex, self.chk_case, self.chk_weeklies, self.chk_todos):
+            options.addWidget(widget)
+        options.addStretch(1)
+        options.addWidget(self.btn_preview)
+        root.addLayout(options)
+
+        self.summary_label = QLabel("Vorschau erstellen, um Treffer zu sehen.")
+        self.summary_label.setObjectName("SubtleLabel")
+        root.addWidget(self.summary_label)
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["Ort", "Feld", "Vorher", "Nachher"])
+        self.tree.setRootIsDecorated(False)
+        root.addWidget(self.tree, 1)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Cancel)
+        self.btn_apply = buttons.addButton("Ersetzen", QDialogButtonBox.ButtonRole.AcceptRole)
+        self.btn_apply.setEnabled(False)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        root.addWidget(buttons)
+
+        self.btn_preview.clicked.connect(self.run_preview)
+        self.find_edit.returnPressed.connect(self.run_preview)
+        # Jede Aenderung an der Suche macht die Vorschau ungueltig.
+        for signal in (
+            self.find_edit.textChanged,
+            self.replace_edit.textChanged,
+            self.scope_combo.currentIndexChanged,
+            self.chk_regex.toggled,
+            self.chk_case.toggled,
+            self.chk_weeklies.toggled,
+            self.chk_todos.toggled,
+        ):
+            signal.connect(self._invalidate_preview)
+
+    def _invalidate_preview(self, *_args):
+        self.matches = []
+        self.tree.clear()
+        self.btn_apply.setEnabled(False)
+
+    def run_preview(self):
+        self._invalidate_preview()
+        pattern = self.find_edit.text()
+        if not pattern:
+            self.summary_label.setText("Suchbegriff fehlt.")
+            return
+        fields = (BULK_WEEKLY_FIELDS if self.chk_weeklies.isChecked() else ()) + (
+            ("text",) if self.chk_todos.isChecked() else ()
+        )
+        try:
+            matches = self.search(
+                pattern,
+                self.replace_edit.text(),
+                self.chk_regex.isChecked(),
+                self.chk_case.isChecked(),
+                self.scope_combo.currentData(),
+                fields,
+            )
+        except re.error as exc:
+            self.summary_label.setText(f"Ungueltiger Ausdruck: {exc}")
+            return
+
+        for match in matches:
+            before, after = _change_snippet(match["before"], match["after"])
+            item = QTreeWidgetItem([match["location"], BULK_FIELD_LABELS[match["field"]], before, after])
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(0, Qt.CheckState.Checked)
+            item.setToolTip(2, match["before"])
+            item.setToolTip(3, match["after"])
+            self.tree.addTopLevelItem(item)
+        self.matches = matches
+        total = sum(match["count"] for match in matches)
+        self.summary_label.setText(f"{total} Treffer in {len(matches)} Feld(ern)")
+        self.btn_apply.setEnabled(bool(matches))
+        for column in range(2):
+            self.tree.resizeColumnToContents(column)
+
+    def selected_matches(self) -> list[dict]:
+        return [
+            match
+            for row, match in enumerate(self.matches)
+            if self.tree.topLevelItem(row).checkState(0) == Qt.CheckState.Checked
+        ]
+
+
+class WeeklyManagerWindow(QMainWindow):
+    startup_finished = pyqtSignal()
+    markdown_requested = pyqtSignal(list)
+
+    def __init__(self, file_path: str | None = None):
+        super().__init__()
+        self.setWindowTitle("Studierenden-Weeklies-Manager")
+        self.resize(1460, 900)
+
+        self.data = {"version": DATA_VERSION, "students": {}}
+        self.current_file = file_path or os.path.join(os.path.dirname(os.path.abspath(__file__)), "weeklies.json")
+        self.default_open_dir = os.path.dirname(os.path.abspath(__file__))
+        self.templates_file = os.path.join(self.default_open_dir, "weekly_templates.json")
+        self.backup_policy = load_backup_policy(os.path.join(self.default_open_dir, "weekly_backup.json"))
+        self.phrase_cache = PhraseCache(loader=self._iter_weekly_texts)
+        self._phrase_baseline = None
+        self._change_feed = None
+        # Noch nicht geschriebene Ereignisse; Feldaenderungen je Datensatz zusammengefasst.
+        self._pending_changes = []
+        self._pending_updates = {}
+        self._unhandled_changes = False
+        self._todo_feed_state = {}
+        # Archivierte TODOs gehen erst nach erfolgreichem Speichern in den Archivspeicher.
+        self._pending_todo_archive = []
+        self._feed_timer = QTimer(self)
+        self._feed_timer.setSingleShot(True)
+        self._feed_timer.setInterval(CHANGE_FEED_DEBOUNCE_MS)
+        self._feed_timer.timeout.connect(self._flush_change_feed)
+        self._serializer = FragmentSerializer()
+        self._saved_digest = None
+        self._storage_stats = {}
+
+        # Auswahl: Name der Person, dazu Projekt und Weekly per id (aufgeloest ueber self.records).
         self.current_student = None
-        self.current_project_index = None
-        self.current_weekly_index = None
+        self.current_project_id = None
+        self.current_weekly_id = None
+        self.records = RecordIndex()
+        # Listeneintraege je Name bzw. id, damit Auswahl und Beschriftung ohne Zeilensuche gehen.
+        self._student_items = {}
+        self._project_items = {}
+        self._weekly_items = {}
 
         self._loading_ui = False
         self._dirty = False
         self._autosave_enabled = True
+        self._read_only = False
+        self._mapped_archive = None
+        self._load_thread = None
+        self._load_worker = None
+        self._api_server = None
+        self._api_bridge = ApiBridge(self)
+        self._markdown_cache = MarkdownCache()
+        self._markdown_pending = set()
+        self._markdown_thread = None
+        self._markdown_worker = None
+        self._attachment_store = None
+        self._thumbnails = ThumbnailLoader(self)
+
+        self._stale_views = set()
+        self._refresh_counts = Counter()
+        self._refresh_flushes = 0
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._flush_refresh)
+        self._backup_store = None
+        self._switcher_index = None
+        self._text_index = None
+        self._predicate_index = None
+        self._sorted_student_names = None
+        self._active_filters = set()
+        self.analytics = AnalyticsEngine()
+        self._data_version = 0
+        self._backup_thread = None
+        self._backup_error = None
+        self._backup_timer = QTimer(self)
+        self._backup_timer.setInterval(max(1, self.backup_policy["interval_minutes"]) * 60000)
+        self._backup_timer.timeout.connect(self._run_scheduled_backup)
+        if self.backup_policy["interval_minutes"] > 0:
+            self._backup_timer.start()
+        self.themes = ThemeRegistry(themes_dir_for(self.default_open_dir))
+        self._theme = None
         self._theme_mode = self._detect_system_theme()
 
+        # Style und Schrift einmalig setzen; ein Themewechsel tauscht nur Palette und Stylesheet.
+        QApplication.setStyle(QStyleFactory.create("Fusion"))
+        font = QFont()
+        font.setPointSize(10)
+        self.setFont(font)
         self._build_ui()
         self._apply_theme(self._theme_mode)
         self._connect_signals()
-        self._load_or_create_default_file()
+        # Die Datei wird erst nach dem ersten Zeichnen der Studierendenliste geladen.
+        self._startup_pending = True
+        self.student_list.viewport().installEventFilter(self)
         self._set_saved_state(saved=True)
         self._update_window_title()
+        STARTUP_PROFILE.mark("construct")
 
     # ------------------------------------------------------------------
     # UI
     # ------------------------------------------------------------------
     def _build_ui(self):
         self.setStatusBar(QStatusBar(self))
+        self.load_progress = QProgressBar()
+        self.load_progress.setMaximumWidth(220)
+        self.load_progress.setTextVisible(True)
+        self.btn_cancel_load = QPushButton("Abbrechen")
+        self.storage_label = QLabel()
+        self.storage_label.setVisible(False)
+        self.statusBar().addPermanentWidget(self.storage_label)
+        self.statusBar().addPermanentWidget(self.load_progress)
+        self.statusBar().addPermanentWidget(self.btn_cancel_load)
+        self.load_progress.setVisible(False)
+        self.btn_cancel_load.setVisible(False)
 
         toolbar = QToolBar("Hauptleiste")
         toolbar.setMovable(False)
@@ -338,6 +3564,42 @@ class WeeklyManagerWindow(QMainWindow):
 
         self.act_open = QAction("Laden", self)
         toolbar.addAction(self.act_open)
+        self.act_open_archive = QAction("Archiv oeffnen", self)
+        toolbar.addAction(self.act_open_archive)
+        self.act_open_mapped_archive = QAction("Archiv lesen", self)
+        self.act_open_mapped_archive.setToolTip("Grosses Archiv speicherschonend im Nur-Lese-Modus oeffnen")
+        toolbar.addAction(self.act_open_mapped_archive)
+        self.act_backups = QAction("Sicherungen", self)
+        self.act_backups.setToolTip("Fruehere Staende der Datei wiederherstellen")
+        toolbar.addAction(self.act_backups)
+        self.act_quick_switch = QAction("Springen", self)
+        self.act_quick_switch.setShortcut("Ctrl+K")
+        self.act_quick_switch.setToolTip("Studierende, Projekte und Weeklies suchen (Ctrl+K)")
+        toolbar.addAction(self.act_quick_switch)
+        self.act_bulk_replace = QAction("Ersetzen", self)
+        self.act_bulk_replace.setShortcut("Ctrl+H")
+        self.act_bulk_replace.setToolTip("Text in Weeklies und TODOs suchen und ersetzen (Ctrl+H)")
+        toolbar.addAction(self.act_bulk_replace)
+        self.act_analytics = QAction("Auswertung", self)
+        self.act_analytics.setToolTip("Kohorten-Trends, TODO-Quoten und Projekte im Verzug")
+        toolbar.addAction(self.act_analytics)
+        self.act_api = QAction("API", self)
+        self.act_api.setCheckable(True)
+        self.act_api.setToolTip(f"Nur-Lese-HTTP-Schnittstelle auf 127.0.0.1:{API_DEFAULT_PORT} starten/stoppen")
+        toolbar.addAction(self.act_api)
+        self.btn_storage_format = QPushButton("Format")
+        self.btn_storage_format.setToolTip("Speicherformat der aktuellen Datei: JSON, gzip oder lzma")
+        storage_menu = QMenu(self.btn_storage_format)
+        storage_group = QActionGroup(storage_menu)
+        self.storage_actions = {}
+        for codec, label in STORAGE_LABELS.items():
+            action = storage_menu.addAction(label)
+            action.setCheckable(True)
+            action.setData(codec)
+            storage_group.addAction(action)
+            self.storage_actions[codec] = action
+        self.btn_storage_format.setMenu(storage_menu)
+        toolbar.addWidget(self.btn_storage_format)
         toolbar.addSeparator()
 
         self.theme_toggle_btn = QPushButton()
@@ -345,15 +3607,26 @@ class WeeklyManagerWindow(QMainWindow):
         self.theme_toggle_btn.setChecked(self._theme_mode == "dark")
         self._update_theme_toggle_button()
         toolbar.addWidget(self.theme_toggle_btn)
+        self.theme_combo = QComboBox()
+        self.theme_combo.setToolTip("Theme waehlen (eigene Themes aus weekly_themes/*.json)")
+        self.theme_combo.addItems(self.themes.names())
+        self.theme_combo.setCurrentText(self._theme_mode)
+        toolbar.addWidget(self.theme_combo)
+        if self.themes.errors:
+            self.theme_combo.setToolTip(
+                self.theme_combo.toolTip() + "\nNicht geladen:\n" + "\n".join(self.themes.errors)
+            )
         toolbar.addSeparator()
 
         self.act_add_student = QAction("Studierende hinzufuegen", self)
         self.act_remove_student = QAction("Studierende entfernen", self)
+        self.act_rename_student = QAction("Studierende umbenennen", self)
 
         self.act_add_project = QAction("Projekt hinzufuegen", self)
         self.act_remove_project = QAction("Projekt entfernen", self)
 
         self.act_new_weekly = QAction("Neues Weekly", self)
+        self.act_weekly_from_template = QAction("Weekly aus Vorlage", self)
         self.act_delete_weekly = QAction("Weekly entfernen", self)
         toolbar.addSeparator()
 
@@ -390,6 +3663,18 @@ class WeeklyManagerWindow(QMainWindow):
         self.left_card = Card("Studierende")
         self.main_splitter.addWidget(self.left_card)
 
+        self.btn_student_filter = QPushButton("Filter")
+        self.btn_student_filter.setToolTip("Studierende und Projekte nach Risiko filtern (Filter werden kombiniert)")
+        filter_menu = QMenu(self.btn_student_filter)
+        self.filter_actions = {}
+        for name, label in FILTER_PREDICATES.items():
+            action = filter_menu.addAction(label)
+            action.setCheckable(True)
+            action.setData(name)
+            self.filter_actions[name] = action
+        self.btn_student_filter.setMenu(filter_menu)
+        self.left_card.content_layout.addWidget(self.btn_student_filter)
+
         self.student_list = DeselectableListWidget()
         self.student_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         self.left_card.content_layout.addWidget(self.student_list, 1)
@@ -397,7 +3682,9 @@ class WeeklyManagerWindow(QMainWindow):
         student_btn_row = QHBoxLayout()
         self.btn_add_student = QPushButton("Hinzufuegen")
         self.btn_remove_student = QPushButton("Entfernen")
+        self.btn_rename_student = QPushButton("Umbenennen")
         student_btn_row.addWidget(self.btn_add_student)
+        student_btn_row.addWidget(self.btn_rename_student)
         student_btn_row.addWidget(self.btn_remove_student)
         self.left_card.content_layout.addLayout(student_btn_row)
 
@@ -430,7 +3717,9 @@ class WeeklyManagerWindow(QMainWindow):
         weekly_btn_row = QHBoxLayout()
         self.btn_new_weekly = QPushButton("Neues Weekly")
         self.btn_delete_weekly = QPushButton("Weekly entfernen")
+        self.btn_weekly_from_template = QPushButton("Aus Vorlage")
         weekly_btn_row.addWidget(self.btn_new_weekly)
+        weekly_btn_row.addWidget(self.btn_weekly_from_template)
         weekly_btn_row.addWidget(self.btn_delete_weekly)
         self.middle_card.content_layout.addLayout(weekly_btn_row)
 
@@ -465,26 +3754,12 @@ class WeeklyManagerWindow(QMainWindow):
         self.project_progress.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.right_card.content_layout.addWidget(self.project_progress)
 
+        # Der TODO-Bereich ist anfangs ausgeblendet; Inhalt entsteht erst in _ensure_todo_area().
         self.todo_area_container = QWidget()
         todo_area_layout = QVBoxLayout(self.todo_area_container)
         todo_area_layout.setContentsMargins(0, 0, 0, 0)
         todo_area_layout.setSpacing(10)
-
-        self.grp_project_todos = QGroupBox("Projekt-TODOs")
-        project_todo_layout = QVBoxLayout(self.grp_project_todos)
-        self.project_todos_widget = TaskListWidget("Neue TODO ...")
-        project_todo_layout.addWidget(self.project_todos_widget)
-        todo_area_layout.addWidget(self.grp_project_todos, 1)
-
-        self.grp_todo_context = QGroupBox("Offene TODOs (Kontext)")
-        todo_context_layout = QVBoxLayout(self.grp_todo_context)
-        self.todo_context_label = QLabel("Kontext: Gesamt")
-        self.todo_context_label.setObjectName("SubtleLabel")
-        self.todo_context_list = QListWidget()
-        self.todo_context_list.setSelectionMode(QListWidget.SelectionMode.NoSelection)
-        todo_context_layout.addWidget(self.todo_context_label)
-        todo_context_layout.addWidget(self.todo_context_list, 1)
-        todo_area_layout.addWidget(self.grp_todo_context, 1)
+        self.project_todos_widget = None
         self.right_card.content_layout.addWidget(self.todo_area_container, 1)
 
         self.weekly_editor_container = QWidget()
@@ -504,25 +3779,62 @@ class WeeklyManagerWindow(QMainWindow):
         self.weekly_date_edit.setCalendarPopup(True)
         self.weekly_date_edit.setDisplayFormat("dd.MM.yyyy")
         weekly_meta_row.addWidget(self.weekly_date_edit)
+        self.btn_save_template = QPushButton("Als Vorlage")
+        self.btn_save_template.setToolTip("Aktuelles Weekly als Vorlage speichern")
+        weekly_meta_row.addWidget(self.btn_save_template)
+        self.btn_markdown_preview = QPushButton("Vorschau")
+        self.btn_markdown_preview.setCheckable(True)
+        self.btn_markdown_preview.setToolTip("Weekly-Felder als Markdown anzeigen (Listen, Links, Code)")
+        weekly_meta_row.addWidget(self.btn_markdown_preview)
         weekly_editor_layout.addLayout(weekly_meta_row)
 
         self.grp_planned = QGroupBox("Was war geplant?")
         planned_layout = QVBoxLayout(self.grp_planned)
-        self.txt_planned = QTextEdit()
+        self.txt_planned = CompletingTextEdit(self.phrase_cache)
         planned_layout.addWidget(self.txt_planned)
         weekly_editor_layout.addWidget(self.grp_planned, 1)
 
         self.grp_done = QGroupBox("Was wurde gemacht?")
         done_layout = QVBoxLayout(self.grp_done)
-        self.txt_done = QTextEdit()
+        self.txt_done = CompletingTextEdit(self.phrase_cache)
         done_layout.addWidget(self.txt_done)
         weekly_editor_layout.addWidget(self.grp_done, 1)
 
         self.grp_next = QGroupBox("Was ist geplant?")
         next_layout = QVBoxLayout(self.grp_next)
-        self.txt_next = QTextEdit()
+        self.txt_next = CompletingTextEdit(self.phrase_cache)
         next_layout.addWidget(self.txt_next)
         weekly_editor_layout.addWidget(self.grp_next, 1)
+
+        self.grp_attachments = QGroupBox("Anhaenge")
+        attachments_layout = QHBoxLayout(self.grp_attachments)
+        self.attachment_list = QListWidget()
+        self.attachment_list.setViewMode(QListWidget.ViewMode.IconMode)
+        self.attachment_list.setIconSize(QSize(ATTACHMENT_THUMB_PX, ATTACHMENT_THUMB_PX))
+        self.attachment_list.setFlow(QListWidget.Flow.LeftToRight)
+        self.attachment_list.setWrapping(False)
+        self.attachment_list.setMovement(QListWidget.Movement.Static)
+        self.attachment_list.setFixedHeight(ATTACHMENT_THUMB_PX + 48)
+        self.attachment_list.setToolTip("Doppelklick oeffnet den Anhang")
+        attachments_layout.addWidget(self.attachment_list, 1)
+        attachment_buttons = QVBoxLayout()
+        self.btn_add_attachment = QPushButton("Hinzufuegen")
+        self.btn_add_attachment.setToolTip("Dateien (z. B. Screenshots, PDFs) an dieses Weekly haengen")
+        attachment_buttons.addWidget(self.btn_add_attachment)
+        self.btn_remove_attachment = QPushButton("Entfernen")
+        attachment_buttons.addWidget(self.btn_remove_attachment)
+        attachment_buttons.addStretch(1)
+        attachments_layout.addLayout(attachment_buttons)
+        weekly_editor_layout.addWidget(self.grp_attachments)
+
+        # Vorschau je Feld an derselben Stelle wie der Editor, anfangs ausgeblendet.
+        self.markdown_views = {}
+        for field, layout in zip(MARKDOWN_FIELDS, (planned_layout, done_layout, next_layout)):
+            browser = QTextBrowser()
+            browser.setOpenExternalLinks(True)
+            browser.setVisible(False)
+            layout.addWidget(browser)
+            self.markdown_views[field] = browser
         self.right_card.content_layout.addWidget(self.weekly_editor_container, 1)
 
         self.right_card_bottom_stretch_index = self.right_card.content_layout.count()
@@ -539,12 +3851,27 @@ class WeeklyManagerWindow(QMainWindow):
 
     def _connect_signals(self):
         self.act_open.triggered.connect(self.load_json_dialog)
+        self.btn_cancel_load.clicked.connect(self.cancel_background_load)
+        self.act_open_archive.triggered.connect(self.open_archive_dialog)
+        self.act_open_mapped_archive.triggered.connect(self.open_mapped_archive_dialog)
+        self.act_backups.triggered.connect(self.open_backup_dialog)
+        self.act_quick_switch.triggered.connect(self.open_quick_switcher)
+        self.act_bulk_replace.triggered.connect(self.open_bulk_replace_dialog)
+        for action in self.filter_actions.values():
+            action.toggled.connect(self._on_filters_changed)
+        self.act_analytics.triggered.connect(self.open_analytics_dialog)
+        self.act_api.toggled.connect(self._set_api_enabled)
+        for action in self.storage_actions.values():
+            action.triggered.connect(lambda _checked, codec=action.data(): self.convert_storage_format(codec))
         self.theme_toggle_btn.toggled.connect(self._on_theme_toggled)
+        self.theme_combo.textActivated.connect(self._set_theme)
         self.act_add_student.triggered.connect(self.add_student)
         self.act_remove_student.triggered.connect(self.remove_student)
+        self.act_rename_student.triggered.connect(self.rename_student)
         self.act_add_project.triggered.connect(self.add_project)
         self.act_remove_project.triggered.connect(self.remove_project)
         self.act_new_weekly.triggered.connect(self.add_weekly)
+        self.act_weekly_from_template.triggered.connect(self.add_weekly_from_template)
         self.act_delete_weekly.triggered.connect(self.delete_weekly)
         self.act_toggle_students_column.toggled.connect(self.left_card.setVisible)
         self.act_toggle_projects_column.toggled.connect(self.middle_card.setVisible)
@@ -553,9 +3880,17 @@ class WeeklyManagerWindow(QMainWindow):
 
         self.btn_add_student.clicked.connect(self.add_student)
         self.btn_remove_student.clicked.connect(self.remove_student)
+        self.btn_rename_student.clicked.connect(self.rename_student)
         self.btn_add_project.clicked.connect(self.add_project)
         self.btn_remove_project.clicked.connect(self.remove_project)
         self.btn_new_weekly.clicked.connect(self.add_weekly)
+        self.btn_weekly_from_template.clicked.connect(self.add_weekly_from_template)
+        self.btn_save_template.clicked.connect(self.save_current_weekly_as_template)
+        self.btn_markdown_preview.toggled.connect(self._set_markdown_preview)
+        self.btn_add_attachment.clicked.connect(self.add_attachments)
+        self.btn_remove_attachment.clicked.connect(self.remove_attachment)
+        self.attachment_list.itemDoubleClicked.connect(self.open_attachment)
+        self._thumbnails.ready.connect(self._on_thumbnail_ready)
         self.btn_delete_weekly.clicked.connect(self.delete_weekly)
 
         self.student_list.currentItemChanged.connect(self.on_student_changed)
@@ -565,7 +3900,6 @@ class WeeklyManagerWindow(QMainWindow):
         self.project_name_edit.textChanged.connect(self._on_project_fields_changed)
         self.project_start_edit.dateChanged.connect(self._on_project_fields_changed)
         self.project_end_edit.dateChanged.connect(self._on_project_fields_changed)
-        self.project_todos_widget.tasksChanged.connect(self._on_project_todos_changed)
 
         self.weekly_title_edit.textChanged.connect(self._on_weekly_fields_changed)
         self.weekly_date_edit.dateChanged.connect(self._on_weekly_fields_changed)
@@ -590,9 +3924,17 @@ class WeeklyManagerWindow(QMainWindow):
         return "dark" if window_color.lightness() < 128 else "light"
 
     def _on_theme_toggled(self, checked: bool):
-        self._theme_mode = "dark" if checked else "light"
-        self._apply_theme(self._theme_mode)
+        self._set_theme("dark" if checked else "light")
+
+    def _set_theme(self, name: str):
+        if name == self._theme_mode:
+            return
+        self._apply_theme(name)
+        self.theme_toggle_btn.blockSignals(True)
+        self.theme_toggle_btn.setChecked(self._theme.dark)
+        self.theme_toggle_btn.blockSignals(False)
         self._update_theme_toggle_button()
+        self.theme_combo.setCurrentText(self._theme_mode)
 
     def _update_theme_toggle_button(self):
         if self.theme_toggle_btn.isChecked():
@@ -602,169 +3944,222 @@ class WeeklyManagerWindow(QMainWindow):
             self.theme_toggle_btn.setText("Light aktiv")
             self.theme_toggle_btn.setToolTip("Zu Dark wechseln")
 
-    def _apply_theme(self, mode: str):
-        QApplication.setStyle(QStyleFactory.create("Fusion"))
-        font = QFont()
-        font.setPointSize(10)
-        self.setFont(font)
-
-        if mode == "dark":
-            colors = {
-                "bg": "#0f172a",
-                "surface": "#111827",
-                "surface_alt": "#1f2937",
-                "border": "#334155",
-                "text": "#e5e7eb",
-                "subtle": "#94a3b8",
-                "accent": "#3b82f6",
-                "accent_border": "#1d4ed8",
-                "hover": "#1e293b",
-                "selected": "#1d4ed8",
-            }
-        else:
-            colors = {
-                "bg": "#f3f6fb",
-                "surface": "#ffffff",
-                "surface_alt": "#fbfcff",
-                "border": "#e3e8f0",
-                "text": "#1f2a37",
-                "subtle": "#5b6b7a",
-                "accent": "#2563eb",
-                "accent_border": "#1d4ed8",
-                "hover": "#eef3ff",
-                "selected": "#dbeafe",
-            }
-
-        self.setStyleSheet(
-            f"""
-            QMainWindow {{ background: {colors['bg']}; }}
-            QWidget {{ color: {colors['text']}; }}
-            QToolBar {{
-                background: {colors['surface']};
-                border: 1px solid {colors['border']};
-                spacing: 6px;
-                padding: 6px;
-                border-radius: 10px;
-            }}
-            QToolButton {{
-                background: transparent;
-                border: 1px solid transparent;
-                border-radius: 8px;
-                padding: 6px 10px;
-            }}
-            QToolButton:hover {{
-                background: {colors['hover']};
-                border: 1px solid {colors['border']};
-            }}
-            QLabel#SubtleLabel {{ color: {colors['subtle']}; }}
-            QFrame#Card {{
-                background: {colors['surface']};
-                border: 1px solid {colors['border']};
-                border-radius: 14px;
-            }}
-            QLabel#CardTitle {{
-                font-size: 15px;
-                font-weight: 700;
-                color: {colors['text']};
-                padding-bottom: 4px;
-            }}
-            QListWidget {{
-                background: {colors['surface_alt']};
-                border: 1px solid {colors['border']};
-                border-radius: 10px;
-                padding: 6px;
-            }}
-            QListWidget::item {{ border-radius: 8px; padding: 8px; margin: 2px 0px; }}
-            QListWidget::item:selected {{
-                background: {colors['selected']};
-                border: 1px solid {colors['accent_border']};
-            }}
-            QListWidget::item:hover:!selected {{ background: {colors['hover']}; }}
-            QPushButton {{
-                background: {colors['surface']};
-                border: 1px solid {colors['border']};
-                border-radius: 10px;
-                padding: 8px 12px;
-            }}
-            QPushButton:hover {{
-                background: {colors['hover']};
-                border-color: {colors['accent_border']};
-            }}
-            QPushButton:disabled {{
-                color: {colors['subtle']};
-                background: {colors['surface_alt']};
-                border-color: {colors['border']};
-            }}
-            QTextEdit, QDateEdit, QLineEdit {{
-                background: {colors['surface']};
-                border: 1px solid {colors['border']};
-                border-radius: 10px;
-                padding: 6px;
-            }}
-            QProgressBar {{
-                background: {colors['surface']};
-                border: 1px solid {colors['border']};
-                border-radius: 10px;
-                min-height: 24px;
-                padding: 0px;
-                text-align: center;
-            }}
-            QTextEdit:focus, QDateEdit:focus, QLineEdit:focus {{
-                border: 1px solid {colors['accent']};
-            }}
-            QProgressBar::chunk {{
-                background: {colors['accent']};
-                border-radius: 8px;
-            }}
-            QGroupBox {{
-                font-weight: 600;
-                border: 1px solid {colors['border']};
-                border-radius: 12px;
-                margin-top: 8px;
-                background: {colors['surface_alt']};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 4px;
-            }}
-            QStatusBar {{
-                background: {colors['surface']};
-                border-top: 1px solid {colors['border']};
-            }}
-        """
-        )
+    def _apply_theme(self, name: str):
+        theme = self.themes.get(name) or self.themes.get("light")
+        previous, self._theme = self._theme, theme
+        self._theme_mode = theme.name
+        # Palette und Stylesheet loesen je ein Repolish aller Kinder aus, daher nur Geaendertes setzen.
+        if previous is None or previous.palette != theme.palette:
+            self.setPalette(theme.palette)
+        if previous is None or previous.stylesheet != theme.stylesheet:
+            self.setStyleSheet(theme.stylesheet)
 
     # ------------------------------------------------------------------
     # State / helpers
     # ------------------------------------------------------------------
     def _set_saved_state(self, saved: bool):
         self._dirty = not saved
-        self.statusBar().showMessage("Alle Aenderungen gespeichert" if saved else "Ungespeicherte Aenderungen")
+        if self._read_only:
+            self.statusBar().showMessage("Archiv geoeffnet (nur lesen)")
+        else:
+            self.statusBar().showMessage("Alle Aenderungen gespeichert" if saved else "Ungespeicherte Aenderungen")
         self._update_window_title()
 
     def _update_window_title(self):
         filename = os.path.basename(self.current_file) if self.current_file else "Unbenannt"
         dirty = " *" if self._dirty else ""
-        self.setWindowTitle(f"Studierenden-Weeklies-Manager - {filename}{dirty}")
+        read_only = " (nur lesen)" if self._read_only else ""
+        self.setWindowTitle(f"Studierenden-Weeklies-Manager - {filename}{read_only}{dirty}")
+
+    def _update_storage_label(self, report: dict | None = None):
+        # Kompressionsrate und Zeiten; Lese- und Schreibwerte der aktuellen Datei werden zusammengefuehrt.
+        codec = storage_codec_for(self.current_file)
+        if report is not None:
+            if report.get("codec") != self._storage_stats.get("codec"):
+                self._storage_stats = {}
+            self._storage_stats.update(report)
+        self.storage_actions[codec].setChecked(True)
+        stats = self._storage_stats
+        self.storage_label.setVisible(codec != "json" and stats.get("codec") == codec)
+        if not self.storage_label.isVisible():
+            return
+        self.storage_label.setText(f"{codec} 1:{stats['ratio']}")
+        timings = [
+            f"{label} {stats[key]} ms"
+            for key, label in (("encode_ms", "Schreiben"), ("decode_ms", "Lesen"))
+            if key in stats
+        ]
+        self.storage_label.setToolTip(
+            f"{stats['raw_bytes'] // 1024} KiB JSON -> {stats['stored_bytes'] // 1024} KiB auf der Platte"
+            + (f"; {', '.join(timings)}" if timings else "")
+        )
 
     def _mark_dirty(self):
         if not self._loading_ui:
             self._set_saved_state(saved=False)
 
+    def _record_change(self, event_type: str, **fields):
+        self._queue_change(event_type, fields)
+        self._unhandled_changes = True
+        self._data_version += 1
+        self._invalidate_fragments(fields.get("student"), fields.get("project_index"), fields.get("weekly_index"))
+        if event_type in ("student_added", "student_removed", "student_renamed"):
+            self._sorted_student_names = None
+        self._update_switcher_index(event_type, fields)
+        if self._text_index is not None and fields.get("student") is not None:
+            self._text_index.mark_dirty(fields["student"])
+            if event_type == "student_renamed":
+                self._text_index.mark_dirty(fields["old_name"])
+        self._update_predicate_index(event_type, fields)
+
+    def _records_at(self, student_name, project_index=None, weekly_index=None) -> tuple:
+        student = self.data["students"].get(student_name) if student_name is not None else None
+        if student is None:
+            return None, None, None
+        projects = student.get("projects", [])
+        project = projects[project_index] if project_index is not None and 0 <= project_index < len(projects) else None
+        weekly = None
+        if project is not None and weekly_index is not None:
+            weeklies = project.get("weeklies", [])
+            weekly = weeklies[weekly_index] if 0 <= weekly_index < len(weeklies) else None
+        return student, project, weekly
+
+    def _event_location(self, record_id: str) -> dict:
+        # student/project_index/weekly_index eines Eintrags fuer das Aenderungsprotokoll.
+        student_name, project_index, weekly_index = self.records.path(record_id)
+        location = {"student": student_name, "project_index": project_index}
+        if weekly_index is not None:
+            location["weekly_index"] = weekly_index
+        return location
+
+    def _invalidate_fragments(self, student_name, project_index=None, weekly_index=None):
+        # Betroffene Eintraege entlang des Pfads verwerfen; alle anderen Fragmente bleiben gueltig.
+        student, project, weekly = self._records_at(student_name, project_index, weekly_index)
+        if student is not None:
+            self._serializer.invalidate(student, project, weekly)
+
+    def _queue_change(self, event_type: str, fields: dict):
+        # Feldaenderungen und TODO-Aenderungen desselben Datensatzes werden zu einem Ereignis
+        # zusammengefasst; Anlegen/Loeschen beendet die Zusammenfassung, damit Indizes stimmen.
+        if event_type in ("weekly_updated", "project_updated", "todos_changed"):
+            _, project, weekly = self._records_at(
+                fields.get("student"), fields.get("project_index"), fields.get("weekly_index")
+            )
+            record = weekly if event_type == "weekly_updated" else project
+            if record is None:
+                return
+            key = (event_type, record["id"])
+            pending = self._pending_updates.get(key)
+            if event_type == "todos_changed":
+                # Der Unterschied zum zuletzt geschriebenen Stand wird beim Schreiben berechnet.
+                if pending is None:
+                    event = {"type": event_type, "student": fields["student"], "project_index": fields["project_index"]}
+                    self._pending_updates[key] = {**event, "id": record["id"]}
+                    self._pending_changes.append(self._pending_updates[key])
+                return
+            if pending is not None:
+                pending["fields"].update(fields["fields"])
+                return
+            event = {"type": event_type, **fields, "id": record["id"], "fields": dict(fields["fields"])}
+            self._pending_updates[key] = event
+            self._pending_changes.append(event)
+            return
+
+        self._pending_updates.clear()
+        # Nutzdaten (neues Projekt/Weekly) mit dem Stand von jetzt festhalten.
+        self._pending_changes.append({"type": event_type, **json.loads(json.dumps(fields, ensure_ascii=False))})
+        if event_type == "project_added":
+            self._todo_feed_state[fields["project"]["id"]] = todo_feed_state(fields["project"]["project_todos"])
+
+    def _update_predicate_index(self, event_type: str, fields: dict):
+        # Nur Aenderungen an Daten, Weeklies und TODOs beruehren die Filter; Tippen im Text nicht.
+        if event_type in ("weekly_updated", "project_updated") and not set(fields.get("fields", ())) & FILTER_FIELDS:
+            return
+        if self._predicate_index is not None and fields.get("student") is not None:
+            self._predicate_index.mark_dirty(fields["student"])
+            if event_type == "student_renamed":
+                self._predicate_index.mark_dirty(fields["old_name"])
+        if self._active_filters:
+            self._invalidate("students", "projects")
+
+    def _update_switcher_index(self, event_type: str, fields: dict):
+        student_name = fields.get("student")
+        if self._switcher_index is None or student_name is None:
+            return
+        if event_type == "student_renamed":
+            self._switcher_index.update_student(fields["old_name"], None)
+        labels_changed = set(fields.get("fields", ())) & {"name", "title", "date"}
+        if event_type.endswith(("_added", "_removed", "_renamed")) or labels_changed:
+            self._switcher_index.update_student(student_name, self.data["students"].get(student_name))
+
+    def _commit_editors(self):
+        # Offene Eingaben uebernehmen, bevor gespeichert oder umgeschaltet wird.
+        project_changes = self._write_project_from_ui()
+        if project_changes:
+            location = self._event_location(self.current_project_id)
+            self._record_change("project_updated", **location, fields=project_changes)
+        weekly_changes = self._write_weekly_from_ui()
+        if weekly_changes:
+            self._record_change("weekly_updated", **self._event_location(self.current_weekly_id), fields=weekly_changes)
+
+    def _current_change_feed(self) -> ChangeFeed:
+        path = change_feed_path_for(self.current_file)
+        if self._change_feed is None or self._change_feed.path != path:
+            self._change_feed = ChangeFeed(path)
+        return self._change_feed
+
+    def _discard_pending_changes(self):
+        self._feed_timer.stop()
+        self._pending_changes.clear()
+        self._pending_updates.clear()
+        self._unhandled_changes = False
+
+    def _flush_change_feed(self):
+        # Ins Protokoll kommt nur, was auch in der Datei steht: bei ungespeicherten
+        # Aenderungen (z. B. fehlgeschlagenes Speichern) bleibt alles vorgemerkt.
+        self._feed_timer.stop()
+        if self._dirty or self._unhandled_changes or self._read_only or not self._pending_changes:
+            return
+        events = []
+        for event in self._pending_changes:
+            if event["type"] == "todos_changed":
+                project = self.records.get(event["id"])
+                if project is None:
+                    self._todo_feed_state.pop(event["id"], None)
+                    continue
+                todos = project.get("project_todos", [])
+                diff = diff_todos(self._todo_feed_state.get(event["id"], {}), todos)
+                self._todo_feed_state[event["id"]] = todo_feed_state(todos)
+                if not diff:
+                    continue
+                event.update(diff)
+            events.append(event)
+        self._pending_changes = []
+        self._pending_updates.clear()
+        try:
+            self._current_change_feed().append(events)
+        except OSError as exc:
+            QMessageBox.critical(self, "Fehler beim Speichern", f"Aenderungsprotokoll konnte nicht geschrieben werden:\n{exc}")
+
     def _on_data_changed(self):
-        if self._loading_ui:
+        if self._loading_ui or self._read_only:
+            self._discard_pending_changes()
+            return
+        if not self._unhandled_changes:
+            # Eingabe ohne inhaltliche Aenderung (gleiches Datum, rstrip, ...).
             return
         self._mark_dirty()
         if self._autosave_enabled:
             self._save_to_current_file()
+        self._feed_timer.start()
 
     def _set_project_fields_enabled(self, enabled: bool):
         self.project_name_edit.setEnabled(enabled)
         self.project_start_edit.setEnabled(enabled)
         self.project_end_edit.setEnabled(enabled)
         self.project_progress.setEnabled(enabled)
-        self.project_todos_widget.setEnabled(enabled)
+        if self.project_todos_widget is not None:
+            self.project_todos_widget.setEnabled(enabled and not self._read_only)
 
     def _set_weekly_editor_enabled(self, enabled: bool):
         self.weekly_title_edit.setEnabled(enabled)
@@ -772,12 +4167,55 @@ class WeeklyManagerWindow(QMainWindow):
         self.txt_planned.setEnabled(enabled)
         self.txt_done.setEnabled(enabled)
         self.txt_next.setEnabled(enabled)
+        self.btn_add_attachment.setEnabled(enabled and not self._read_only)
+        self.btn_remove_attachment.setEnabled(enabled and not self._read_only)
+
+    def _apply_read_only_state(self):
+        for widget in (
+            self.project_name_edit,
+            self.project_start_edit,
+            self.project_end_edit,
+            self.weekly_title_edit,
+            self.weekly_date_edit,
+            self.txt_planned,
+            self.txt_done,
+            self.txt_next,
+        ):
+            widget.setReadOnly(self._read_only)
+
+        self.btn_add_student.setEnabled(not self._read_only)
+        self.act_add_student.setEnabled(not self._read_only)
+        self.btn_remove_student.setEnabled(not self._read_only)
+        self.act_remove_student.setEnabled(not self._read_only)
+        self.btn_rename_student.setEnabled(not self._read_only)
+        self.act_rename_student.setEnabled(not self._read_only)
+        self.act_bulk_replace.setEnabled(not self._read_only)
+        # Schnellwechsler, Auswertung und Filter lesen alle Studierenden; im Archiv wuerde
+        # das die ganze Datei dekodieren.
+        self.act_quick_switch.setEnabled(not self._read_only)
+        self.act_analytics.setEnabled(not self._read_only)
+        self.btn_student_filter.setEnabled(not self._read_only)
+        self.btn_storage_format.setEnabled(not self._read_only)
+        self.btn_add_attachment.setEnabled(not self._read_only and self._current_weekly() is not None)
+        self.btn_remove_attachment.setEnabled(not self._read_only and self._current_weekly() is not None)
+        self._invalidate("actions")
+
+    def _close_mapped_archive(self):
+        if self._mapped_archive is not None:
+            self._mapped_archive.close()
+            self._mapped_archive = None
+        self._read_only = False
 
     def _current_student_entry(self):
         if self.current_student is None:
             return None
         entry = self.data["students"].get(self.current_student)
-        return entry if isinstance(entry, dict) else None
+        if not isinstance(entry, dict):
+            return None
+        if self._read_only and entry["id"] not in self.records.records:
+            # Im Archiv nur die gewaehlte Person indizieren, nicht alle.
+            self.records.rebuild({self.current_student: entry})
+        return entry
 
     def _current_student_projects(self):
         entry = self._current_student_entry()
@@ -787,12 +4225,10 @@ class WeeklyManagerWindow(QMainWindow):
         return projects if isinstance(projects, list) else None
 
     def _current_project(self):
-        projects = self._current_student_projects()
-        if projects is None or self.current_project_index is None:
-            return None
-        if not (0 <= self.current_project_index < len(projects)):
+        entry = self._current_student_entry()
+        if entry is None or self.records.parents.get(self.current_project_id) != entry["id"]:
             return None
-        return projects[self.current_project_index]
+        return self.records.get(self.current_project_id)
 
     def _current_weeklies(self):
         project = self._current_project()
@@ -801,16 +4237,18 @@ class WeeklyManagerWindow(QMainWindow):
         weeklies = project.get("weeklies", [])
         return weeklies if isinstance(weeklies, list) else None
 
+    def _current_weekly(self) -> dict | None:
+        project = self._current_project()
+        if project is None or self.records.parents.get(self.current_weekly_id) != project["id"]:
+            return None
+        return self.records.get(self.current_weekly_id)
+
     def _sync_action_states(self):
-        has_student = self.current_student is not None
-        has_project = self._current_project() is not None
+        editable = not self._read_only
+        has_student = self.current_student is not None and editable
+        has_project = self._current_project() is not None and editable
 
-        weeklies = self._current_weeklies()
-        has_weekly = (
-            weeklies is not None
-            and self.current_weekly_index is not None
-            and 0 <= self.current_weekly_index < len(weeklies)
-        )
+        has_weekly = self._current_weekly() is not None and editable
 
         self.btn_add_project.setEnabled(has_student)
         self.act_add_project.setEnabled(has_student)
@@ -819,18 +4257,51 @@ class WeeklyManagerWindow(QMainWindow):
         self.act_remove_project.setEnabled(has_project)
         self.btn_new_weekly.setEnabled(has_project)
         self.act_new_weekly.setEnabled(has_project)
+        self.btn_weekly_from_template.setEnabled(has_project)
+        self.act_weekly_from_template.setEnabled(has_project)
 
         self.btn_delete_weekly.setEnabled(has_weekly)
         self.act_delete_weekly.setEnabled(has_weekly)
+        self.btn_save_template.setEnabled(has_weekly)
 
     def _set_weekly_editor_visible(self, visible: bool):
         self.weekly_editor_container.setVisible(visible)
         self._update_right_area_layout()
 
     def _set_todo_area_visible(self, visible: bool):
+        if visible:
+            self._ensure_todo_area()
         self.todo_area_container.setVisible(visible)
         self._update_right_area_layout()
 
+    def _ensure_todo_area(self):
+        if self.project_todos_widget is not None:
+            return
+        todo_area_layout = self.todo_area_container.layout()
+
+        self.grp_project_todos = QGroupBox("Projekt-TODOs")
+        project_todo_layout = QVBoxLayout(self.grp_project_todos)
+        self.project_todos_widget = TaskListWidget("Neue TODO ...")
+        project_todo_layout.addWidget(self.project_todos_widget)
+        self.btn_todo_archive = QPushButton("Archivierte TODOs ...")
+        project_todo_layout.addWidget(self.btn_todo_archive, 0, Qt.AlignmentFlag.AlignRight)
+        todo_area_layout.addWidget(self.grp_project_todos, 1)
+
+        self.grp_todo_context = QGroupBox("Offene TODOs (Kontext)")
+        todo_context_layout = QVBoxLayout(self.grp_todo_context)
+        self.todo_context_label = QLabel("Kontext: Gesamt")
+        self.todo_context_label.setObjectName("SubtleLabel")
+        self.todo_context_list = QListWidget()
+        self.todo_context_list.setSelectionMode(QListWidget.SelectionMode.NoSelection)
+        todo_context_layout.addWidget(self.todo_context_label)
+        todo_context_layout.addWidget(self.todo_context_list, 1)
+        todo_area_layout.addWidget(self.grp_todo_context, 1)
+
+        self.project_todos_widget.tasksChanged.connect(self._on_project_todos_changed)
+        self.project_todos_widget.moveRequested.connect(self._move_todos_to_project)
+        self.btn_todo_archive.clicked.connect(self.open_todo_archive_dialog)
+        self._invalidate("project_editor", "todo_context")
+
     def _update_right_area_layout(self):
         todo_visible = self.todo_area_container.isVisible()
         weekly_visible = self.weekly_editor_container.isVisible()
@@ -879,7 +4350,10 @@ class WeeklyManagerWindow(QMainWindow):
                 end_qd = start_qd.addDays(90)
             self.project_start_edit.setDate(start_qd)
             self.project_end_edit.setDate(end_qd)
-            self.project_todos_widget.set_tasks(normalize_todos(project.get("project_todos", [])))
+            if self.project_todos_widget is not None:
+                self.project_todos_widget.set_model(
+                    TodoModel(project["project_todos"], archive_sink=lambda todos: self._archive_todos(todos, project))
+                )
         finally:
             self._loading_ui = False
 
@@ -891,12 +4365,14 @@ class WeeklyManagerWindow(QMainWindow):
             self.project_name_edit.clear()
             self.project_start_edit.setDate(QDate.currentDate())
             self.project_end_edit.setDate(QDate.currentDate().addDays(90))
-            self.project_todos_widget.set_tasks([])
+            if self.project_todos_widget is not None:
+                self.project_todos_widget.set_model(None)
         finally:
             self._loading_ui = False
         self._update_project_progress_ui(None)
 
     def _load_weekly_into_ui(self, weekly: dict):
+        self._phrase_baseline = (weekly, set(self._weekly_phrases(weekly)))
         self._loading_ui = True
         try:
             self.weekly_title_edit.setText(str(weekly.get("title", "")))
@@ -911,6 +4387,7 @@ class WeeklyManagerWindow(QMainWindow):
             self._loading_ui = False
 
     def _clear_weekly_ui(self):
+        self._phrase_baseline = None
         self._loading_ui = True
         try:
             self.weekly_title_edit.clear()
@@ -921,48 +4398,82 @@ class WeeklyManagerWindow(QMainWindow):
         finally:
             self._loading_ui = False
 
-    def _write_project_from_ui(self) -> bool:
-        if self._loading_ui:
-            return False
+    def _weekly_phrases(self, weekly: dict):
+        for key in ("planned", "done", "next_planned"):
+            yield from extract_phrases(str(weekly.get(key, "")))
+
+    def _iter_weekly_texts(self):
+        for student_entry in self.data["students"].values():
+            for project in student_entry.get("projects", []):
+                for weekly in project.get("weeklies", []):
+                    for key in ("planned", "done", "next_planned"):
+                        yield str(weekly.get(key, ""))
+
+    def _feed_phrase_cache(self):
+        # Beim Verlassen eines Weeklys nur die neu geschriebenen Zeilen zaehlen.
+        if self._phrase_baseline is None or not self.phrase_cache.loaded:
+            return
+        weekly, before = self._phrase_baseline
+        self._phrase_baseline = None
+        for phrase in set(self._weekly_phrases(weekly)) - before:
+            self.phrase_cache.add(phrase)
+
+    @staticmethod
+    def _apply_fields(target: dict, values: dict) -> dict:
+        changes = {key: value for key, value in values.items() if target.get(key) != value}
+        target.update(changes)
+        return changes
+
+    def _write_project_from_ui(self) -> dict | None:
+        # Solange der Editor noch ein anderes Projekt zeigt, nichts zurueckschreiben.
+        # Rueckgabe: geaenderte Felder (leer, wenn nichts anders ist) oder None.
+        if self._loading_ui or self._read_only or "project_editor" in self._stale_views:
+            return None
         project = self._current_project()
         if project is None:
-            return False
+            return None
 
-        project["name"] = (self.project_name_edit.text() or "").strip() or "Projekt"
-        project["start_date"] = self.project_start_edit.date().toString(Qt.DateFormat.ISODate)
-        project["end_date"] = self.project_end_edit.date().toString(Qt.DateFormat.ISODate)
-        project["project_todos"] = self.project_todos_widget.get_tasks()
-        return True
+        return self._apply_fields(
+            project,
+            {
+                "name": (self.project_name_edit.text() or "").strip() or "Projekt",
+                "start_date": self.project_start_edit.date().toString(Qt.DateFormat.ISODate),
+                "end_date": self.project_end_edit.date().toString(Qt.DateFormat.ISODate),
+            },
+        )
 
-    def _write_weekly_from_ui(self) -> bool:
-        if self._loading_ui:
-            return False
-        weeklies = self._current_weeklies()
-        if weeklies is None or self.current_weekly_index is None:
-            return False
-        if not (0 <= self.current_weekly_index < len(weeklies)):
-            return False
+    def _write_weekly_from_ui(self) -> dict | None:
+        if self._loading_ui or self._read_only or "weekly_editor" in self._stale_views:
+            return None
+        weekly = self._current_weekly()
+        if weekly is None:
+            return None
 
-        weekly = weeklies[self.current_weekly_index]
-        weekly["title"] = self.weekly_title_edit.text().strip()
-        weekly["date"] = self.weekly_date_edit.date().toString(Qt.DateFormat.ISODate)
-        weekly["planned"] = self.txt_planned.toPlainText().rstrip()
-        weekly["done"] = self.txt_done.toPlainText().rstrip()
-        weekly["next_planned"] = self.txt_next.toPlainText().rstrip()
-        return True
+        return self._apply_fields(
+            weekly,
+            {
+                "title": self.weekly_title_edit.text().strip(),
+                "date": self.weekly_date_edit.date().toString(Qt.DateFormat.ISODate),
+                "planned": self.txt_planned.toPlainText().rstrip(),
+                "done": self.txt_done.toPlainText().rstrip(),
+                "next_planned": self.txt_next.toPlainText().rstrip(),
+            },
+        )
+
+    def _update_current_project_list_item(self):
+        project = self._current_project()
+        item = self._project_items.get(project["id"]) if project is not None else None
+        if item is not None:
+            item.setText(str(project.get("name", "")).strip() or f"Projekt {self.records.positions[project['id']] + 1}")
 
     def _update_current_weekly_list_item(self):
-        if self.current_weekly_index is None:
-            return
-        weeklies = self._current_weeklies()
-        if weeklies is None or not (0 <= self.current_weekly_index < len(weeklies)):
+        weekly = self._current_weekly()
+        if weekly is None:
             return
 
-        for row in range(self.weekly_list.count()):
-            item = self.weekly_list.item(row)
-            if item.data(Qt.ItemDataRole.UserRole) == self.current_weekly_index:
-                item.setText(self._weekly_list_text(weeklies[self.current_weekly_index]))
-                return
+        item = self._weekly_items.get(weekly["id"])
+        if item is not None:
+            item.setText(self._weekly_list_text(weekly))
 
     def _update_project_progress_ui(self, project: dict | None):
         if project is None:
@@ -982,18 +4493,7 @@ class WeeklyManagerWindow(QMainWindow):
             self.project_progress_label.setText("Projektfortschritt: Enddatum liegt vor Startdatum")
             return
 
-        today = QDate.currentDate()
-        total_days = max(1, start.daysTo(end))
-        elapsed_days = start.daysTo(today)
-
-        if today <= start:
-            pct = 0
-        elif today >= end:
-            pct = 100
-        else:
-            pct = int((elapsed_days / total_days) * 100)
-
-        pct = max(0, min(100, pct))
+        pct = project_time_progress(start.toJulianDay(), end.toJulianDay(), QDate.currentDate().toJulianDay())
         self.project_progress.setValue(pct)
         self.project_progress_label.setText(
             f"Projektfortschritt: {pct}% ({start.toString('dd.MM.yyyy')} - {end.toString('dd.MM.yyyy')})"
@@ -1002,12 +4502,12 @@ class WeeklyManagerWindow(QMainWindow):
     def _determine_todo_context(self) -> str:
         if self.current_student is None:
             return "Gesamt"
-        if self.current_project_index is None:
+        if self.current_project_id is None:
             return f"Student: {self.current_student}"
 
         project = self._current_project()
         project_name = str(project.get("name", "Projekt")) if project else "Projekt"
-        if self.current_weekly_index is None:
+        if self.current_weekly_id is None:
             return f"Student: {self.current_student} | Projekt: {project_name}"
         return f"Student: {self.current_student} | Projekt: {project_name} | Weekly aktiv"
 
@@ -1016,7 +4516,7 @@ class WeeklyManagerWindow(QMainWindow):
 
         def project_rows(student_name: str, project: dict):
             project_name = str(project.get("name", "Projekt")).strip() or "Projekt"
-            for todo in normalize_todos(project.get("project_todos", [])):
+            for todo in project.get("project_todos", []):
                 if not todo.get("checked", False):
                     rows.append((student_name, project_name, todo["text"]))
 
@@ -1030,7 +4530,7 @@ class WeeklyManagerWindow(QMainWindow):
 
         student_entry = self.data["students"].get(self.current_student, {})
         projects = student_entry.get("projects", []) if isinstance(student_entry, dict) else []
-        if self.current_project_index is None:
+        if self.current_project_id is None:
             for project in projects:
                 if isinstance(project, dict):
                     project_rows(self.current_student, project)
@@ -1041,254 +4541,342 @@ class WeeklyManagerWindow(QMainWindow):
             project_rows(self.current_student, project)
         return rows
 
-    def refresh_todo_context_view(self):
-        self.todo_context_label.setText(f"Kontext: {self._determine_todo_context()}")
-
-        rows = self._collect_open_todos_by_context()
-        self.todo_context_list.blockSignals(True)
-        self.todo_context_list.clear()
-
-        if not rows:
-            self.todo_context_list.addItem("Keine offenen TODOs")
-        else:
-            for student_name, project_name, text in rows:
-                self.todo_context_list.addItem(f"[{student_name} | {project_name}] {text}")
-
-        self.todo_context_list.blockSignals(False)
-
     # ------------------------------------------------------------------
     # Rendering
     # ------------------------------------------------------------------
+    # Handler aendern nur den Auswahlzustand und markieren betroffene Ansichten
+    # als veraltet. Pro Event-Loop-Durchlauf wird jede Ansicht hoechstens einmal
+    # neu aufgebaut, in der Reihenfolge von REFRESH_ORDER.
+    REFRESH_ORDER = (
+        "students",
+        "projects",
+        "project_editor",
+        "weeklies",
+        "weekly_editor",
+        "todo_context",
+        "actions",
+    )
+    STUDENT_VIEWS = ("projects", "project_editor", "weeklies", "weekly_editor", "todo_context", "actions")
+    PROJECT_VIEWS = ("project_editor", "weeklies", "weekly_editor", "todo_context", "actions")
+    WEEKLY_VIEWS = ("weekly_editor", "todo_context", "actions")
+
+    def _invalidate(self, *views: str):
+        self._stale_views.update(views)
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _flush_refresh(self):
+        self._refresh_timer.stop()
+        renderers = {
+            "students": self._render_student_list,
+            "projects": self._render_project_list,
+            "project_editor": self._render_project_editor,
+            "weeklies": self._render_weekly_list,
+            "weekly_editor": self._render_weekly_editor,
+            "todo_context": self._render_todo_context,
+            "actions": self._sync_action_states,
+        }
+        # Renderer duerfen nachgelagerte Ansichten markieren; die werden im
+        # selben Durchlauf mit erledigt.
+        for view in self.REFRESH_ORDER:
+            if view in self._stale_views:
+                self._stale_views.discard(view)
+                self._refresh_counts[view] += 1
+                renderers[view]()
+        self._refresh_flushes += 1
+
+    def refresh_stats(self, reset: bool = False) -> dict:
+        stats = {"flushes": self._refresh_flushes, **{view: self._refresh_counts[view] for view in self.REFRESH_ORDER}}
+        if reset:
+            self._refresh_counts.clear()
+            self._refresh_flushes = 0
+        return stats
+
     def refresh_student_list(self, select_name: str | None = None):
+        if select_name is not None and select_name != self.current_student:
+            self.current_student = select_name
+            self.current_project_id = None
+            self.current_weekly_id = None
+        self._invalidate("students", *self.STUDENT_VIEWS)
+
+    def refresh_project_list(self, select_id: str | None = None):
+        if select_id is not None and select_id != self.current_project_id:
+            self.current_project_id = select_id
+            self.current_weekly_id = None
+        self._invalidate("projects", *self.PROJECT_VIEWS)
+
+    def refresh_weekly_list(self, select_id: str | None = None):
+        if select_id is not None:
+            self.current_weekly_id = select_id
+        self._invalidate("weeklies", *self.WEEKLY_VIEWS)
+
+    def refresh_todo_context_view(self):
+        self._invalidate("todo_context")
+
+    def _render_student_list(self):
         self.student_list.blockSignals(True)
         self.student_list.clear()
+        self._student_items = {}
 
-        for name in sorted(self.data["students"].keys(), key=str.lower):
-            self.student_list.addItem(QListWidgetItem(name))
+        if self._sorted_student_names is None:
+            self._sorted_student_names = sorted(self.data["students"].keys(), key=str.lower)
+        visible = self._filtered_students()
+        self.btn_student_filter.setText(
+            f"Filter ({len(self._active_filters)}): {len(visible)} Treffer" if visible is not None else "Filter"
+        )
+        for name in self._sorted_student_names:
+            # Die aktuelle Auswahl bleibt sichtbar, auch wenn sie nicht mehr passt.
+            if visible is not None and name not in visible and name != self.current_student:
+                continue
+            item = self._student_items[name] = QListWidgetItem(name)
+            self.student_list.addItem(item)
 
+        current_item = self._student_items.get(self.current_student)
+        if current_item is not None:
+            self.student_list.setCurrentItem(current_item)
+        elif self.current_student is not None:
+            self.current_student = None
+            self.current_project_id = None
+            self.current_weekly_id = None
+            self._stale_views.update(self.STUDENT_VIEWS)
         self.student_list.blockSignals(False)
 
-        target_name = select_name if select_name is not None else self.current_student
-        if target_name:
-            matches = self.student_list.findItems(target_name, Qt.MatchFlag.MatchExactly)
-            if matches:
-                self.student_list.setCurrentItem(matches[0])
-                self._sync_action_states()
-                return
-
-        self.current_student = None
-        self.current_project_index = None
-        self.current_weekly_index = None
-        self.refresh_project_list()
-        self.refresh_weekly_list()
-        self.refresh_todo_context_view()
-        self._sync_action_states()
-
-    def refresh_project_list(self, select_index: int | None = None):
+    def _render_project_list(self):
         self.project_list.blockSignals(True)
         self.project_list.clear()
+        self._project_items = {}
 
         projects = self._current_student_projects()
         if self.current_student is None or projects is None:
-            self.current_project_index = None
             self.project_summary_label.setText("Keine Studierenden ausgewaehlt")
-            self.project_list.blockSignals(False)
-            self._set_project_fields_enabled(False)
-            self._clear_project_ui()
-            self.refresh_weekly_list()
-            self.refresh_todo_context_view()
-            self._sync_action_states()
-            return
-
-        total_weeklies = sum(len(project.get("weeklies", [])) for project in projects if isinstance(project, dict))
-        self.project_summary_label.setText(f"{self.current_student} - {len(projects)} Projekt(e) - {total_weeklies} Weekly(s)")
+            projects = []
+        else:
+            total_weeklies = sum(len(project.get("weeklies", [])) for project in projects if isinstance(project, dict))
+            self.project_summary_label.setText(
+                f"{self.current_student} - {len(projects)} Projekt(e) - {total_weeklies} Weekly(s)"
+            )
 
+        visible = self._filtered_projects()
         for idx, project in enumerate(projects):
             if not isinstance(project, dict):
                 continue
+            if visible is not None and project["id"] not in visible and project["id"] != self.current_project_id:
+                continue
             name = str(project.get("name", f"Projekt {idx + 1}")).strip() or f"Projekt {idx + 1}"
-            item = QListWidgetItem(name)
-            item.setData(Qt.ItemDataRole.UserRole, idx)
+            item = self._project_items[project["id"]] = QListWidgetItem(name)
+            item.setData(Qt.ItemDataRole.UserRole, project["id"])
             self.project_list.addItem(item)
 
+        current_item = self._project_items.get(self.current_project_id)
+        if current_item is not None:
+            self.project_list.setCurrentItem(current_item)
+        elif self.current_project_id is not None:
+            self.current_project_id = None
+            self.current_weekly_id = None
+            self._stale_views.update(self.PROJECT_VIEWS)
         self.project_list.blockSignals(False)
 
-        has_projects = len(projects) > 0
+    def _filter_index(self) -> PredicateIndex:
+        if self._predicate_index is None:
+            self._predicate_index = PredicateIndex(self.data["students"])
+        return self._predicate_index
+
+    def _filtered_students(self) -> set | None:
+        if not self._active_filters or self._read_only:
+            return None
+        return self._filter_index().matching_students(self._active_filters)
+
+    def _filtered_projects(self) -> set | None:
+        if not self._active_filters or self._read_only:
+            return None
+        return self._filter_index().matching_projects(self._active_filters)
 
-        if not has_projects:
-            self.current_project_index = None
-            self.current_weekly_index = None
+    def _on_filters_changed(self):
+        self._active_filters = {name for name, action in self.filter_actions.items() if action.isChecked()}
+        self._invalidate("students", "projects")
+
+    def _render_project_editor(self):
+        project = self._current_project()
+        if project is None:
             self._set_project_fields_enabled(False)
             self._clear_project_ui()
-            self.refresh_weekly_list()
-            self.refresh_todo_context_view()
-            self._sync_action_states()
-            return
-
-        target_index = select_index if select_index is not None else self.current_project_index
-        if target_index is not None:
-            for row in range(self.project_list.count()):
-                item = self.project_list.item(row)
-                if item.data(Qt.ItemDataRole.UserRole) == target_index:
-                    self.project_list.setCurrentItem(item)
-                    self._sync_action_states()
-                    return
-
-        self.current_project_index = None
-        self.current_weekly_index = None
-        self._set_project_fields_enabled(False)
-        self._clear_project_ui()
-        self.refresh_weekly_list()
-        self.refresh_todo_context_view()
-        self._sync_action_states()
+            return
+        self._set_project_fields_enabled(True)
+        self._load_project_into_ui(project)
 
-    def refresh_weekly_list(self, select_index: int | None = None):
+    def _render_weekly_list(self):
         self.weekly_list.blockSignals(True)
         self.weekly_list.clear()
+        self._weekly_items = {}
 
         weeklies = self._current_weeklies()
         project = self._current_project()
         if weeklies is None or project is None:
             self.weekly_summary_label.setText("Kein Projekt ausgewaehlt")
-            self.weekly_list.blockSignals(False)
-            self.current_weekly_index = None
-            self._set_weekly_editor_enabled(False)
-            self._clear_weekly_ui()
-            self.btn_delete_weekly.setEnabled(False)
-            self.act_delete_weekly.setEnabled(False)
-            self.refresh_todo_context_view()
-            self._sync_action_states()
-            return
+            weeklies = []
+        else:
+            self.weekly_summary_label.setText(f"{project.get('name', 'Projekt')} - {len(weeklies)} Weekly(s)")
 
-        count = len(weeklies)
-        self.weekly_summary_label.setText(f"{project.get('name', 'Projekt')} - {count} Weekly(s)")
-        for idx in reversed(range(count)):
-            weekly = weeklies[idx]
+        for weekly in reversed(weeklies):
             if isinstance(weekly, dict):
-                item = QListWidgetItem(self._weekly_list_text(weekly))
-                item.setData(Qt.ItemDataRole.UserRole, idx)
+                item = self._weekly_items[weekly["id"]] = QListWidgetItem(self._weekly_list_text(weekly))
+                item.setData(Qt.ItemDataRole.UserRole, weekly["id"])
                 self.weekly_list.addItem(item)
 
+        current_item = self._weekly_items.get(self.current_weekly_id)
+        if current_item is not None:
+            self.weekly_list.setCurrentItem(current_item)
+        elif self.current_weekly_id is not None:
+            self.current_weekly_id = None
+            self._stale_views.update(self.WEEKLY_VIEWS)
         self.weekly_list.blockSignals(False)
 
-        target_index = select_index if select_index is not None else self.current_weekly_index
-        if target_index is not None:
-            for row in range(self.weekly_list.count()):
-                item = self.weekly_list.item(row)
-                if item.data(Qt.ItemDataRole.UserRole) == target_index:
-                    self.weekly_list.setCurrentItem(item)
-                    self._sync_action_states()
-                    return
+    def _render_weekly_editor(self):
+        self._feed_phrase_cache()
+        weekly = self._current_weekly()
+        if weekly is None:
+            self.current_weekly_id = None
+            self._set_weekly_editor_enabled(False)
+            self._clear_weekly_ui()
+            self._update_markdown_preview()
+            self._render_attachments()
+            return
+        self._set_weekly_editor_enabled(True)
+        self._load_weekly_into_ui(weekly)
+        self._update_markdown_preview()
+        self._render_attachments()
 
-        self.current_weekly_index = None
-        self._set_weekly_editor_enabled(False)
-        self._clear_weekly_ui()
-        self.btn_delete_weekly.setEnabled(False)
-        self.act_delete_weekly.setEnabled(False)
-        self.refresh_todo_context_view()
-        self._sync_action_states()
+    def _render_todo_context(self):
+        if self.project_todos_widget is None:
+            return
+        self.todo_context_label.setText(f"Kontext: {self._determine_todo_context()}")
+
+        rows = self._collect_open_todos_by_context()
+        self.todo_context_list.blockSignals(True)
+        self.todo_context_list.clear()
+
+        if not rows:
+            self.todo_context_list.addItem("Keine offenen TODOs")
+        else:
+            for student_name, project_name, text in rows:
+                self.todo_context_list.addItem(f"[{student_name} | {project_name}] {text}")
+
+        self.todo_context_list.blockSignals(False)
 
     # ------------------------------------------------------------------
     # Events
     # ------------------------------------------------------------------
     def on_student_changed(self, current: QListWidgetItem, previous: QListWidgetItem):
-        if current is None:
-            self.current_student = None
-            self.current_project_index = None
-            self.current_weekly_index = None
-            self.refresh_project_list()
-            self.refresh_weekly_list()
-            self.refresh_todo_context_view()
-            self._sync_action_states()
-            return
-
-        self.current_student = current.text()
-        self.current_project_index = None
-        self.current_weekly_index = None
-        self.refresh_project_list()
-        self.refresh_todo_context_view()
-        self._sync_action_states()
+        self._flush_change_feed()
+        self.current_student = current.text() if current is not None else None
+        self.current_project_id = None
+        self.current_weekly_id = None
+        self._invalidate(*self.STUDENT_VIEWS)
 
     def on_project_changed(self, current: QListWidgetItem, previous: QListWidgetItem):
-        if current is None:
-            self.current_project_index = None
-            self.current_weekly_index = None
-            self._set_project_fields_enabled(False)
-            self._clear_project_ui()
-            self.refresh_weekly_list()
-            self.refresh_todo_context_view()
-            self._sync_action_states()
-            return
+        self._flush_change_feed()
+        self.current_project_id = current.data(Qt.ItemDataRole.UserRole) if current is not None else None
+        self.current_weekly_id = None
+        self._invalidate(*self.PROJECT_VIEWS)
 
-        idx = current.data(Qt.ItemDataRole.UserRole)
-        self.current_project_index = int(idx)
-        self.current_weekly_index = None
+    def on_weekly_changed(self, current: QListWidgetItem, previous: QListWidgetItem):
+        self._flush_change_feed()
+        self.current_weekly_id = current.data(Qt.ItemDataRole.UserRole) if current is not None else None
+        self._invalidate(*self.WEEKLY_VIEWS)
 
-        project = self._current_project()
-        if project is None:
-            self.current_project_index = None
-            self._set_project_fields_enabled(False)
-            self._clear_project_ui()
-            self.refresh_weekly_list()
-            self.refresh_todo_context_view()
-            self._sync_action_states()
+    def _on_project_fields_changed(self):
+        changes = self._write_project_from_ui()
+        if changes is None:
             return
-
-        self._set_project_fields_enabled(True)
-        self._load_project_into_ui(project)
-        self.refresh_weekly_list()
+        if changes:
+            self._record_change("project_updated", **self._event_location(self.current_project_id), fields=changes)
+        self._update_project_progress_ui(self._current_project())
+        self._update_current_project_list_item()
         self.refresh_todo_context_view()
-        self._sync_action_states()
+        self._on_data_changed()
 
-    def on_weekly_changed(self, current: QListWidgetItem, previous: QListWidgetItem):
-        if current is None:
-            self.current_weekly_index = None
-            self._set_weekly_editor_enabled(False)
-            self._clear_weekly_ui()
-            self.btn_delete_weekly.setEnabled(False)
-            self.act_delete_weekly.setEnabled(False)
-            self.refresh_todo_context_view()
-            self._sync_action_states()
+    def _on_project_todos_changed(self):
+        # Das TodoModel schreibt direkt in project["project_todos"]; hier nur
+        # einmal pro Transaktion nachziehen und speichern.
+        if self._loading_ui or self._read_only:
             return
+        project = self._current_project()
+        if project is not None:
+            self._record_change(
+                "todos_changed", **self._event_location(project["id"]), todos=project.get("project_todos", [])
+            )
+        self.refresh_todo_context_view()
+        self._on_data_changed()
 
-        idx = current.data(Qt.ItemDataRole.UserRole)
-        self.current_weekly_index = int(idx)
+    def _todo_cold_store(self) -> TodoColdStore:
+        return TodoColdStore(todo_archive_path_for(self.current_file))
+
+    def _archive_todos(self, todos: list[dict], project: dict):
+        # Name erst jetzt nachschlagen: die Person kann seit dem Anzeigen umbenannt worden sein.
+        student_id = self.records.parents.get(project["id"])
+        self._pending_todo_archive.extend(
+            make_archive_records(
+                todos,
+                self.records.names.get(student_id, self.current_student or ""),
+                project.get("name", "Projekt"),
+                QDate.currentDate().toString(Qt.DateFormat.ISODate),
+                project.get("id"),
+                student_id,
+            )
+        )
 
-        weeklies = self._current_weeklies()
-        if weeklies is None or not (0 <= self.current_weekly_index < len(weeklies)):
-            self.current_weekly_index = None
-            self._set_weekly_editor_enabled(False)
-            self._clear_weekly_ui()
-            self.btn_delete_weekly.setEnabled(False)
-            self.act_delete_weekly.setEnabled(False)
-            self.refresh_todo_context_view()
-            self._sync_action_states()
+    def _flush_todo_archive(self):
+        # Erst nach dem Speichern: sonst stuenden die TODOs bei einem Fehler in beiden Dateien.
+        if not self._pending_todo_archive:
+            return
+        try:
+            self._todo_cold_store().append(self._pending_todo_archive)
+        except OSError as exc:
+            QMessageBox.critical(self, "Fehler beim Speichern", f"TODO-Archiv konnte nicht geschrieben werden:\n{exc}")
             return
+        self._pending_todo_archive = []
 
-        self._set_weekly_editor_enabled(True)
-        self.btn_delete_weekly.setEnabled(True)
-        self.act_delete_weekly.setEnabled(True)
-        self._load_weekly_into_ui(weeklies[self.current_weekly_index])
-        self.refresh_todo_context_view()
-        self._sync_action_states()
+    def open_todo_archive_dialog(self):
+        students = {name: entry["id"] for name, entry in self.data["students"].items()}
+        TodoArchiveDialog(self._todo_cold_store(), students, self.current_student, self).exec()
 
-    def _on_project_fields_changed(self):
-        if not self._write_project_from_ui():
+    def _move_todos_to_project(self, todo_ids: list):
+        model = self.project_todos_widget.model
+        current = self._current_project()
+        if model is None or current is None:
             return
-        self._update_project_progress_ui(self._current_project())
-        self.refresh_project_list(select_index=self.current_project_index)
-        self.refresh_todo_context_view()
-        self._on_data_changed()
 
-    def _on_project_todos_changed(self):
-        if not self._write_project_from_ui():
+        targets = []
+        for student_name in sorted(self.data["students"].keys(), key=str.lower):
+            for idx, project in enumerate(self.data["students"][student_name].get("projects", [])):
+                if project is not current:
+                    targets.append((f"{student_name} / {idx + 1}: {project.get('name', 'Projekt')}", project["id"]))
+        if not targets:
+            QMessageBox.information(self, "Hinweis", "Es gibt kein anderes Projekt als Ziel.")
             return
-        self.refresh_todo_context_view()
-        self._on_data_changed()
+
+        label, ok = QInputDialog.getItem(
+            self, "TODOs verschieben", f"{len(todo_ids)} TODO(s) verschieben nach:", [t[0] for t in targets], 0, False
+        )
+        if not ok:
+            return
+        target_id = dict(targets)[label]
+        target = self.records.get(target_id)
+
+        with model.transaction():
+            moved = model.take(todo_ids)
+            if not moved:
+                return
+            TodoModel(target.setdefault("project_todos", [])).extend(moved)
+            self._record_change("todos_changed", **self._event_location(target_id), todos=target["project_todos"])
+        self.project_todos_widget.set_model(model)
 
     def _on_weekly_fields_changed(self):
-        if not self._write_weekly_from_ui():
+        changes = self._write_weekly_from_ui()
+        if changes is None:
             return
+        if changes:
+            self._record_change("weekly_updated", **self._event_location(self.current_weekly_id), fields=changes)
         self._update_current_weekly_list_item()
         self.refresh_todo_context_view()
         self._on_data_changed()
@@ -1310,7 +4898,9 @@ class WeeklyManagerWindow(QMainWindow):
             self.refresh_student_list(select_name=name)
             return
 
-        self.data["students"][name] = {"projects": []}
+        entry = self.data["students"][name] = make_student_entry()
+        self.records.add_student(name, entry)
+        self._record_change("student_added", student=name, id=entry["id"])
         self.refresh_student_list(select_name=name)
         self._on_data_changed()
 
@@ -1331,15 +4921,50 @@ class WeeklyManagerWindow(QMainWindow):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        self.data["students"].pop(name, None)
+        entry = self.data["students"].pop(name, None)
+        if entry is None:
+            return
+        self.records.discard(entry["id"])
+        self._serializer.discard(entry)
+        self._record_change("student_removed", student=name, id=entry["id"])
         if self.current_student == name:
             self.current_student = None
-            self.current_project_index = None
-            self.current_weekly_index = None
+            self.current_project_id = None
+            self.current_weekly_id = None
 
         self.refresh_student_list()
         self._on_data_changed()
 
+    def rename_student(self):
+        old_name = self.current_student
+        if self._read_only or old_name not in self.data["students"]:
+            QMessageBox.information(self, "Hinweis", "Bitte zuerst eine Person auswaehlen.")
+            return
+
+        name, ok = QInputDialog.getText(self, "Studierende umbenennen", "Neuer Name:", text=old_name)
+        if not ok:
+            return
+        name = (name or "").strip()
+        if not name or name == old_name:
+            return
+        if name in self.data["students"]:
+            QMessageBox.information(self, "Hinweis", "Diese Person existiert bereits.")
+            return
+
+        # Schluessel in der Datei an gleicher Stelle tauschen; das dict und der Eintrag bleiben dieselben
+        # Objekte, daher bleiben Fragment-Cache und id-Index gueltig, nur der Name je id aendert sich.
+        self._commit_editors()
+        students = self.data["students"]
+        entries = list(students.items())
+        students.clear()
+        students.update((name if key == old_name else key, entry) for key, entry in entries)
+        entry = students[name]
+        self.records.names[entry["id"]] = name
+        self.current_student = name
+        self._record_change("student_renamed", student=name, old_name=old_name, id=entry["id"])
+        self.refresh_student_list()
+        self._on_data_changed()
+
     def add_project(self):
         if self.current_student is None:
             QMessageBox.information(self, "Hinweis", "Bitte zuerst eine studierende Person auswaehlen.")
@@ -1365,20 +4990,21 @@ class WeeklyManagerWindow(QMainWindow):
                 today.addDays(90).toString(Qt.DateFormat.ISODate),
             )
         )
+        self.records.add_project(self.data["students"][self.current_student]["id"], projects[-1], len(projects) - 1)
+        self._record_change(
+            "project_added", student=self.current_student, project_index=len(projects) - 1, project=projects[-1]
+        )
 
-        self.refresh_project_list(select_index=len(projects) - 1)
+        self.refresh_project_list(select_id=projects[-1]["id"])
         self._on_data_changed()
 
     def remove_project(self):
-        if self.current_student is None or self.current_project_index is None:
+        project = self._current_project()
+        if project is None:
             QMessageBox.information(self, "Hinweis", "Bitte zuerst ein Projekt auswaehlen.")
             return
 
-        projects = self._current_student_projects()
-        if projects is None or not (0 <= self.current_project_index < len(projects)):
-            return
-
-        project_name = projects[self.current_project_index].get("name", "Projekt")
+        project_name = project.get("name", "Projekt")
         reply = QMessageBox.question(
             self,
             "Projekt entfernen",
@@ -1389,14 +5015,22 @@ class WeeklyManagerWindow(QMainWindow):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        del projects[self.current_project_index]
-        self.current_project_index = None
-        self.current_weekly_index = None
+        location = self._event_location(project["id"])
+        self._current_student_projects().pop(location["project_index"])
+        self.records.discard(project["id"])
+        self._serializer.discard(project)
+        self._record_change("project_removed", **location, id=project["id"], name=project_name)
+        self.current_project_id = None
+        self.current_weekly_id = None
         self.refresh_project_list()
         self._on_data_changed()
 
     def add_weekly(self):
-        if self.current_student is None or self.current_project_index is None:
+        self._add_weekly(None)
+
+    def _add_weekly(self, template: dict | None):
+        project = self._current_project()
+        if project is None:
             QMessageBox.information(self, "Hinweis", "Bitte zuerst ein Projekt auswaehlen.")
             return
 
@@ -1408,23 +5042,61 @@ class WeeklyManagerWindow(QMainWindow):
         if weeklies:
             inherited_planned = str(weeklies[-1].get("next_planned", ""))
 
-        weeklies.append(make_empty_weekly(QDate.currentDate().toString(Qt.DateFormat.ISODate), inherited_planned))
-        new_index = len(weeklies) - 1
-
-        self.current_weekly_index = new_index
-        self.refresh_weekly_list(select_index=new_index)
+        weekly = make_empty_weekly(QDate.currentDate().toString(Qt.DateFormat.ISODate), inherited_planned)
+        if template:
+            # Uebernommenes next_planned hat Vorrang vor einer leeren Vorlage.
+            weekly["title"] = template.get("title", "")
+            weekly["planned"] = inherited_planned or template.get("planned", "")
+            weekly["done"] = template.get("done", "")
+            weekly["next_planned"] = template.get("next_planned", "")
+        weeklies.append(weekly)
+        self.records.add_weekly(project["id"], weekly, len(weeklies) - 1)
+        self._record_change("weekly_added", **self._event_location(weekly["id"]), weekly=weekly)
+
+        self.refresh_weekly_list(select_id=weekly["id"])
         self._on_data_changed()
 
-    def delete_weekly(self):
-        if self.current_weekly_index is None:
-            QMessageBox.information(self, "Hinweis", "Bitte zuerst ein Weekly auswaehlen.")
+    def add_weekly_from_template(self):
+        templates = load_weekly_templates(self.templates_file)
+        if not templates:
+            QMessageBox.information(
+                self, "Hinweis", "Noch keine Vorlagen vorhanden. Ein Weekly kann mit 'Als Vorlage' gespeichert werden."
+            )
             return
 
-        weeklies = self._current_weeklies()
-        if weeklies is None or not (0 <= self.current_weekly_index < len(weeklies)):
+        name, ok = QInputDialog.getItem(self, "Weekly aus Vorlage", "Vorlage:", [t["name"] for t in templates], 0, False)
+        if not ok:
+            return
+        self._add_weekly(next(t for t in templates if t["name"] == name))
+
+    def save_current_weekly_as_template(self):
+        weekly = self._current_weekly()
+        if weekly is None:
+            return
+
+        name, ok = QInputDialog.getText(self, "Als Vorlage speichern", "Name der Vorlage:", text=weekly.get("title", ""))
+        name = (name or "").strip()
+        if not ok or not name:
+            return
+
+        templates = [t for t in load_weekly_templates(self.templates_file) if t["name"] != name]
+        template = {"name": name}
+        template.update({key: str(weekly.get(key, "")) for key in WEEKLY_TEMPLATE_FIELDS})
+        templates.append(template)
+        try:
+            save_weekly_templates(self.templates_file, templates)
+        except OSError as exc:
+            QMessageBox.critical(self, "Fehler beim Speichern", f"Vorlage konnte nicht gespeichert werden:\n{exc}")
             return
+        self.statusBar().showMessage(f"Vorlage '{name}' gespeichert", 3000)
 
-        title = self._weekly_list_text(weeklies[self.current_weekly_index])
+    def delete_weekly(self):
+        weekly = self._current_weekly()
+        if weekly is None:
+            QMessageBox.information(self, "Hinweis", "Bitte zuerst ein Weekly auswaehlen.")
+            return
+
+        title = self._weekly_list_text(weekly)
         reply = QMessageBox.question(
             self,
             "Weekly entfernen",
@@ -1435,20 +5107,38 @@ class WeeklyManagerWindow(QMainWindow):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        del weeklies[self.current_weekly_index]
-        self.current_weekly_index = None
+        location = self._event_location(weekly["id"])
+        self._current_weeklies().pop(location["weekly_index"])
+        self.records.discard(weekly["id"])
+        self._serializer.discard(weekly)
+        self._record_change("weekly_removed", **location, id=weekly["id"])
+        self.current_weekly_id = None
         self.refresh_weekly_list()
         self._on_data_changed()
 
     # ------------------------------------------------------------------
     # File ops
     # ------------------------------------------------------------------
+    def eventFilter(self, obj, event):
+        if self._startup_pending and event.type() == QEvent.Type.Paint and obj is self.student_list.viewport():
+            obj.removeEventFilter(self)
+            STARTUP_PROFILE.mark("first_paint")
+            QTimer.singleShot(0, self._finish_startup)
+        return super().eventFilter(obj, event)
+
+    def _finish_startup(self):
+        if self._startup_pending:
+            self._startup_pending = False
+            self._load_or_create_default_file()
+        STARTUP_PROFILE.mark("load")
+        self.startup_finished.emit()
+
     def _load_or_create_default_file(self):
         if os.path.exists(self.current_file):
             self.load_json(self.current_file)
             return
 
-        self.data = {"version": 4, "students": {}}
+        self.data = {"version": DATA_VERSION, "students": {}}
         self._save_to_current_file()
         self.refresh_student_list()
         self.refresh_todo_context_view()
@@ -1458,53 +5148,680 @@ class WeeklyManagerWindow(QMainWindow):
             self,
             "JSON laden",
             self.default_open_dir,
-            "JSON Dateien (*.json);;Alle Dateien (*)",
+            "JSON Dateien (*.json *.json.gz *.json.xz);;Alle Dateien (*)",
+        )
+        if not file_path:
+            return
+        self.start_background_load(file_path)
+
+    def open_archive_dialog(self):
+        directory = QFileDialog.getExistingDirectory(self, "Semester-Ordner waehlen", self.default_open_dir)
+        if not directory:
+            return
+
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            semesters, errors = load_semester_archive(directory)
+        except Exception as exc:
+            QMessageBox.critical(self, "Fehler beim Laden", f"Archiv konnte nicht geladen werden:\n{exc}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        if not semesters:
+            QMessageBox.information(self, "Hinweis", "Im gewaehlten Ordner wurden keine ladbaren JSON-Dateien gefunden.")
+            return
+
+        ArchiveDialog(semesters, errors, self).exec()
+
+    def open_mapped_archive_dialog(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Archiv lesen",
+            self.default_open_dir,
+            "Archive (*.wkarc *.json *.json.gz *.json.xz);;Alle Dateien (*)",
         )
         if not file_path:
             return
-        self.load_json(file_path)
+
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            archive_path = file_path
+            if not file_path.lower().endswith(".wkarc"):
+                archive_path = archive_path_for(file_path)
+                if not mapped_archive_is_current(archive_path, file_path):
+                    data = load_validated_file(file_path)
+                    build_mapped_archive(data, archive_path, file_path)
+                    del data
+            archive = MappedArchive(archive_path)
+        except Exception as exc:
+            QMessageBox.critical(self, "Fehler beim Laden", f"Archiv konnte nicht geoeffnet werden:\n{exc}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        if not self._read_only:
+            self._commit_editors()
+            self._save_to_current_file()
+            self._flush_change_feed()
+        self._discard_pending_changes()
+        self._close_mapped_archive()
+        self._mapped_archive = archive
+        self._read_only = True
+        self.data = {"version": DATA_VERSION, "students": MappedStudents(archive)}
+        # Der id-Index wuerde alle Studierenden dekodieren; das Archiv bleibt ohne.
+        self.records.rebuild({})
+        self._switcher_index = None
+        self._text_index = None
+        self._predicate_index = None
+        self._sorted_student_names = None
+        self._data_version += 1
+        self._serializer.reset()
+        self._saved_digest = None
+        self.phrase_cache.reset(loader=self._iter_weekly_texts)
+        self._phrase_baseline = None
+
+        self.current_file = archive_path
+        self.current_student = None
+        self.current_project_id = None
+        self.current_weekly_id = None
+        self._apply_read_only_state()
+        self.refresh_student_list()
+        self.refresh_todo_context_view()
+        self._set_saved_state(saved=True)
+
+    def start_background_load(self, file_path: str):
+        if self._load_thread is not None:
+            QMessageBox.information(self, "Hinweis", "Es wird bereits eine Datei geladen.")
+            return
+
+        self._load_thread = QThread(self)
+        self._load_worker = LoadWorker(file_path)
+        self._load_worker.moveToThread(self._load_thread)
+        self._load_thread.started.connect(self._load_worker.run)
+        self._load_worker.progress.connect(self._on_load_progress)
+        self._load_worker.finished.connect(self._on_load_finished)
+        self._load_worker.failed.connect(self._on_load_failed)
+        self._load_worker.cancelled.connect(self._on_load_cancelled)
+
+        self.act_open.setEnabled(False)
+        self.load_progress.setRange(0, 0)
+        self.load_progress.setVisible(True)
+        self.btn_cancel_load.setEnabled(True)
+        self.btn_cancel_load.setVisible(True)
+        self.statusBar().showMessage(f"Lade {os.path.basename(file_path)} ...")
+        self._load_thread.start()
+
+    def cancel_background_load(self):
+        if self._load_worker is not None:
+            self._load_worker.cancel_event.set()
+            self.btn_cancel_load.setEnabled(False)
+            self.statusBar().showMessage("Laden wird abgebrochen ...")
+
+    def _on_load_progress(self, phase: str, done: int, total: int):
+        self.load_progress.setRange(0, max(1, total))
+        self.load_progress.setValue(done)
+        if phase == "bytes":
+            self.load_progress.setFormat(f"{done // 1024} / {total // 1024} KiB gelesen")
+        else:
+            self.load_progress.setFormat(f"{done} / {total} Studierende geprueft")
+
+    def _finish_background_load(self):
+        self._load_thread.quit()
+        self._load_thread.wait()
+        self._load_worker.deleteLater()
+        self._load_thread.deleteLater()
+        self._load_thread = None
+        self._load_worker = None
+        self.act_open.setEnabled(True)
+        self.load_progress.setVisible(False)
+        self.btn_cancel_load.setVisible(False)
+
+    def _on_load_finished(self, file_path: str, data: dict):
+        storage = self._load_worker.storage
+        self._finish_background_load()
+        # Laufende Eingaben der alten Datei sichern, dann in einem Schritt umschalten.
+        self._commit_editors()
+        self._save_to_current_file()
+        self._apply_loaded_data(file_path, data)
+        self._update_storage_label(storage or None)
+
+    def _on_load_failed(self, file_path: str, message: str):
+        self._finish_background_load()
+        QMessageBox.critical(self, "Fehler beim Laden", f"Datei konnte nicht geladen werden:\n{message}")
+        self._set_saved_state(saved=not self._dirty)
+
+    def _on_load_cancelled(self):
+        self._finish_background_load()
+        self._set_saved_state(saved=not self._dirty)
+        self.statusBar().showMessage("Laden abgebrochen")
 
     def load_json(self, file_path: str):
+        storage = {}
         try:
-            with open(file_path, "r", encoding="utf-8") as handle:
-                raw = json.load(handle)
-            self.data = validate_data(raw)
+            data = load_validated_file(file_path, report=storage)
         except Exception as exc:
             QMessageBox.critical(self, "Fehler beim Laden", f"Datei konnte nicht geladen werden:\n{exc}")
             self._set_saved_state(saved=False)
             return
-
+        self._apply_loaded_data(file_path, data)
+        self._update_storage_label(storage or None)
+
+    def _selected_record_id(self) -> str | None:
+        weekly = self._current_weekly()
+        record = weekly if weekly is not None else self._current_project() or self._current_student_entry()
+        return record["id"] if record is not None else None
+
+    def _apply_loaded_data(self, file_path: str, data: dict):
+        # Auswahl ueber die id wiederherstellen (z. B. nach dem Zurueckspielen einer Sicherung).
+        selected = self._selected_record_id() if file_path == self.current_file else None
+        self._flush_change_feed()
+        self._discard_pending_changes()
+        self._pending_todo_archive = []
+        self.data = data
+        self.records.rebuild(data["students"])
+        self._startup_pending = False
+        self._switcher_index = None
+        self._text_index = None
+        self._predicate_index = None
+        self._sorted_student_names = None
+        self._data_version += 1
+        self._serializer.reset()
+        self._saved_digest = None
+        self.phrase_cache.reset(loader=self._iter_weekly_texts)
+        self._phrase_baseline = None
+        if self._read_only:
+            self._close_mapped_archive()
+            self._apply_read_only_state()
+        self._todo_feed_state = {
+            project["id"]: todo_feed_state(project["project_todos"])
+            for entry in data["students"].values()
+            for project in entry["projects"]
+        }
+        if file_path != self.current_file:
+            self._storage_stats = {}
         self.current_file = file_path
-        self.current_student = None
-        self.current_project_index = None
-        self.current_weekly_index = None
+        lineage = self.records.lineage(selected) if selected is not None else None
+        self.current_student, self.current_project_id, self.current_weekly_id = lineage or (None, None, None)
         self.refresh_student_list()
         self.refresh_todo_context_view()
         self._set_saved_state(saved=True)
 
     def _save_to_current_file(self) -> bool:
+        # Vor dem verzoegerten Laden nie die (noch leeren) Daten schreiben.
+        if self._read_only or self._startup_pending:
+            return False
         try:
-            with open(self.current_file, "w", encoding="utf-8") as handle:
-                json.dump(self.data, handle, ensure_ascii=False, indent=2)
+            chunks, digest = self._serializer.encode(self.data)
+            report = None
+            if self._saved_digest != (self.current_file, digest):
+                report = write_storage_chunks(self.current_file, chunks)
         except Exception as exc:
             QMessageBox.critical(self, "Fehler beim Speichern", f"Datei konnte nicht gespeichert werden:\n{exc}")
             self._set_saved_state(saved=False)
             return False
 
+        self._saved_digest = (self.current_file, digest)
+        self._unhandled_changes = False
         self._set_saved_state(saved=True)
+        self._flush_todo_archive()
+        if report is not None:
+            self._update_storage_label(report)
+        return True
+
+    def convert_storage_format(self, codec: str):
+        # Schreibt die Daten unter dem Namen mit der Endung des Formats und arbeitet dort weiter;
+        # die bisherige Datei bleibt unveraendert liegen.
+        if self._read_only or self._startup_pending or codec == storage_codec_for(self.current_file):
+            self._update_storage_label()
+            return
+        target = storage_path_for(self.current_file, codec)
+        if os.path.exists(target):
+            answer = QMessageBox.question(
+                self, "Datei ersetzen", f"{os.path.basename(target)} existiert bereits. Ueberschreiben?"
+            )
+            if answer != QMessageBox.StandardButton.Yes:
+                self._update_storage_label()
+                return
+        self._commit_editors()
+        previous = self.current_file
+        self.current_file = target
+        self._storage_stats = {}
+        if not self._save_to_current_file():
+            self.current_file = previous
+            self._update_storage_label()
+            return
+        self._flush_change_feed()
+        self._update_storage_label()
+        self.statusBar().showMessage(f"Gespeichert als {os.path.basename(target)}", 5000)
+
+    # ------------------------------------------------------------------
+    # Schnellwechsler
+    # ------------------------------------------------------------------
+    def open_quick_switcher(self):
+        if self._read_only:
+            return
+        if self._switcher_index is None:
+            self._switcher_index = SwitcherIndex()
+            self._switcher_index.rebuild(self.data["students"])
+        dialog = QuickSwitcherDialog(self._switcher_index, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted or dialog.selected_path() is None:
+            return
+        self.select_path(*dialog.selected_path())
+
+    def select_path(self, student_name: str, project_index: int | None = None, weekly_index: int | None = None):
+        # Positionen (Schnellwechsler) einmal in ids uebersetzen.
+        entry = self.data["students"].get(student_name)
+        if entry is None:
+            return
+        project = entry["projects"][project_index] if project_index is not None else None
+        weekly = project["weeklies"][weekly_index] if project is not None and weekly_index is not None else None
+        self.select_ids(student_name, project and project["id"], weekly and weekly["id"])
+
+    def select_ids(self, student_name: str, project_id: str | None = None, weekly_id: str | None = None):
+        # Auswahl direkt setzen; die Listen werden im naechsten Render-Durchlauf
+        # genau einmal aufgebaut, ohne Zwischenstufen ueber die Change-Handler.
+        if student_name not in self.data["students"]:
+            return
+        self._flush_change_feed()
+        if student_name != self.current_student:
+            self.current_student = student_name
+            item = self._student_items.get(student_name)
+            self.student_list.blockSignals(True)
+            if item is not None:
+                self.student_list.setCurrentItem(item)
+            self.student_list.blockSignals(False)
+            if item is None:
+                self._invalidate("students")
+        self.current_project_id = project_id
+        self.current_weekly_id = weekly_id
+        self._invalidate(*self.STUDENT_VIEWS)
+
+    def select_record(self, record_id: str) -> bool:
+        lineage = self.records.lineage(record_id)
+        if lineage is not None:
+            self.select_ids(*lineage)
+        return lineage is not None
+
+    # ------------------------------------------------------------------
+    # Suchen & Ersetzen
+    # ------------------------------------------------------------------
+    def open_bulk_replace_dialog(self):
+        if self._read_only:
+            return
+        self._commit_editors()
+        scopes = [("Alle Daten", "all")]
+        if self.current_student is not None:
+            scopes.append((f"Studierende: {self.current_student}", "student"))
+        project = self._current_project()
+        if project is not None:
+            scopes.append((f"Projekt: {project.get('name', 'Projekt')}", "project"))
+
+        dialog = BulkReplaceDialog(self._search_replacements, scopes, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        matches = dialog.selected_matches()
+        if matches and not self._apply_bulk_replace(matches):
+            QMessageBox.information(
+                self, "Hinweis", "Die Daten haben sich seit der Vorschau geaendert. Bitte die Vorschau neu erstellen."
+            )
+
+    def _search_replacements(
+        self, pattern: str, replacement: str, regex: bool, case_sensitive: bool, scope: str, fields: tuple
+    ) -> list[dict]:
+        if self._text_index is None:
+            self._text_index = TextIndex(self.data["students"])
+        return find_replacements(
+            self._text_index,
+            pattern,
+            replacement,
+            regex,
+            case_sensitive,
+            student=self.current_student if scope in ("student", "project") else None,
+            project=self._current_project() if scope == "project" else None,
+            fields=fields,
+        )
+
+    def _apply_bulk_replace(self, matches: list[dict]) -> bool:
+        # Eine Transaktion: erst alles pruefen, dann alles schreiben; danach ein
+        # Eintrag im Aenderungsprotokoll, ein Speichern und ein Render-Durchlauf.
+        for match in matches:
+            project, record = match["project"], match["record"]
+            if self.records.get(project["id"]) is not project or record.get(match["field"]) != match["before"]:
+                return False
+            if match["field"] == "text":
+                present = any(todo is record for todo in project.get("project_todos", []))
+            else:
+                present = self.records.get(record["id"]) is record
+            if not present:
+                return False
+
+        weekly_changes = {}
+        todo_projects = {}
+        for match in matches:
+            match["record"][match["field"]] = match["after"]
+            if match["field"] == "text":
+                todo_projects[match["project"]["id"]] = match["project"]
+            else:
+                weekly_changes.setdefault(match["record"]["id"], {})[match["field"]] = match["after"]
+
+        for weekly_id, changes in weekly_changes.items():
+            self._record_change("weekly_updated", **self._event_location(weekly_id), fields=changes)
+        for project_id, project in todo_projects.items():
+            self._record_change("todos_changed", **self._event_location(project_id), todos=project["project_todos"])
+
+        self.refresh_student_list()
+        self._on_data_changed()
+        self.statusBar().showMessage(f"{sum(match['count'] for match in matches)} Treffer ersetzt", 3000)
         return True
 
+    def open_analytics_dialog(self):
+        if self._read_only:
+            return
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            report = self.analytics.report(self.data, self._data_version)
+        finally:
+            QApplication.restoreOverrideCursor()
+        AnalyticsDialog(report, self).exec()
+
+    # ------------------------------------------------------------------
+    # Markdown-Vorschau
+    # ------------------------------------------------------------------
+    def _set_markdown_preview(self, enabled: bool):
+        if enabled:
+            self._commit_editors()
+        for field, edit in zip(MARKDOWN_FIELDS, (self.txt_planned, self.txt_done, self.txt_next)):
+            edit.setVisible(not enabled)
+            self.markdown_views[field].setVisible(enabled)
+        self._update_markdown_preview()
+
+    def _update_markdown_preview(self):
+        # Aktuelles Weekly aus dem Cache zeigen; Fehlendes rendert der Worker, zuerst das
+        # aktuelle Weekly, dann die Nachbarn nach Abstand, damit das Blaettern sofort zeigt.
+        if not self.btn_markdown_preview.isChecked():
+            return
+        if self._current_weekly() is None:
+            for browser in self.markdown_views.values():
+                browser.clear()
+            return
+        weeklies = self._current_weeklies()
+        index = self.records.positions[self.current_weekly_id]
+
+        jobs = []
+        order = sorted(range(len(weeklies)), key=lambda row: abs(row - index))
+        for row in order:
+            weekly = weeklies[row]
+            for field in MARKDOWN_FIELDS:
+                text = str(weekly.get(field, ""))
+                digest = MarkdownCache.digest(text)
+                markup = self._markdown_cache.get(weekly["id"], field, digest)
+                if row == index:
+                    # Bis das Ergebnis da ist, den Rohtext zeigen statt eines leeren Felds.
+                    if markup is None:
+                        self.markdown_views[field].setPlainText(text)
+                    else:
+                        self.markdown_views[field].setHtml(markup)
+                if markup is None and (weekly["id"], field, digest) not in self._markdown_pending:
+                    self._markdown_pending.add((weekly["id"], field, digest))
+                    jobs.append((weekly["id"], field, digest, text))
+        if jobs:
+            self._ensure_markdown_worker()
+            self.markdown_requested.emit(jobs)
+
+    def _ensure_markdown_worker(self):
+        if self._markdown_thread is not None:
+            return
+        self._markdown_thread = QThread(self)
+        self._markdown_worker = MarkdownWorker()
+        self._markdown_worker.moveToThread(self._markdown_thread)
+        self.markdown_requested.connect(self._markdown_worker.render)
+        self._markdown_worker.rendered.connect(self._on_markdown_rendered)
+        self._markdown_thread.finished.connect(self._markdown_worker.deleteLater)
+        self._markdown_thread.start()
+
+    def _on_markdown_rendered(self, weekly_id: str, field: str, digest: bytes, markup: str):
+        self._markdown_pending.discard((weekly_id, field, digest))
+        self._markdown_cache.put(weekly_id, field, digest, markup)
+        weekly = self._current_weekly()
+        if (
+            self.btn_markdown_preview.isChecked()
+            and weekly is not None
+            and weekly["id"] == weekly_id
+            and MarkdownCache.digest(str(weekly.get(field, ""))) == digest
+        ):
+            self.markdown_views[field].setHtml(markup)
+
+    def _stop_markdown_worker(self):
+        if self._markdown_thread is not None:
+            self._markdown_thread.quit()
+            self._markdown_thread.wait()
+            self._markdown_thread = None
+            self._markdown_worker = None
+
+    # ------------------------------------------------------------------
+    # Anhaenge
+    # ------------------------------------------------------------------
+    def _current_attachment_store(self) -> AttachmentStore:
+        directory = attachments_dir_for(self.current_file)
+        if self._attachment_store is None or self._attachment_store.directory != directory:
+            self._attachment_store = AttachmentStore(directory)
+        return self._attachment_store
+
+    def _render_attachments(self):
+        self.attachment_list.clear()
+        weekly = self._current_weekly()
+        if weekly is None:
+            return
+        store = self._current_attachment_store()
+        placeholder = self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon)
+        for row, attachment in enumerate(weekly.get("attachments") or []):
+            item = QListWidgetItem(attachment["name"])
+            item.setData(Qt.ItemDataRole.UserRole, row)
+            item.setData(Qt.ItemDataRole.UserRole + 1, attachment["blob"])
+            item.setToolTip(f"{attachment['name']} ({max(1, attachment['size'] // 1024)} KiB)")
+            thumb_path = self._thumbnails.request(store, attachment)
+            item.setIcon(QIcon(thumb_path) if thumb_path else placeholder)
+            self.attachment_list.addItem(item)
+
+    def _on_thumbnail_ready(self, blob: str, thumb_path: str):
+        if not thumb_path:
+            return
+        for row in range(self.attachment_list.count()):
+            item = self.attachment_list.item(row)
+            if item.data(Qt.ItemDataRole.UserRole + 1) == blob:
+                item.setIcon(QIcon(thumb_path))
+
+    def _record_attachments_changed(self, weekly: dict):
+        attachments = list(weekly.get("attachments", []))
+        self._record_change("weekly_updated", **self._event_location(weekly["id"]), fields={"attachments": attachments})
+        self._on_data_changed()
+        self._render_attachments()
+
+    def add_attachments(self):
+        weekly = self._current_weekly()
+        if weekly is None or self._read_only:
+            return
+        file_paths, _ = QFileDialog.getOpenFileNames(self, "Anhaenge hinzufuegen", self.default_open_dir)
+        if not file_paths:
+            return
+
+        self._commit_editors()
+        store = self._current_attachment_store()
+        added = []
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            for file_path in file_paths:
+                added.append(store.add(file_path))
+        except OSError as exc:
+            QMessageBox.critical(self, "Fehler beim Anhaengen", f"Datei konnte nicht abgelegt werden:\n{exc}")
+        finally:
+            QApplication.restoreOverrideCursor()
+        if added:
+            weekly.setdefault("attachments", []).extend(added)
+            self._record_attachments_changed(weekly)
+
+    def remove_attachment(self):
+        # Entfernt nur die Referenz; der Blob bleibt fuer andere Weeklies und Sicherungen liegen.
+        weekly = self._current_weekly()
+        item = self.attachment_list.currentItem()
+        if weekly is None or item is None or self._read_only:
+            return
+        attachments = weekly.get("attachments") or []
+        row = item.data(Qt.ItemDataRole.UserRole)
+        if not (0 <= row < len(attachments)):
+            return
+        self._commit_editors()
+        attachments.pop(row)
+        if not attachments:
+            weekly.pop("attachments", None)
+        self._record_attachments_changed(weekly)
+
+    def open_attachment(self, item: QListWidgetItem):
+        weekly = self._current_weekly()
+        attachments = (weekly.get("attachments") or []) if weekly is not None else []
+        row = item.data(Qt.ItemDataRole.UserRole)
+        if not (0 <= row < len(attachments)):
+            return
+        store = self._current_attachment_store()
+        blob_path = store.blob_path(attachments[row]["blob"])
+        if not os.path.exists(blob_path):
+            QMessageBox.warning(self, "Hinweis", f"Der Anhang fehlt in der Ablage:\n{blob_path}")
+            return
+        try:
+            open_path = store.open_path(attachments[row])
+        except OSError as exc:
+            QMessageBox.critical(self, "Fehler beim Oeffnen", f"Anhang konnte nicht bereitgestellt werden:\n{exc}")
+            return
+        QDesktopServices.openUrl(QUrl.fromLocalFile(open_path))
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+    def _set_api_enabled(self, enabled: bool):
+        if not enabled:
+            if self._api_server is not None:
+                self._api_server.stop()
+                self._api_server = None
+                self.statusBar().showMessage("API gestoppt", 3000)
+            return
+        if self._api_server is not None:
+            return
+        # Version wird im HTTP-Thread gelesen (nur ein int), Daten nur auf dem Hauptthread.
+        service = ApiService(lambda: self._data_version, lambda: self.data, self._api_bridge.run)
+        try:
+            self._api_server = ApiServer(service, port=API_DEFAULT_PORT)
+        except OSError as exc:
+            QMessageBox.critical(
+                self, "Fehler beim Starten der API", f"Port {API_DEFAULT_PORT} nicht verfuegbar:\n{exc}"
+            )
+            self.act_api.blockSignals(True)
+            self.act_api.setChecked(False)
+            self.act_api.blockSignals(False)
+            return
+        self._api_server.start()
+        self.statusBar().showMessage(f"API unter {self._api_server.url}", 5000)
+
+    # ------------------------------------------------------------------
+    # Backups
+    # ------------------------------------------------------------------
+    def _current_backup_store(self) -> BackupStore:
+        directory = backup_dir_for(self.current_file)
+        if self._backup_store is None or self._backup_store.directory != directory:
+            self._backup_store = BackupStore(directory, self.backup_policy)
+        return self._backup_store
+
+    def _wait_for_backup(self):
+        if self._backup_thread is not None:
+            self._backup_thread.join()
+            self._backup_thread = None
+
+    def _backup_in_thread(self, store: BackupStore, content: bytes):
+        try:
+            store.snapshot(content)
+        except (OSError, lzma.LZMAError, zlib.error) as exc:
+            self._backup_error = str(exc)
+
+    def _run_scheduled_backup(self):
+        if self._backup_error:
+            self.statusBar().showMessage(f"Sicherung fehlgeschlagen: {self._backup_error}", 5000)
+            self._backup_error = None
+        if self._read_only or (self._backup_thread is not None and self._backup_thread.is_alive()):
+            return
+        # Inhalt im UI-Thread aus dem Fragment-Cache holen, Delta und Kompression im Hintergrund.
+        self._commit_editors()
+        content = self._serializer.dumps(self.data)
+        self._backup_thread = threading.Thread(
+            target=self._backup_in_thread, args=(self._current_backup_store(), content), daemon=True
+        )
+        self._backup_thread.start()
+
+    def open_backup_dialog(self):
+        if self._read_only:
+            QMessageBox.information(self, "Hinweis", "Im Nur-Lese-Modus gibt es keine Sicherungen.")
+            return
+        self._wait_for_backup()
+        store = self._current_backup_store()
+        if not store.versions:
+            QMessageBox.information(self, "Hinweis", "Fuer diese Datei gibt es noch keine Sicherungen.")
+            return
+
+        dialog = BackupDialog(store, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted or dialog.selected_seq() is None:
+            return
+        seq = dialog.selected_seq()
+
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            self._commit_editors()
+            store.snapshot(self._serializer.dumps(self.data))
+            data = validate_data(json.loads(store.restore(seq)))
+        except (OSError, ValueError, KeyError, lzma.LZMAError, zlib.error) as exc:
+            QMessageBox.critical(self, "Fehler beim Wiederherstellen", f"Sicherung konnte nicht gelesen werden:\n{exc}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        self._apply_loaded_data(self.current_file, data)
+        self._record_change("restored", backup=seq)
+        self._on_data_changed()
+        self.statusBar().showMessage("Sicherung wiederhergestellt", 3000)
+
     def closeEvent(self, event):
-        self._write_project_from_ui()
-        self._write_weekly_from_ui()
-        self._save_to_current_file()
+        if self._load_worker is not None:
+            self._load_worker.cancel_event.set()
+            self._load_thread.quit()
+            self._load_thread.wait()
+        self._commit_editors()
+        if self._save_to_current_file():
+            self._flush_change_feed()
+            write_snapshot(self.current_file, self.data)
+            self._wait_for_backup()
+            self._backup_in_thread(self._current_backup_store(), self._serializer.dumps(self.data))
+        self._set_api_enabled(False)
+        self._stop_markdown_worker()
+        self._thumbnails.shutdown()
+        self._close_mapped_archive()
         event.accept()
 
 
 def main():
-    app = QApplication(sys.argv)
+    # Aufruf: python weekly_manager_pyqt.py [--startup-report] [--api] [datei.json]
+    args = sys.argv[1:]
+    startup_report = "--startup-report" in args
+    paths = [arg for arg in args if not arg.startswith("--")]
+
+    app = QApplication(sys.argv[:1])
     app.setApplicationName("Studierenden-Weeklies-Manager")
-    window = WeeklyManagerWindow()
+    window = WeeklyManagerWindow(os.path.abspath(paths[0]) if paths else None)
+    if startup_report:
+        def report():
+            print(json.dumps(STARTUP_PROFILE.report(), indent=2))
+            app.quit()
+
+        window.startup_finished.connect(report)
+    if "--api" in args:
+        window.act_api.setChecked(True)
     window.show()
     sys.exit(app.exec())
 